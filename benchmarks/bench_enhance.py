@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Compare FileConverter._enhance_image_quality with the original three-pass
+ImageEnhance chain on a synthetic 20-megapixel scan.
+
+Usage: python benchmarks/bench_enhance.py [--megapixels 20] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PIL import Image, ImageChops, ImageDraw, ImageEnhance, ImageStat
+
+from file_converter import FileConverter
+
+# Largest per-pixel difference accepted between the two implementations
+MAX_ABS_DIFF = 4
+MAX_MEAN_DIFF = 0.5
+
+
+def legacy_enhance(img):
+    """The original Sharpness -> Contrast -> Brightness chain"""
+    img = ImageEnhance.Sharpness(img).enhance(1.1)
+    img = ImageEnhance.Contrast(img).enhance(1.05)
+    img = ImageEnhance.Brightness(img).enhance(1.02)
+    return img
+
+
+def make_scan(megapixels, mode='RGB'):
+    """Paper-like page: noisy light background with dark text-like strokes"""
+    width = int((megapixels * 1_000_000 * 4 / 3) ** 0.5)
+    height = int(megapixels * 1_000_000 / width)
+
+    noise = Image.effect_noise((width, height), 12).point(lambda v: min(255, v + 100))
+    draw = ImageDraw.Draw(noise)
+    for y in range(80, height - 80, 60):
+        for x in range(80, width - 400, 420):
+            draw.rectangle((x, y, x + 360, y + 18), fill=40)
+
+    if mode == 'RGB':
+        tint = Image.linear_gradient('L').resize((width, height))
+        return Image.merge('RGB', (noise, noise, ImageChops.add(noise, tint, scale=2.0)))
+    return noise
+
+
+def timed(fn, img, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(img)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--megapixels', type=float, default=20)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    converter = FileConverter()
+    failed = False
+
+    for mode in ('RGB', 'L'):
+        img = make_scan(args.megapixels, mode)
+        img.load()
+
+        legacy_time, legacy = timed(legacy_enhance, img, args.repeat)
+        fused_time, fused = timed(converter._enhance_image_quality, img, args.repeat)
+
+        diff = ImageChops.difference(legacy, fused)
+        max_diff = max(high for _, high in diff.getextrema()) if mode == 'RGB' else diff.getextrema()[1]
+        mean_diff = max(ImageStat.Stat(diff).mean)
+        ok = max_diff <= MAX_ABS_DIFF and mean_diff <= MAX_MEAN_DIFF
+        failed |= not ok
+
+        print(f"{mode} {img.width}x{img.height} ({img.width * img.height / 1e6:.1f} MP)")
+        print(f"  legacy chain: {legacy_time:.3f}s")
+        print(f"  fused kernel: {fused_time:.3f}s  ({legacy_time / fused_time:.2f}x)")
+        print(f"  difference:   max {max_diff}, mean {mean_diff:.3f}  {'OK' if ok else 'OUT OF TOLERANCE'}")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Compare pdf_to_word's single PDF open with the original pypdf-then-pdf2docx
+double parse on a large, object-heavy PDF.
+
+The test file has many pages, each carrying a long list of link
+annotations, so it holds hundreds of thousands of small indirect objects:
+the shape where an extra full cross-reference parse costs seconds.
+
+Usage: python benchmarks/bench_pdf_open.py [--pages 2000] [--links 100] [--repeat 3]
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from file_converter import backends
+
+
+def make_object_heavy_pdf(path, pages, links):
+    """Write a valid PDF with pages * (links + 2) + 2 objects using a classic xref table"""
+    offsets = {}
+    kids = []
+    next_id = 3
+
+    with open(path, 'wb') as f:
+        def write_object(object_id, body):
+            offsets[object_id] = f.tell()
+            f.write(b"%d 0 obj\n%s\nendobj\n" % (object_id, body))
+
+        f.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        for page in range(pages):
+            page_id, contents_id = next_id, next_id + 1
+            link_ids = range(next_id + 2, next_id + 2 + links)
+            next_id += 2 + links
+
+            text = b"BT /F1 12 Tf 72 720 Td (Page %d) Tj ET" % (page + 1)
+            write_object(contents_id, b"<< /Length %d >>\nstream\n%s\nendstream" % (len(text), text))
+            for i, link_id in enumerate(link_ids):
+                y = 700 - (i % 60) * 10
+                write_object(link_id, (
+                    b"<< /Type /Annot /Subtype /Link /Rect [72 %d 200 %d] /Border [0 0 0] "
+                    b"/A << /S /URI /URI (https://example.com/%d/%d) >> >>" % (y, y + 8, page, i)
+                ))
+            annots = b" ".join(b"%d 0 R" % link_id for link_id in link_ids)
+            write_object(page_id, (
+                b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+                b"/Resources << /Font << /F1 << /Type /Font /Subtype /Type1 /BaseFont /Helvetica >> >> >> "
+                b"/Annots [%s] >>" % (contents_id, annots)
+            ))
+            kids.append(page_id)
+
+        write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        write_object(2, b"<< /Type /Pages /Count %d /Kids [%s] >>" % (
+            len(kids), b" ".join(b"%d 0 R" % kid for kid in kids)))
+
+        xref_offset = f.tell()
+        f.write(b"xref\n0 %d\n0000000000 65535 f \n" % next_id)
+        for object_id in range(1, next_id):
+            f.write(b"%010d 00000 n \n" % offsets[object_id])
+        f.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (next_id, xref_offset))
+    return next_id - 1
+
+
+def legacy_open(path):
+    """The original sequence: pypdf for the encryption check, then pdf2docx"""
+    reader = backends.get('pypdf').PdfReader(str(path))
+    if reader.is_encrypted:
+        raise Exception("encrypted")
+    cv = backends.get('pdf2docx').Converter(str(path))
+    try:
+        return len(cv.fitz_doc)
+    finally:
+        cv.close()
+
+
+def single_open(path):
+    """What pdf_to_word does now: one PyMuPDF parse shared by both steps"""
+    cv = backends.get('pdf2docx').Converter(str(path))
+    try:
+        if cv.fitz_doc.needs_pass:
+            raise Exception("encrypted")
+        return len(cv.fitz_doc)
+    finally:
+        cv.close()
+
+
+def timed(fn, path, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def pypdf_import_time():
+    """Import cost the legacy path pays on first use, measured in a fresh interpreter"""
+    code = "import time; t = time.perf_counter(); import pypdf; print(time.perf_counter() - t)"
+    return float(subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', type=int, default=2000)
+    parser.add_argument('--links', type=int, default=100, help="Link annotations per page")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    # Both paths import their backends outside the timed region
+    backends.get('pypdf')
+    backends.get('pdf2docx')
+
+    with tempfile.TemporaryDirectory(prefix='converter-bench-') as work_dir:
+        path = Path(work_dir) / 'object_heavy.pdf'
+        objects = make_object_heavy_pdf(path, args.pages, args.links)
+        print(f"{args.pages} pages, {objects} objects, {path.stat().st_size / 1024 / 1024:.1f} MB")
+
+        legacy_time, legacy_pages = timed(legacy_open, path, args.repeat)
+        single_time, single_pages = timed(single_open, path, args.repeat)
+
+    if legacy_pages != single_pages:
+        print(f"page counts differ: {legacy_pages} vs {single_pages}")
+        return 1
+
+    print(f"  pypdf + pdf2docx open: {legacy_time:.3f}s")
+    print(f"  single open:           {single_time:.3f}s  ({legacy_time / single_time:.2f}x)")
+    print(f"  pypdf import avoided:  {pypdf_import_time():.3f}s on first conversion")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
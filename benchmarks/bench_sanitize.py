@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Compare text_sanitizer.sanitize_text with the original replace-chain
+sanitizer on real slide text.
+
+The text is every paragraph of a presentation, the corpus deck by default,
+extracted the way ppt_to_word does. Both functions must agree on every
+string.
+
+Usage: python benchmarks/bench_sanitize.py [--pptx deck.pptx] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import build_corpus
+from file_converter import _shape_paragraph_texts, backends
+from text_sanitizer import sanitize_text
+
+# Strings that exercise the slow paths: controls, surrogates, Unicode whitespace
+EDGE_CASES = [
+    "Tab\tseparated\tvalues", "Line\x0bbreak from a text box", "  padded  ", "Null\x00byte",
+    "Résumé — naïve café", "Emoji 😀 and a lone surrogate \ud800", "Non\xa0breaking spaces",
+]
+
+
+def legacy_sanitize(text):
+    """The original sanitizer: a UTF-8 round trip and one replace() per control character"""
+    if not text:
+        return ""
+    text = text.replace('\x00', '')
+    text = text.encode('utf-8', errors='ignore').decode('utf-8')
+    for code in list(range(0x01, 0x09)) + [0x0b, 0x0c] + list(range(0x0e, 0x20)):
+        text = text.replace(chr(code), '')
+    return ' '.join(text.split())
+
+
+def slide_texts(pptx_path):
+    prs = backends.get('pptx').Presentation(str(pptx_path))
+    return [
+        text.strip()
+        for slide in prs.slides
+        for shape in slide.shapes
+        for text in _shape_paragraph_texts(shape)
+    ]
+
+
+def timed(fn, texts, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            fn(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pptx', help="Presentation to take text from (default: the medium corpus deck)")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.pptx:
+        pptx_path = args.pptx
+    else:
+        manifest = build_corpus(Path(__file__).resolve().parent / 'corpus', 'medium')
+        pptx_path = manifest['cases']['ppt_to_word']['files'][0]
+
+    texts = slide_texts(pptx_path)
+    mismatches = [text for text in texts + EDGE_CASES if legacy_sanitize(text) != sanitize_text(text)]
+    if mismatches:
+        print(f"outputs differ for {len(mismatches)} strings, e.g. {mismatches[0]!r}")
+        return 1
+
+    edge_cases = EDGE_CASES * (len(texts) // len(EDGE_CASES) + 1)
+    print(f"{len(texts)} paragraphs from {Path(pptx_path).name}")
+    for label, sample in (("slide text", texts), ("edge cases", edge_cases[:len(texts)])):
+        legacy_time = timed(legacy_sanitize, sample, args.repeat)
+        table_time = timed(sanitize_text, sample, args.repeat)
+        per_string = 1e9 / len(sample)
+        print(f"  {label}:")
+        print(f"    replace chain: {legacy_time * per_string:7.0f} ns/string")
+        print(f"    table driven:  {table_time * per_string:7.0f} ns/string  ({legacy_time / table_time:.1f}x)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
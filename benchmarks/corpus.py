@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Generate a reproducible corpus of synthetic documents for the benchmarks.
+
+Every file is built from a fixed random seed with python-docx, python-pptx,
+reportlab and Pillow, so the same profile always yields the same content and
+no network access or sample files are needed.
+
+Usage: python benchmarks/corpus.py [--profile small|medium|large] [--out DIR]
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+# Bump when the generated content changes so stale corpora are rebuilt
+CORPUS_VERSION = 1
+
+# Size and complexity knobs per profile
+PROFILES = {
+    'small': {
+        'docx_paragraphs': 150, 'docx_tables': 2,
+        'pptx_slides': 40,
+        'pdf_pages': 8,
+        'image_megapixels': 4, 'multi_images': 6,
+    },
+    'medium': {
+        'docx_paragraphs': 1200, 'docx_tables': 10,
+        'pptx_slides': 300,
+        'pdf_pages': 40,
+        'image_megapixels': 12, 'multi_images': 20,
+    },
+    'large': {
+        'docx_paragraphs': 6000, 'docx_tables': 40,
+        'pptx_slides': 2000,
+        'pdf_pages': 150,
+        'image_megapixels': 24, 'multi_images': 60,
+    },
+}
+
+WORDS = (
+    "conversion document layout paragraph section quarterly revenue analysis market "
+    "customer strategy performance report summary figure table chapter result method "
+    "system design review budget forecast growth product service quality team project"
+).split()
+
+
+def sentence(rng, min_words=6, max_words=18):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    return " ".join(words).capitalize() + "."
+
+
+def paragraph(rng, sentences=(2, 6)):
+    return " ".join(sentence(rng) for _ in range(rng.randint(*sentences)))
+
+
+def make_docx(path, rng, paragraphs, tables):
+    """Word document with headings, body text, bullet lists and tables"""
+    import docx
+
+    doc = docx.Document()
+    doc.core_properties.title = "Synthetic benchmark document"
+    doc.add_heading("Synthetic benchmark document", 0)
+
+    table_every = max(1, paragraphs // max(tables, 1))
+    for i in range(paragraphs):
+        if i % 25 == 0:
+            doc.add_heading(sentence(rng, 2, 5).rstrip('.'), level=1 if i % 100 == 0 else 2)
+        if i % 9 == 0:
+            doc.add_paragraph(sentence(rng), style='List Bullet')
+        else:
+            doc.add_paragraph(paragraph(rng))
+        if tables and i % table_every == table_every - 1:
+            table = doc.add_table(rows=6, cols=4)
+            for row in table.rows:
+                for cell in row.cells:
+                    cell.text = f"{rng.choice(WORDS)} {rng.randint(0, 9999)}"
+    doc.save(str(path))
+
+
+def make_pptx(path, rng, slides):
+    """Presentation mixing title/content, grouped shapes and tables"""
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    prs = Presentation()
+    for i in range(slides):
+        if i % 10 == 9:
+            slide = prs.slides.add_slide(prs.slide_layouts[5])
+            slide.shapes.title.text = f"Table slide {i + 1}"
+            table = slide.shapes.add_table(4, 3, Inches(1), Inches(2), Inches(8), Inches(2)).table
+            for row in table.rows:
+                for cell in row.cells:
+                    cell.text = f"{rng.choice(WORDS)} {rng.randint(0, 999)}"
+        else:
+            slide = prs.slides.add_slide(prs.slide_layouts[1])
+            slide.shapes.title.text = sentence(rng, 3, 7).rstrip('.')
+            body = slide.placeholders[1].text_frame
+            body.text = sentence(rng)
+            for _ in range(rng.randint(2, 5)):
+                body.add_paragraph().text = sentence(rng)
+            if i % 7 == 3:
+                group = slide.shapes.add_group_shape()
+                box = group.shapes.add_textbox(Inches(6), Inches(5), Inches(3), Inches(1))
+                box.text_frame.text = sentence(rng, 3, 6)
+    prs.save(str(path))
+
+
+def make_pdf(path, rng, pages):
+    """Text PDF with headings, paragraphs and a ruled table on every page"""
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+    styles = getSampleStyleSheet()
+    story = []
+    for page in range(pages):
+        story.append(Paragraph(f"Section {page + 1}: {sentence(rng, 2, 5)}", styles['Heading1']))
+        for _ in range(4):
+            story.append(Paragraph(paragraph(rng, (3, 5)), styles['Normal']))
+            story.append(Spacer(1, 8))
+        data = [[f"{rng.choice(WORDS)} {rng.randint(0, 999)}" for _ in range(4)] for _ in range(6)]
+        table = Table(data)
+        table.setStyle(TableStyle([('GRID', (0, 0), (-1, -1), 0.5, colors.grey)]))
+        story.append(table)
+        story.append(PageBreak())
+    SimpleDocTemplate(str(path), pagesize=A4).build(story)
+
+
+def make_image(path, rng, megapixels, fmt):
+    """Photo-like image: smooth gradients plus noise, so codecs do real work"""
+    from PIL import Image, ImageChops, ImageDraw, ImageFilter
+
+    width = int((megapixels * 1_000_000 * 4 / 3) ** 0.5)
+    height = int(megapixels * 1_000_000 / width)
+
+    noise = Image.effect_noise((width, height), 40).filter(ImageFilter.GaussianBlur(2))
+    gradient = Image.linear_gradient('L').resize((width, height))
+    img = Image.merge('RGB', (
+        ImageChops.add(noise, gradient, scale=2.0),
+        noise,
+        ImageChops.subtract(noise, gradient, scale=2.0, offset=128),
+    ))
+    draw = ImageDraw.Draw(img)
+    for _ in range(40):
+        x, y = rng.randrange(width), rng.randrange(height)
+        r = rng.randint(width // 40, width // 10)
+        draw.ellipse((x - r, y - r, x + r, y + r), fill=tuple(rng.randrange(256) for _ in range(3)))
+
+    if fmt == 'JPEG':
+        img.save(str(path), 'JPEG', quality=90)
+    else:
+        img.save(str(path), fmt)
+
+
+def build_corpus(out_dir, profile='small', seed=1234, force=False):
+    """Create the corpus (or reuse an identical one) and return its manifest
+
+    The manifest maps case names to the input file(s) of each conversion.
+    """
+    out_dir = Path(out_dir) / profile
+    manifest_path = out_dir / 'manifest.json'
+    settings = dict(PROFILES[profile], seed=seed, version=CORPUS_VERSION)
+
+    if manifest_path.exists() and not force:
+        manifest = json.loads(manifest_path.read_text())
+        files = [f for inputs in manifest['cases'].values() for f in inputs['files']]
+        if manifest['settings'] == settings and all(Path(f).exists() for f in files):
+            return manifest
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    knobs = PROFILES[profile]
+
+    docx_path = out_dir / 'document.docx'
+    make_docx(docx_path, random.Random(seed), knobs['docx_paragraphs'], knobs['docx_tables'])
+
+    pptx_path = out_dir / 'deck.pptx'
+    make_pptx(pptx_path, random.Random(seed + 1), knobs['pptx_slides'])
+
+    pdf_path = out_dir / 'report.pdf'
+    make_pdf(pdf_path, random.Random(seed + 2), knobs['pdf_pages'])
+
+    jpeg_path = out_dir / 'photo.jpg'
+    make_image(jpeg_path, random.Random(seed + 3), knobs['image_megapixels'], 'JPEG')
+
+    png_path = out_dir / 'photo.png'
+    make_image(png_path, random.Random(seed + 4), knobs['image_megapixels'] / 2, 'PNG')
+
+    multi_paths = []
+    for i in range(knobs['multi_images']):
+        path = out_dir / f"scan_{i:03d}.jpg"
+        make_image(path, random.Random(seed + 100 + i), 2, 'JPEG')
+        multi_paths.append(path)
+
+    cases = {
+        'pdf_to_word': ('pdf_to_word', [pdf_path]),
+        'word_to_pdf': ('word_to_pdf', [docx_path]),
+        'word_to_ppt': ('word_to_ppt', [docx_path]),
+        'ppt_to_word': ('ppt_to_word', [pptx_path]),
+        'image_to_pdf_jpeg': ('image_to_pdf', [jpeg_path]),
+        'image_to_pdf_png': ('image_to_pdf', [png_path]),
+        'multi_image_to_pdf': ('multi_image_to_pdf', multi_paths),
+    }
+    manifest = {
+        'settings': settings,
+        'cases': {
+            name: {'conversion': conversion, 'files': [str(p) for p in paths]}
+            for name, (conversion, paths) in cases.items()
+        },
+    }
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='small')
+    parser.add_argument('--out', default=str(Path(__file__).resolve().parent / 'corpus'))
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--force', action='store_true', help="Rebuild even if an identical corpus exists")
+    args = parser.parse_args()
+
+    manifest = build_corpus(args.out, args.profile, args.seed, args.force)
+    for name, case in manifest['cases'].items():
+        size = sum(Path(f).stat().st_size for f in case['files'])
+        print(f"{name:22s} {len(case['files']):3d} file(s) {size / 1024:10.0f} KB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Benchmark every FileConverter conversion on the synthetic corpus.
+
+Each run happens in a fresh process, so peak memory belongs to one
+conversion only. Wall time, CPU time (including child processes) and peak
+RSS are written to a JSON file that can serve as a baseline for later runs:
+
+    python benchmarks/run_benchmarks.py --profile small -o baseline.json
+    python benchmarks/run_benchmarks.py --profile small --compare baseline.json
+
+With --compare the exit status is 1 when any case regressed beyond the
+tolerances. Runs fully offline; the corpus is generated locally.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+import multiprocessing
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import PROFILES, build_corpus
+
+RESULTS_VERSION = 1
+
+# Differences below these floors are treated as noise
+MIN_TIME_DELTA = 0.05
+MIN_RSS_DELTA = 8 * 1024 * 1024
+
+PACKAGES = ('python-docx', 'python-pptx', 'pypdf', 'pdf2docx', 'PyMuPDF', 'Pillow', 'reportlab')
+
+
+def _cpu_seconds():
+    """CPU time of this process and its finished children"""
+    import resource
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def measure_case(conversion, files, work_dir):
+    """Run one conversion in the current (fresh) process and measure it"""
+    # FileConverter logs to converter.log in the working directory
+    os.chdir(work_dir)
+    logging.disable(logging.WARNING)
+
+    from file_converter import FileConverter, backends, _peak_rss_bytes
+
+    converter = FileConverter()
+    # Imports are not part of the conversion being measured
+    backends.preload(conversion)
+
+    cpu_start = _cpu_seconds()
+    wall_start = time.perf_counter()
+    target = files if conversion == 'multi_image_to_pdf' else files[0]
+    result = converter.convert_file(target, conversion, work_dir)
+    wall_time = time.perf_counter() - wall_start
+    cpu_time = _cpu_seconds() - cpu_start
+
+    output_size = None
+    if result['output'] and Path(result['output']).exists():
+        output_size = Path(result['output']).stat().st_size
+
+    return {
+        'wall_time': wall_time,
+        'cpu_time': cpu_time,
+        'peak_rss': _peak_rss_bytes(),
+        'output_size': output_size,
+        'error': result['error'],
+    }
+
+
+def run_case(conversion, files, repeat):
+    """Measure a case `repeat` times, each in a new spawned process"""
+    ctx = multiprocessing.get_context('spawn')
+    runs = []
+    for _ in range(repeat):
+        work_dir = tempfile.mkdtemp(prefix='converter-bench-')
+        try:
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                runs.append(pool.submit(measure_case, conversion, files, work_dir).result())
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    ok = [run for run in runs if not run['error']]
+    if not ok:
+        return {'conversion': conversion, 'error': runs[-1]['error'], 'runs': runs}
+    return {
+        'conversion': conversion,
+        'wall_time': statistics.median(run['wall_time'] for run in ok),
+        'cpu_time': statistics.median(run['cpu_time'] for run in ok),
+        'peak_rss': max(run['peak_rss'] or 0 for run in ok) or None,
+        'output_size': ok[-1]['output_size'],
+        'error': None,
+        'runs': runs,
+    }
+
+
+def environment():
+    from importlib import metadata
+
+    versions = {}
+    for name in PACKAGES:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'packages': versions,
+    }
+
+
+def compare(current, baseline, time_tolerance, memory_tolerance):
+    """Print a comparison table and return the names of regressed cases"""
+    if current['profile'] != baseline.get('profile'):
+        print(f"warning: comparing profile {current['profile']} against {baseline.get('profile')}")
+    if current['environment'] != baseline.get('environment'):
+        print("warning: baseline was recorded in a different environment")
+
+    regressions = []
+    print(f"\n{'case':22s} {'metric':10s} {'baseline':>12s} {'current':>12s} {'change':>8s}")
+    for name, case in current['cases'].items():
+        old = baseline.get('cases', {}).get(name)
+        if old is None or old.get('error') or case.get('error'):
+            status = 'new' if old is None else 'error'
+            print(f"{name:22s} {status}")
+            if old is not None and not old.get('error') and case.get('error'):
+                regressions.append(name)
+            continue
+
+        for metric, tolerance, floor in (
+            ('wall_time', time_tolerance, MIN_TIME_DELTA),
+            ('cpu_time', time_tolerance, MIN_TIME_DELTA),
+            ('peak_rss', memory_tolerance, MIN_RSS_DELTA),
+        ):
+            before, after = old.get(metric), case.get(metric)
+            if not before or after is None:
+                continue
+            change = after / before - 1
+            regressed = change > tolerance and after - before > floor
+            if regressed and name not in regressions:
+                regressions.append(name)
+            print(
+                f"{name:22s} {metric:10s} {format_metric(metric, before):>12s} "
+                f"{format_metric(metric, after):>12s} {change:+7.1%}{'  REGRESSION' if regressed else ''}"
+            )
+    return regressions
+
+
+def format_metric(metric, value):
+    if metric == 'peak_rss':
+        return f"{value / 1024 / 1024:.1f} MB"
+    return f"{value:.3f}s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='small')
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per case; the median is reported")
+    parser.add_argument('--cases', help="Comma-separated subset of cases to run")
+    parser.add_argument('--corpus-dir', default=str(Path(__file__).resolve().parent / 'corpus'))
+    parser.add_argument('-o', '--output', help="Write results (usable as a baseline) to this JSON file")
+    parser.add_argument('--compare', metavar='BASELINE', help="Compare against an earlier results file")
+    parser.add_argument('--time-tolerance', type=float, default=0.15, help="Allowed slowdown (default 15%%)")
+    parser.add_argument('--memory-tolerance', type=float, default=0.10, help="Allowed memory growth (default 10%%)")
+    args = parser.parse_args()
+
+    manifest = build_corpus(args.corpus_dir, args.profile)
+    selected = args.cases.split(',') if args.cases else list(manifest['cases'])
+    unknown = set(selected) - set(manifest['cases'])
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(sorted(unknown))}")
+
+    results = {
+        'version': RESULTS_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'profile': args.profile,
+        'corpus': manifest['settings'],
+        'environment': environment(),
+        'cases': {},
+    }
+
+    for name in selected:
+        case = manifest['cases'][name]
+        outcome = run_case(case['conversion'], case['files'], args.repeat)
+        results['cases'][name] = outcome
+        if outcome['error']:
+            print(f"{name:22s} FAILED: {outcome['error']}")
+        else:
+            print(
+                f"{name:22s} wall {outcome['wall_time']:8.3f}s  cpu {outcome['cpu_time']:8.3f}s  "
+                f"peak {(outcome['peak_rss'] or 0) / 1024 / 1024:8.1f} MB"
+            )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(results, baseline, args.time_tolerance, args.memory_tolerance)
+        if regressions:
+            print(f"\nRegressions: {', '.join(regressions)}")
+            return 1
+        print("\nNo regressions")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,59 @@
+import threading
+import time
+
+
+class ConversionCancelled(Exception):
+    """Raised inside a conversion once its CancellationToken is tripped"""
+
+
+class ConversionTimeout(ConversionCancelled):
+    """Raised when a conversion runs past its wall-clock limit"""
+
+
+class CancellationToken:
+    """Cooperative stop signal checked by conversions between units of work
+
+    A token is tripped explicitly with cancel() or implicitly once its
+    optional timeout (in seconds, counted from creation) has passed.
+    Converters call raise_if_cancelled() between pages, slides and images.
+    Passing a multiprocessing Event as `event` lets a worker process see
+    cancel() calls made on the parent's token for the same event.
+    """
+
+    def __init__(self, timeout=None, event=None):
+        self._event = event if event is not None else threading.Event()
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancel_requested(self):
+        return self._event.is_set()
+
+    @property
+    def timed_out(self):
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    @property
+    def cancelled(self):
+        return self.cancel_requested or self.timed_out
+
+    def remaining(self):
+        """Seconds left before the deadline, or None without a timeout"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise ConversionCancelled("Conversion cancelled")
+        if self.timed_out:
+            raise ConversionTimeout(f"Conversion timed out after {self.timeout:g}s")
+
+
+def raise_if_cancelled(token):
+    """Check an optional token; conversions accept cancel_token=None"""
+    if token is not None:
+        token.raise_if_cancelled()
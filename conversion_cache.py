@@ -0,0 +1,239 @@
+import os
+from pathlib import Path
+import hashlib
+import json
+import logging
+import shutil
+import stat
+import threading
+from collections import OrderedDict
+
+# Bump when converter output changes so stale entries stop matching
+CACHE_FORMAT_VERSION = 3
+
+
+def default_cache_dir():
+    """Per-user cache location for converted files"""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local'
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'converter_space' / 'conversions'
+
+
+class ConversionCache:
+    """Content-addressed on-disk store of conversion outputs
+
+    Entries are keyed by a SHA-256 of the input bytes, the conversion type
+    and its options, so renamed or re-downloaded copies of the same file
+    still hit. The store is capped at max_bytes and evicts the least
+    recently used outputs first.
+
+    Hits are copied to the output path. With use_hardlinks, cache objects
+    are stored read-only and hits are hard-linked to them instead, so an
+    output can then not be rewritten in place (which would change the
+    cached entry); replacing it with a new file still works.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=2 * 1024 ** 3, use_hardlinks=False, logger=None):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.objects_dir = self.cache_dir / 'objects'
+        self.max_bytes = max_bytes
+        self.use_hardlinks = use_hardlinks
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()  # key -> (path, size), oldest first
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        """Rebuild the LRU order from the stored objects' modification times"""
+        objects = []
+        for path in self.objects_dir.glob('*/*'):
+            if path.name.startswith('.'):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            objects.append((stat.st_mtime, path.name.split('.')[0], path, stat.st_size))
+
+        for _, key, path, size in sorted(objects):
+            self._entries[key] = (path, size)
+            self._total_bytes += size
+
+    def make_key(self, input_path, conversion_type, options=None):
+        """Hash the input bytes together with what is done to them"""
+        digest = hashlib.sha256()
+        digest.update(f"v{CACHE_FORMAT_VERSION}\0{conversion_type}\0".encode('utf-8'))
+        digest.update(json.dumps(options or {}, sort_keys=True, default=str).encode('utf-8'))
+        digest.update(b'\0')
+
+        with open(input_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+    def fetch(self, key, output_path):
+        """Place the cached output for key at output_path; False on a miss"""
+        output_path = Path(output_path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not entry[0].exists():
+                self._forget(key)
+                entry = None
+
+            if entry is None:
+                # Another process (e.g. a batch worker) may have stored it
+                entry = self._adopt_from_disk(key)
+
+            if entry is None:
+                self.misses += 1
+                # Never let a fresh conversion write through a link into the cache
+                self._detach(output_path)
+                return False
+
+            self._entries.move_to_end(key)
+            object_path = entry[0]
+
+        try:
+            self._place(object_path, output_path)
+            os.utime(object_path)
+        except OSError as e:
+            self.logger.warning(f"Could not restore cached output {object_path}: {str(e)}")
+            with self._lock:
+                self.misses += 1
+            self._detach(output_path)
+            return False
+
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def store(self, key, output_path):
+        """Copy a finished output into the cache and enforce the size cap"""
+        output_path = Path(output_path)
+        size = output_path.stat().st_size
+        if size > self.max_bytes:
+            return
+
+        object_path = self.objects_dir / key[:2] / f"{key}{output_path.suffix}"
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write under a temporary name so readers never see a partial file
+        temp_path = object_path.with_name(f".{object_path.name}.tmp")
+        shutil.copyfile(output_path, temp_path)
+        if self.use_hardlinks:
+            # Outputs linked to this object must not be able to modify it
+            os.chmod(temp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        _make_writable(object_path)
+        os.replace(temp_path, object_path)
+
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries[key][1]
+            self._entries[key] = (object_path, size)
+            self._entries.move_to_end(key)
+            self._total_bytes += size
+            self.stores += 1
+            self._evict()
+
+    def _adopt_from_disk(self, key):
+        for path in (self.objects_dir / key[:2]).glob(f"{key}.*"):
+            if path.name.endswith('.tmp'):
+                continue
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            self._entries[key] = (path, size)
+            self._total_bytes += size
+            return self._entries[key]
+        return None
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, (path, _) = next(iter(self._entries.items()))
+            self._forget(key)
+            try:
+                _make_writable(path)
+                path.unlink()
+            except OSError:
+                pass
+            self.evictions += 1
+
+    def _forget(self, key):
+        path, size = self._entries.pop(key)
+        self._total_bytes -= size
+
+    def _place(self, object_path, output_path):
+        temp_path = output_path.with_name(f".{output_path.name}.cache-tmp")
+        if temp_path.exists():
+            temp_path.unlink()
+
+        # Only read-only objects are shared; anything else could be edited through the output
+        if self.use_hardlinks and not os.stat(object_path).st_mode & _WRITE_BITS:
+            try:
+                os.link(object_path, temp_path)
+            except OSError:
+                # Different filesystem or no link support
+                shutil.copyfile(object_path, temp_path)
+        else:
+            shutil.copyfile(object_path, temp_path)
+
+        os.replace(temp_path, output_path)
+
+    def _detach(self, output_path):
+        """Remove an output that is hard-linked to a cache object"""
+        try:
+            if output_path.stat().st_nlink > 1:
+                output_path.unlink()
+        except OSError:
+            pass
+
+    def stats(self):
+        """Hit/miss counters and current size of the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': True,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'size_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes
+            }
+
+    def clear(self):
+        """Delete every cached output"""
+        with self._lock:
+            for path in self.objects_dir.glob('*/*'):
+                _make_writable(path)
+            shutil.rmtree(self.objects_dir, ignore_errors=True)
+            self.objects_dir.mkdir(parents=True, exist_ok=True)
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+_WRITE_BITS = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+
+
+def _make_writable(path):
+    """Undo the read-only mode of a cache object so it can be replaced or deleted (needed on Windows)"""
+    try:
+        os.chmod(path, os.stat(path).st_mode | stat.S_IWUSR)
+    except OSError:
+        pass
@@ -0,0 +1,212 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class Span:
+    """One timed region: a whole conversion or one stage inside it"""
+
+    __slots__ = (
+        'name', 'parent', 'attributes', 'started_at', 'start', 'end',
+        'stages', 'open_stage', 'thread', 'memory', 'stage_memory'
+    )
+
+    def __init__(self, name, parent=None, attributes=None):
+        self.name = name
+        self.parent = parent
+        self.attributes = attributes or {}
+        self.started_at = time.time()
+        self.start = time.perf_counter()
+        self.end = None
+        self.stages = {}
+        self.open_stage = None
+        self.thread = threading.get_ident()
+        # Filled in by MemoryAccounting when memory tracking is enabled
+        self.memory = None
+        self.stage_memory = {}
+
+    @property
+    def duration(self):
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    @property
+    def conversion(self):
+        """Name of the outermost span, i.e. the conversion this span belongs to"""
+        span = self
+        while span.parent is not None:
+            span = span.parent
+        return span.name
+
+    def to_record(self):
+        record = {
+            'span': self.name,
+            'conversion': self.conversion,
+            'parent': self.parent.name if self.parent is not None else None,
+            'started_at': self.started_at,
+            'duration': round(self.duration, 6),
+        }
+        if self.stages:
+            record['stages'] = {name: round(seconds, 6) for name, seconds in self.stages.items()}
+        if self.attributes:
+            record['attributes'] = self.attributes
+        if self.memory is not None:
+            record['memory'] = self.memory
+        if self.stage_memory:
+            record['stage_memory'] = self.stage_memory
+        return record
+
+
+class ConversionMetrics:
+    """Timing spans for conversions and their stages
+
+    A conversion runs inside span(); inside it, stage(name) ends the previous
+    stage and starts the next, so converters only mark where each phase
+    begins. Finished conversions are logged as one structured record with
+    their stage breakdown, kept for trace export and summed per
+    (conversion, stage) for the Prometheus textfile. With a MemoryAccounting
+    in `memory`, spans also carry memory high-water marks.
+    """
+
+    def __init__(self, logger=None, max_spans=5000):
+        self.logger = logger or logging.getLogger(__name__)
+        self.memory = None
+        self.spans = deque(maxlen=max_spans)
+        self._totals = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def current(self):
+        """Innermost open span of this thread, or None"""
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    @contextmanager
+    def span(self, name, **attributes):
+        stack = self._stack()
+        span = self._new_span(name, stack[-1] if stack else None, attributes)
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.attributes['error'] = type(e).__name__
+            raise
+        finally:
+            self._close_stage(span)
+            stack.pop()
+            self._finish(span)
+
+    def stage(self, name, **attributes):
+        """Start the next stage of the current span (no-op outside a span)"""
+        span = self.current()
+        if span is None:
+            return
+        self._close_stage(span)
+        span.open_stage = self._new_span(name, span, attributes)
+
+    def _new_span(self, name, parent, attributes):
+        span = Span(name, parent, attributes)
+        if self.memory is not None:
+            self.memory.begin(span)
+            # Keep the memory snapshot out of the measured time
+            span.start = time.perf_counter()
+        return span
+
+    def _close_stage(self, span):
+        stage = span.open_stage
+        if stage is None:
+            return
+        span.open_stage = None
+        self._finish(stage)
+        span.stages[stage.name] = span.stages.get(stage.name, 0.0) + stage.duration
+        if stage.memory is not None:
+            span.stage_memory[stage.name] = stage.memory
+
+    def _finish(self, span):
+        span.end = time.perf_counter()
+        if self.memory is not None and span.memory is not None:
+            self.memory.end(span)
+        key = (span.conversion, span.name if span.parent is not None else 'total')
+        with self._lock:
+            self.spans.append(span)
+            total = self._totals.setdefault(key, [0.0, 0])
+            total[0] += span.duration
+            total[1] += 1
+
+        if span.parent is None:
+            self._local.last = span
+            self.logger.info(f"conversion timing {json.dumps(span.to_record(), default=str)}")
+
+    def last_finished(self):
+        """Most recently finished top-level span of this thread"""
+        return getattr(self._local, 'last', None)
+
+    def record_stages(self, conversion, stages, total=None):
+        """Fold stage durations measured elsewhere (e.g. a worker process) into the totals"""
+        with self._lock:
+            items = list(stages.items())
+            if total is not None:
+                items.append(('total', total))
+            for stage, seconds in items:
+                entry = self._totals.setdefault((conversion, stage), [0.0, 0])
+                entry[0] += seconds
+                entry[1] += 1
+
+    def totals(self):
+        """{(conversion, stage): (seconds, count)}; stage 'total' is the whole conversion"""
+        with self._lock:
+            return {key: tuple(value) for key, value in self._totals.items()}
+
+    def write_prometheus(self, path):
+        """Write totals in the Prometheus text format (for node_exporter's textfile collector)"""
+        lines = [
+            "# HELP converter_stage_duration_seconds Time spent in each conversion stage",
+            "# TYPE converter_stage_duration_seconds summary",
+        ]
+        for (conversion, stage), (seconds, count) in sorted(self.totals().items()):
+            labels = f'conversion="{_escape_label(conversion)}",stage="{_escape_label(stage)}"'
+            lines.append(f"converter_stage_duration_seconds_sum{{{labels}}} {seconds:.6f}")
+            lines.append(f"converter_stage_duration_seconds_count{{{labels}}} {count}")
+        _write_atomic(path, "\n".join(lines) + "\n")
+
+    def write_trace(self, path):
+        """Write recorded spans as Chrome trace events (chrome://tracing, Perfetto)"""
+        with self._lock:
+            spans = list(self.spans)
+        pid = os.getpid()
+        events = []
+        for span in spans:
+            event = {
+                'name': span.name,
+                'cat': span.conversion,
+                'ph': 'X',
+                'ts': int(span.started_at * 1_000_000),
+                'dur': int(span.duration * 1_000_000),
+                'pid': pid,
+                'tid': span.thread,
+            }
+            if span.attributes:
+                event['args'] = {key: str(value) for key, value in span.attributes.items()}
+            events.append(event)
+        _write_atomic(path, json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'}))
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _write_atomic(path, text):
+    # Collectors may read the file at any moment, so never expose a partial one
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, path)
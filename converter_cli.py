@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Headless command line interface for Converter | Space
+
+Runs FileConverter without importing the GUI (customtkinter/tkinter), so it
+works on display-less servers:
+
+    python -m converter_cli pdf_to_word "reports/*.pdf" -o converted -j 4
+    python -m converter_cli image_to_pdf "scans/**/*.jpg" --jsonl results.jsonl
+    python -m converter_cli multi_image_to_pdf page1.png page2.png -o out
+
+One JSON object per input file is written to stdout (or --jsonl).
+"""
+
+import argparse
+import glob
+import json
+import sys
+from pathlib import Path
+
+from file_converter import FileConverter, CONVERSION_TYPES
+from progress_bus import throttle
+
+
+def expand_inputs(patterns):
+    """Expand glob patterns, keeping order and dropping duplicates"""
+    files = []
+    seen = set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if not matches and Path(pattern).exists():
+            matches = [pattern]
+        for match in matches:
+            path = Path(match)
+            if path.is_file() and str(path) not in seen:
+                seen.add(str(path))
+                files.append(str(path))
+    return files
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='converter_cli',
+        description="Convert documents and images without the GUI"
+    )
+    parser.add_argument('conversion', choices=CONVERSION_TYPES, help="Conversion to run")
+    parser.add_argument('inputs', nargs='+', help="Input files or glob patterns (quote them)")
+    parser.add_argument('-o', '--output-dir', default='.', help="Directory for converted files (default: current)")
+    parser.add_argument('-j', '--workers', type=int, default=1, help="Parallel worker processes (default: 1)")
+    parser.add_argument('--jsonl', metavar='PATH', default='-', help="Write JSON-lines results here (default: stdout)")
+    parser.add_argument('--timeout', type=float, metavar='SECONDS',
+                        help="Kill any single conversion running longer than this")
+    parser.add_argument('--shard-workers', type=int, metavar='N',
+                        help="pdf_to_word: parse long PDFs as page ranges in N processes per file")
+    parser.add_argument('--pages-per-shard', type=int, metavar='N',
+                        help="pdf_to_word: pages in each range parsed by --shard-workers (default: automatic)")
+    parser.add_argument('--libreoffice-pool', type=int, metavar='N',
+                        help="Keep N LibreOffice instances running for word_to_pdf (needs python3-uno)")
+    parser.add_argument('--cache-dir', metavar='DIR', help="Reuse outputs for identical inputs via this cache directory")
+    parser.add_argument('--metrics', metavar='PATH',
+                        help="Write per-stage timing totals as a Prometheus textfile")
+    parser.add_argument('--trace', metavar='PATH',
+                        help="Write a Chrome/Perfetto JSON trace of conversions run in this process")
+    parser.add_argument('--memory', action='store_true',
+                        help="Record peak RSS and top allocations per conversion stage (slower)")
+    parser.add_argument('-q', '--quiet', action='store_true', help="Do not print progress to stderr")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    files = expand_inputs(args.inputs)
+    if not files:
+        print("converter_cli: no input files matched", file=sys.stderr)
+        return 2
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    converter = FileConverter()
+    if args.cache_dir:
+        converter.enable_cache(args.cache_dir)
+    if args.memory:
+        converter.enable_memory_tracking()
+    if args.libreoffice_pool and args.conversion == 'word_to_pdf':
+        if not converter.start_libreoffice_pool(size=args.libreoffice_pool):
+            print("converter_cli: LibreOffice pool not available, launching soffice per document", file=sys.stderr)
+
+    options = {}
+    if args.conversion == 'pdf_to_word':
+        if args.shard_workers:
+            options['workers'] = args.shard_workers
+        if args.pages_per_shard:
+            options['pages_per_shard'] = args.pages_per_shard
+
+    def show_progress(percentage, message=""):
+        print(f"[{percentage:5.1f}%] {message}", file=sys.stderr)
+
+    # A few lines per second is plenty for a terminal
+    progress = None if args.quiet else throttle(show_progress, max_rate=4)
+
+    if args.conversion == 'multi_image_to_pdf':
+        converter.set_progress_callback(progress)
+        if args.timeout is not None:
+            results = [converter.convert_isolated(files, args.conversion, str(output_dir), timeout=args.timeout)]
+        else:
+            results = [converter.convert_file(files, args.conversion, str(output_dir))]
+    else:
+        results = converter.batch_convert(
+            files, args.conversion, str(output_dir),
+            progress_callback=progress, workers=args.workers, timeout=args.timeout, options=options
+        )
+
+    if progress is not None:
+        progress.close()
+    converter.stop_libreoffice_pool()
+
+    if args.metrics:
+        converter.metrics.write_prometheus(args.metrics)
+    if args.trace:
+        converter.metrics.write_trace(args.trace)
+
+    out = sys.stdout if args.jsonl == '-' else open(args.jsonl, 'w', encoding='utf-8')
+    try:
+        for result in results:
+            out.write(json.dumps(result) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    return 1 if any(r['error'] for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
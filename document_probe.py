@@ -0,0 +1,91 @@
+import zipfile
+from pathlib import Path
+
+from docx_reader import DocxReader, package_parts, read_xml
+
+_P_NS = '{http://schemas.openxmlformats.org/presentationml/2006/main}'
+
+
+def probe_docx(path):
+    """Word document info from docProps
+
+    The paragraph count comes from docProps/app.xml. Only when that is
+    missing or zero (as in files written by python-docx, whose template
+    keeps a stale 0) is the body streamed to count paragraphs like
+    python-docx's doc.paragraphs (body level, non-blank).
+    """
+    with DocxReader(path) as reader:
+        info = {
+            'type': 'Word Document',
+            'core_properties': reader.core_properties(),
+        }
+        app_properties = reader.app_properties()
+        if app_properties is not None:
+            info['app_properties'] = app_properties
+        paragraphs = (app_properties or {}).get('paragraphs', '')
+        if paragraphs.isdigit() and int(paragraphs) > 0:
+            info['paragraphs'] = int(paragraphs)
+        else:
+            info['paragraphs'] = sum(1 for paragraph in reader.paragraphs() if paragraph.text.strip())
+    return info
+
+
+def probe_pptx(path):
+    """Slide count from presentation.xml's slide id list"""
+    with zipfile.ZipFile(path) as package:
+        parts = package_parts(package)
+        presentation = read_xml(package, parts.get('officeDocument', 'ppt/presentation.xml'))
+        if presentation is None:
+            raise Exception("Presentation part is missing")
+        slide_list = presentation.find(_P_NS + 'sldIdLst')
+        return {
+            'type': 'PowerPoint Presentation',
+            'slides': len(slide_list.findall(_P_NS + 'sldId')) if slide_list is not None else 0,
+        }
+
+
+# PyMuPDF's metadata names and the Info dictionary keys pypdf reports them under
+_PDF_METADATA_KEYS = {
+    'title': '/Title', 'author': '/Author', 'subject': '/Subject', 'keywords': '/Keywords',
+    'creator': '/Creator', 'producer': '/Producer', 'creationDate': '/CreationDate',
+    'modDate': '/ModDate', 'trapped': '/Trapped',
+}
+
+
+def probe_pdf(path):
+    """Page count, encryption and document info through PyMuPDF
+
+    PyMuPDF reads the cross-reference data and the page tree root on open
+    and loads pages only on demand, so this stays quick for huge files.
+    """
+    from file_converter import backends
+
+    try:
+        pymupdf = backends.get('pymupdf')
+    except ImportError:
+        # PyMuPDF releases before 1.24 only provide the fitz name
+        pymupdf = backends.get('fitz')
+
+    with pymupdf.open(path) as document:
+        # metadata is None while a user password is required
+        metadata = document.metadata or {}
+        return {
+            'type': 'PDF Document',
+            'pages': document.page_count,
+            'encrypted': bool(document.needs_pass or metadata.get('encryption')),
+            'metadata': {
+                key: metadata[name] for name, key in _PDF_METADATA_KEYS.items() if metadata.get(name)
+            },
+        }
+
+
+def probe_file(path):
+    """Fast type-specific info for PDF, Word and PowerPoint files ({} for others)"""
+    suffix = Path(path).suffix.lower()
+    if suffix == '.pdf':
+        return probe_pdf(path)
+    if suffix in ('.docx', '.doc'):
+        return probe_docx(path)
+    if suffix in ('.pptx', '.ppt'):
+        return probe_pptx(path)
+    return {}
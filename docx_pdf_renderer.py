@@ -0,0 +1,192 @@
+import functools
+import io
+import itertools
+import posixpath
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Flowable, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from cancellation import raise_if_cancelled
+from docx_reader import DocxTableRow
+from text_sanitizer import escape_markup, sanitize_text
+
+# Flowables laid out ahead of the page being filled; bounds memory for any document length
+CHUNK_SIZE = 200
+
+# Long tables are split into reportlab Tables of this many rows
+TABLE_CHUNK_ROWS = 50
+
+# Image formats reportlab can embed through PIL
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tif', '.tiff'}
+
+
+@functools.lru_cache(maxsize=1)
+def fallback_styles():
+    """Paragraph styles shared by every fallback render (built once per process)"""
+    styles = getSampleStyleSheet()
+    return {
+        'Title': styles['Title'],
+        'Heading1': styles['Heading1'],
+        'Normal': styles['Normal'],
+        'CustomTitle': ParagraphStyle('CustomTitle', parent=styles['Title'], fontSize=18, spaceAfter=30),
+        'TableCell': ParagraphStyle('TableCell', parent=styles['Normal'], fontSize=9, leading=11),
+    }
+
+
+class _PackageImage(Flowable):
+    """Image from the docx package, read only when its page is drawn"""
+
+    def __init__(self, reader, part, width, height):
+        super().__init__()
+        self.reader = reader
+        self.part = part
+        self.width = width
+        self.height = height
+
+    def wrap(self, available_width, available_height):
+        return self.width, self.height
+
+    def draw(self):
+        try:
+            image = ImageReader(io.BytesIO(self.reader.read_part(self.part)))
+        except Exception:
+            # Unreadable or unsupported image data: leave the space blank
+            return
+        self.canv.drawImage(image, 0, 0, self.width, self.height, mask='auto')
+
+
+class _StreamingDocTemplate(SimpleDocTemplate):
+    """SimpleDocTemplate that pulls its story from an iterator in chunks
+
+    build() only ever sees between CHUNK_SIZE and twice that many flowables;
+    the list is topped up before each flowable is laid out, so keep-with-next
+    lookahead still works across chunk boundaries.
+    """
+
+    def __init__(self, filename, source, on_page=None, chunk_size=CHUNK_SIZE, **kwargs):
+        super().__init__(filename, **kwargs)
+        self._source = source
+        self._on_page = on_page
+        self._chunk_size = chunk_size
+        self._story = None
+
+    def build(self, flowables, **kwargs):
+        self._story = flowables
+        super().build(flowables, **kwargs)
+
+    def filterFlowables(self, flowables):
+        # Only the story is refilled; reportlab also lays out internal lists of its own
+        if flowables is self._story and self._source is not None and len(flowables) < self._chunk_size:
+            before = len(flowables)
+            flowables.extend(itertools.islice(self._source, self._chunk_size))
+            if len(flowables) == before:
+                self._source = None
+
+    def afterPage(self):
+        if self._on_page:
+            self._on_page(self.page)
+
+
+def render_docx(reader, output_path, on_page=None, cancel_token=None, chunk_size=CHUNK_SIZE):
+    """Lay out a DocxReader's paragraphs, tables and images as an A4 PDF
+
+    on_page(page_number) is called as each page is finished. Returns the
+    number of pages written.
+    """
+    doc = _StreamingDocTemplate(str(output_path), None, on_page=on_page, chunk_size=chunk_size, pagesize=A4)
+    source = _flowables(reader, doc.width, doc.height, cancel_token)
+    first_chunk = list(itertools.islice(source, chunk_size))
+    doc._source = source
+    doc.build(first_chunk)
+    return doc.page
+
+
+def _flowables(reader, frame_width, frame_height, cancel_token):
+    styles = fallback_styles()
+
+    title = sanitize_text(reader.core_properties()['title'])
+    if title:
+        yield Paragraph(escape_markup(title), styles['CustomTitle'])
+        yield Spacer(1, 12)
+
+    rows = []
+    table = None
+    for block in reader.blocks():
+        raise_if_cancelled(cancel_token)
+        if isinstance(block, DocxTableRow):
+            if rows and (block.table != table or len(rows) == TABLE_CHUNK_ROWS):
+                yield _table(rows, frame_width, styles['TableCell'])
+                rows = []
+                if block.table != table:
+                    yield Spacer(1, 12)
+            table = block.table
+            rows.append(block.cells)
+            continue
+
+        if rows:
+            yield _table(rows, frame_width, styles['TableCell'])
+            yield Spacer(1, 12)
+            rows = []
+            table = None
+
+        # Paragraph parses its text as markup, so stray '&' or '<' must be escaped
+        text = sanitize_text(block.text)
+        if text:
+            if block.style.startswith('Heading'):
+                style = styles['Heading1']
+            elif block.style == 'Title':
+                style = styles['Title']
+            else:
+                style = styles['Normal']
+            try:
+                paragraph = Paragraph(escape_markup(text), style)
+            except Exception:
+                # Skip problematic paragraphs
+                paragraph = None
+            if paragraph is not None:
+                yield paragraph
+                yield Spacer(1, 12)
+
+        for image in block.images:
+            flowable = _image(reader, image, frame_width, frame_height)
+            if flowable is not None:
+                yield flowable
+                yield Spacer(1, 12)
+
+    if rows:
+        yield _table(rows, frame_width, styles['TableCell'])
+
+
+def _table(rows, frame_width, cell_style):
+    columns = max(len(row) for row in rows) or 1
+    data = [
+        [
+            Paragraph('<br/>'.join(escape_markup(sanitize_text(line)) for line in cell.split('\n')), cell_style)
+            for cell in row
+        ] + [''] * (columns - len(row))
+        for row in rows
+    ]
+    table = Table(data, colWidths=[frame_width / columns] * columns)
+    table.setStyle(TableStyle([
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ]))
+    return table
+
+
+def _image(reader, image, max_width, max_height):
+    if posixpath.splitext(image.part)[1].lower() not in IMAGE_EXTENSIONS:
+        return None
+    width, height = image.width, image.height
+    if not width or not height:
+        # No extent recorded: fall back to the pixel size
+        try:
+            width, height = ImageReader(io.BytesIO(reader.read_part(image.part))).getSize()
+        except Exception:
+            return None
+    # Leave room for the spacer that follows, so the image always fits a frame
+    scale = min(1.0, max_width / width, (max_height - 24) / height)
+    return _PackageImage(reader, image.part, width * scale, height * scale)
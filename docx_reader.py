@@ -0,0 +1,266 @@
+import posixpath
+import zipfile
+from collections import namedtuple
+from xml.etree import ElementTree
+
+# Office Open XML namespaces and relationship types
+REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+DC_NS = '{http://purl.org/dc/elements/1.1/}'
+R_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+WP_NS = '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}'
+A_NS = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+APP_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/extended-properties}'
+_REL_TYPES = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+_PKG_REL_TYPES = 'http://schemas.openxmlformats.org/package/2006/relationships/metadata/'
+
+# Built-in styles whose styles.xml names differ from the names Word shows (as python-docx does)
+_UI_STYLE_NAMES = {'caption': 'Caption', 'footer': 'Footer', 'header': 'Header'}
+_UI_STYLE_NAMES.update({f'heading {level}': f'Heading {level}' for level in range(1, 10)})
+
+# Text of run content elements other than w:t, matching python-docx's Run.text
+_RUN_TEXT = {W_NS + 'tab': '\t', W_NS + 'ptab': '\t', W_NS + 'cr': '\n', W_NS + 'noBreakHyphen': '-'}
+
+# EMUs per PDF point
+_EMU_PER_POINT = 12700
+
+DocxParagraph = namedtuple('DocxParagraph', 'text style images', defaults=((),))
+DocxTableRow = namedtuple('DocxTableRow', 'table cells')
+DocxImage = namedtuple('DocxImage', 'part width height')
+
+
+def relationships(package, rels_name='_rels/.rels', base=''):
+    """{relationship id: (type, part name)} of a relationships part, internal targets only"""
+    result = {}
+    root = read_xml(package, rels_name)
+    if root is None:
+        return result
+    for rel in root.iter(REL_NS + 'Relationship'):
+        if rel.get('TargetMode') == 'External':
+            continue
+        target = rel.get('Target', '')
+        target = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join(base, target))
+        result[rel.get('Id')] = (rel.get('Type', ''), target)
+    return result
+
+
+def package_parts(package, rels_name='_rels/.rels', base=''):
+    """Map relationship type names (officeDocument, styles, ...) to part names"""
+    parts = {}
+    for rel_type, target in relationships(package, rels_name, base).values():
+        for prefix in (_REL_TYPES, _PKG_REL_TYPES):
+            if rel_type.startswith(prefix):
+                parts.setdefault(rel_type[len(prefix):], target)
+    return parts
+
+
+def read_xml(package, name):
+    """Parse a (small) part of a zip package, or None if it is missing"""
+    try:
+        data = package.read(name)
+    except KeyError:
+        return None
+    return ElementTree.fromstring(data)
+
+
+def xml_text(root, tag):
+    if root is None:
+        return ''
+    element = root.find(tag)
+    return (element.text or '') if element is not None else ''
+
+
+class DocxReader:
+    """Stream the body paragraphs of a .docx without python-docx's object model
+
+    paragraphs() yields DocxParagraph(text, style) records for the same
+    paragraphs, with the same text and style names, as python-docx's
+    doc.paragraphs; blocks() also yields their inline images and the rows of
+    top-level tables, in document order. word/document.xml is parsed
+    incrementally and each block (each row, for tables) is dropped once
+    read, so memory stays flat however long the document. Style ids are
+    resolved through a map built once from styles.xml.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._package = zipfile.ZipFile(path)
+        try:
+            self.parts = package_parts(self._package)
+            self.main_part = self.parts.get('officeDocument', 'word/document.xml')
+            directory, filename = posixpath.split(self.main_part)
+            self.relationships = relationships(
+                self._package, posixpath.join(directory, '_rels', filename + '.rels'), directory
+            )
+            self.style_names, self.default_style = self._load_styles()
+        except Exception:
+            self._package.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._package.close()
+
+    def read_part(self, name):
+        """Raw bytes of a part, e.g. an image referenced by a DocxImage"""
+        return self._package.read(name)
+
+    @property
+    def progress(self):
+        """Fraction of word/document.xml read so far by paragraphs() or blocks()"""
+        stream = getattr(self, '_stream', None)
+        if stream is None or stream.closed:
+            return 1.0 if stream is not None else 0.0
+        size = self._package.getinfo(self.main_part).file_size
+        return min(1.0, stream.tell() / size) if size else 1.0
+
+    def core_properties(self):
+        """title, author and subject from docProps/core.xml ('' when unset)"""
+        core = read_xml(self._package, self.parts.get('core-properties', 'docProps/core.xml'))
+        return {
+            'title': xml_text(core, DC_NS + 'title'),
+            'author': xml_text(core, DC_NS + 'creator'),
+            'subject': xml_text(core, DC_NS + 'subject'),
+        }
+
+    def app_properties(self):
+        """Statistics as last saved by the authoring application, or None"""
+        app = read_xml(self._package, self.parts.get('extended-properties', 'docProps/app.xml'))
+        if app is None:
+            return None
+        return {
+            key: xml_text(app, APP_NS + tag)
+            for key, tag in (
+                ('application', 'Application'), ('pages', 'Pages'), ('words', 'Words'), ('paragraphs', 'Paragraphs')
+            )
+            if app.find(APP_NS + tag) is not None
+        }
+
+    def _load_styles(self):
+        """{styleId: name} of paragraph styles and the default paragraph style's name"""
+        styles_part = next(
+            (target for rel_type, target in self.relationships.values() if rel_type == _REL_TYPES + 'styles'),
+            'word/styles.xml'
+        )
+        styles = read_xml(self._package, styles_part)
+
+        names = {}
+        default = ''
+        if styles is None:
+            return names, default
+        for style in styles.iter(W_NS + 'style'):
+            if style.get(W_NS + 'type', 'paragraph') != 'paragraph':
+                continue
+            name_element = style.find(W_NS + 'name')
+            name = name_element.get(W_NS + 'val', '') if name_element is not None else ''
+            name = _UI_STYLE_NAMES.get(name, name)
+            names.setdefault(style.get(W_NS + 'styleId'), name)
+            # python-docx takes the last style flagged as default
+            if style.get(W_NS + 'default') in ('1', 'true', 'on'):
+                default = name
+        return names, default
+
+    def paragraphs(self):
+        for element, _ in self._body_elements():
+            if element.tag == W_NS + 'p':
+                yield DocxParagraph(_paragraph_text(element), self._paragraph_style(element))
+
+    def blocks(self):
+        """DocxParagraph (with images) and DocxTableRow records in document order"""
+        for element, table in self._body_elements(table_rows=True):
+            if element.tag == W_NS + 'p':
+                yield DocxParagraph(
+                    _paragraph_text(element), self._paragraph_style(element), self._paragraph_images(element)
+                )
+            elif element.tag == W_NS + 'tr':
+                cells = [
+                    '\n'.join(_paragraph_text(p) for p in cell.findall(W_NS + 'p'))
+                    for cell in element.findall(W_NS + 'tc')
+                ]
+                yield DocxTableRow(table, cells)
+
+    def _body_elements(self, table_rows=False):
+        """Yield (element, table number) for each finished body block, or table row"""
+        depth = 0
+        body = None
+        body_depth = None
+        table = None
+        tables = 0
+        with self._package.open(self.main_part) as stream:
+            self._stream = stream
+            for event, element in ElementTree.iterparse(stream, events=('start', 'end')):
+                if event == 'start':
+                    depth += 1
+                    if element.tag == W_NS + 'body' and body is None:
+                        body, body_depth = element, depth
+                    elif table_rows and body is not None and depth == body_depth + 1 and element.tag == W_NS + 'tbl':
+                        table = element
+                        tables += 1
+                    continue
+                if table is not None and depth == body_depth + 2 and element.tag == W_NS + 'tr':
+                    yield element, tables
+                    # Rows are dropped as they are read, so long tables stay cheap too
+                    del table[:]
+                elif body is not None and depth == body_depth + 1:
+                    if element is table:
+                        table = None
+                    else:
+                        yield element, None
+                    # Drop each finished block so memory stays flat on huge documents
+                    del body[:]
+                depth -= 1
+
+    def _paragraph_images(self, paragraph):
+        images = []
+        for tag in (WP_NS + 'inline', WP_NS + 'anchor'):
+            for drawing in paragraph.iter(tag):
+                blip = next(drawing.iter(A_NS + 'blip'), None)
+                relationship = self.relationships.get(blip.get(R_NS + 'embed')) if blip is not None else None
+                if relationship is None:
+                    continue
+                extent = drawing.find(WP_NS + 'extent')
+                width = height = None
+                if extent is not None:
+                    width = int(extent.get('cx', 0)) / _EMU_PER_POINT or None
+                    height = int(extent.get('cy', 0)) / _EMU_PER_POINT or None
+                images.append(DocxImage(relationship[1], width, height))
+        return tuple(images)
+
+    def _paragraph_style(self, paragraph):
+        properties = paragraph.find(W_NS + 'pPr')
+        style = properties.find(W_NS + 'pStyle') if properties is not None else None
+        if style is None:
+            return self.default_style
+        # Unknown ids fall back to the default style, as in python-docx
+        return self.style_names.get(style.get(W_NS + 'val'), self.default_style)
+
+
+def _paragraph_text(paragraph):
+    # Direct runs and runs inside hyperlinks, like python-docx's Paragraph.text
+    parts = []
+    for child in paragraph:
+        if child.tag == W_NS + 'r':
+            _run_text(child, parts)
+        elif child.tag == W_NS + 'hyperlink':
+            for run in child.findall(W_NS + 'r'):
+                _run_text(run, parts)
+    return ''.join(parts)
+
+
+def _run_text(run, parts):
+    for item in run:
+        tag = item.tag
+        if tag == W_NS + 't':
+            if item.text:
+                parts.append(item.text)
+        elif tag == W_NS + 'br':
+            # Page and column breaks have no text equivalent
+            if item.get(W_NS + 'type', 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        elif tag in _RUN_TEXT:
+            parts.append(_RUN_TEXT[tag])
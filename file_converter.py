@@ -1,32 +1,209 @@
 import os
+import io
+import sys
+import zlib
 from pathlib import Path
 import logging
+import importlib
+import atexit
+import time
 from datetime import datetime
 
-# Document processing libraries
-from docx import Document
-from docx.shared import Inches
-import pypdf
-from pypdf import PdfWriter, PdfReader
-from pdf2docx import Converter
-from pptx import Presentation
-from pptx.util import Inches as PptxInches
-
-# Image processing
-from PIL import Image, ImageEnhance, ImageFilter
-import img2pdf
-
 # Additional utilities
 import tempfile
 import shutil
 import threading
+import functools
+from contextlib import contextmanager
+
+from cancellation import CancellationToken, ConversionCancelled, ConversionTimeout, raise_if_cancelled
+from conversion_metrics import ConversionMetrics
+from metadata_cache import MetadataCache
+from memory_accounting import _proc_status_bytes, begin_peak_rss, end_peak_rss
+from text_sanitizer import sanitize_text
+from docx_reader import DocxReader
+
+
+class BackendRegistry:
+    """Import conversion libraries on first use and record their load times
+
+    Pulling in python-docx, pdf2docx (and PyMuPDF with it), python-pptx,
+    reportlab and Pillow up front costs seconds before the window can appear,
+    so each converter asks the registry for the modules it needs instead.
+    """
+
+    def __init__(self):
+        self._modules = {}
+        self._load_times = {}
+        self._lock = threading.Lock()
+
+    def get(self, module_name):
+        """Return the named module, importing (and timing) it on first use"""
+        module = self._modules.get(module_name)
+        if module is not None:
+            return module
+
+        with self._lock:
+            if module_name not in self._modules:
+                start = time.perf_counter()
+                self._modules[module_name] = importlib.import_module(module_name)
+                self._load_times[module_name] = time.perf_counter() - start
+            return self._modules[module_name]
+
+    def preload(self, conversion_type):
+        """Import every backend used by a conversion type ahead of time"""
+        for module_name in CONVERSION_BACKENDS.get(conversion_type, ()):
+            self.get(module_name)
+
+    def is_loaded(self, module_name):
+        return module_name in self._modules
+
+    def load_times(self):
+        """Seconds spent importing each backend loaded so far"""
+        with self._lock:
+            return dict(self._load_times)
+
+
+# Backends needed by each conversion type
+CONVERSION_BACKENDS = {
+    'pdf_to_word': ('pdf2docx',),
+    'word_to_pdf': (),
+    'word_to_ppt': ('pptx',),
+    'ppt_to_word': ('pptx', 'docx'),
+    'image_to_pdf': ('PIL.Image', 'PIL.ImageFilter'),
+    'multi_image_to_pdf': ('PIL.Image', 'PIL.ImageFilter'),
+}
+
+backends = BackendRegistry()
+
+
+class WordPdfMethods:
+    """Probe once per process which Word to PDF methods can work here
+
+    word_to_pdf used to try Word over COM and then every LibreOffice
+    binary name in turn on each call, paying for an ImportError and a few
+    FileNotFoundErrors before reaching a method that exists. The probe
+    resolves the COM bridge, the LibreOffice binary and reportlab once, in
+    order of output quality. A method that keeps failing on a document type
+    (e.g. '.doc') where a later method then succeeded is skipped for that
+    type, and tried again once RETRY_AFTER seconds have passed. Documents no
+    method can convert say nothing about the methods and are not counted.
+    """
+
+    # Consecutive failures on one document type before a method is skipped for it
+    MAX_FAILURES = 3
+    # Seconds before a skipped method gets another try
+    RETRY_AFTER = 600
+
+    def __init__(self):
+        self._available = None
+        self._soffice = None
+        self._failures = {}  # (method, suffix) -> [consecutive failures, time of the last one]
+        self._lock = threading.Lock()
+
+    def _probe(self):
+        import importlib.util
+        from libreoffice_pool import find_soffice
+
+        available = []
+        if os.name == 'nt' and importlib.util.find_spec('win32com') is not None:
+            available.append('win32')
+        soffice = find_soffice()
+        if soffice is not None:
+            self._soffice = soffice
+            available.append('libreoffice')
+        if importlib.util.find_spec('reportlab') is not None:
+            available.append('reportlab')
+        logging.getLogger(__name__).info(f"Word to PDF methods available: {', '.join(available) or 'none'}")
+        return available
+
+    def available(self):
+        """Usable methods, best output first (probed on first call)"""
+        if self._available is None:
+            with self._lock:
+                if self._available is None:
+                    self._available = self._probe()
+        return list(self._available)
+
+    @property
+    def soffice(self):
+        """Path of the LibreOffice binary found by the probe, or None"""
+        self.available()
+        return self._soffice
+
+    def methods_for(self, suffix):
+        """Available methods not known to fail on documents of this type"""
+        suffix = suffix.lower()
+        available = self.available()
+        now = time.monotonic()
+        with self._lock:
+            return [
+                method for method in available
+                if not self._skipped(self._failures.get((method, suffix)), now)
+            ]
+
+    def _skipped(self, failures, now):
+        if failures is None:
+            return False
+        count, last_failure = failures
+        return count >= self.MAX_FAILURES and now - last_failure < self.RETRY_AFTER
+
+    def record(self, method, suffix, success):
+        """Remember how a method did on a document type
+        
+        Record a failure only when another method then converted the same
+        document, so broken inputs are not held against the method.
+        """
+        key = (method, suffix.lower())
+        with self._lock:
+            if success:
+                self._failures.pop(key, None)
+            else:
+                failures = self._failures.setdefault(key, [0, 0.0])
+                failures[0] += 1
+                failures[1] = time.monotonic()
+
+    def reset(self):
+        """Forget the probe and recorded failures, e.g. after installing LibreOffice"""
+        with self._lock:
+            self._available = None
+            self._soffice = None
+            self._failures.clear()
+
+
+word_pdf_methods = WordPdfMethods()
+
+# Settings that shape image_to_pdf output; part of its cache key
+IMAGE_PDF_OPTIONS = {
+    'max_size': (2000, 2000),
+    'jpeg_quality': 95,
+    'page_size_mm': (210, 297)
+}
+
+def _timed_conversion(method):
+    """Run a conversion method inside a metrics span named after it"""
+    @functools.wraps(method)
+    def wrapper(self, input_path, *args, **kwargs):
+        if isinstance(input_path, (list, tuple)):
+            label = f"{len(input_path)} files"
+        else:
+            label = str(input_path)
+        with self.metrics.span(method.__name__, input=label):
+            return method(self, input_path, *args, **kwargs)
+    return wrapper
 
-from sklearn.linear_model import enet_path
 
 class FileConverter:
     def __init__(self):
         self.setup_logging()
         self.conversion_callbacks = {}
+        self.libreoffice_pool = None
+        self.cache = None
+        self.progress_callback = None
+        self.metrics = ConversionMetrics(logger=self.logger)
+        self.metadata_cache = MetadataCache()
+        # Per-thread callbacks installed by progress_scope()
+        self._progress_local = threading.local()
         
     def setup_logging(self):
         """Setup logging for error tracking"""
@@ -40,83 +217,309 @@ class FileConverter:
         )
         self.logger = logging.getLogger(__name__)
         
+    @staticmethod
+    def backend_load_times():
+        """Report how long each lazily imported backend took to load"""
+        return backends.load_times()
+
     def set_progress_callback(self, callback):
         """Set callback for progress updates"""
         self.progress_callback = callback
         
     def update_progress(self, percentage, message=""):
-        """Update progress if callback is set"""
-        if hasattr(self, 'progress_callback') and self.progress_callback:
-            self.progress_callback(percentage, message)
+        """Update progress if callback is set
+        
+        A callback installed with progress_scope() on the current thread takes
+        precedence over the one from set_progress_callback().
+        """
+        callback = getattr(self._progress_local, 'callback', None) or self.progress_callback
+        if callback:
+            callback(percentage, message)
+            
+    @contextmanager
+    def progress_scope(self, callback):
+        """Send this thread's progress updates to callback while inside the block
+        
+        Lets several jobs share one converter from different threads, each
+        reporting to its own stream (see progress_bus.ProgressStream).
+        """
+        previous = getattr(self._progress_local, 'callback', None)
+        self._progress_local.callback = callback
+        try:
+            yield callback
+        finally:
+            self._progress_local.callback = previous
+            
+    def enable_memory_tracking(self, top=10, stage_top=False):
+        """Record peak RSS and tracemalloc top allocations per conversion and stage
+        
+        Results appear under 'memory' in convert_file results and in the
+        conversion timing records in converter.log. tracemalloc slows
+        conversions down, so leave this off in normal use.
+        """
+        from memory_accounting import MemoryAccounting
+        
+        if self.metrics.memory is None:
+            self.metrics.memory = MemoryAccounting(top=top, stage_top=stage_top)
+            self.metrics.memory.start()
+        return self.metrics.memory
+        
+    def disable_memory_tracking(self):
+        if self.metrics.memory is not None:
+            self.metrics.memory.stop()
+            self.metrics.memory = None
+            
+    def _memory_top(self):
+        """Memory tracking setting to hand to worker processes (None when off)"""
+        return self.metrics.memory.top if self.metrics.memory is not None else None
+        
+    def enable_cache(self, cache_dir=None, max_bytes=2 * 1024 ** 3, use_hardlinks=False):
+        """Reuse earlier outputs for byte-identical inputs
+        
+        Hits are copied to the output path; use_hardlinks links them to
+        read-only cache objects instead (see ConversionCache). ppt_to_word
+        is never cached, as its output records the conversion date.
+        """
+        from conversion_cache import ConversionCache
+        
+        self.cache = ConversionCache(
+            cache_dir, max_bytes=max_bytes, use_hardlinks=use_hardlinks, logger=self.logger
+        )
+        return self.cache
+        
+    def disable_cache(self):
+        self.cache = None
+        
+    def cache_stats(self):
+        """Hit/miss counters of the conversion cache"""
+        if self.cache is None:
+            return {'enabled': False, 'hits': 0, 'misses': 0}
+        return self.cache.stats()
+        
+    def _check_cache(self, conversion_type, input_path, output_path, options=None):
+        """Look up a conversion in the cache
+        
+        Returns (key, hit). On a hit the cached output is already in place at
+        output_path; key is passed to _store_in_cache after a fresh conversion.
+        """
+        if self.cache is None:
+            return None, False
             
-    def pdf_to_word(self, input_path, output_dir):
-        """Convert PDF to Word document with enhanced error handling"""
+        self.metrics.stage('cache_lookup')
+        try:
+            key = self.cache.make_key(input_path, conversion_type, options)
+            if self.cache.fetch(key, output_path):
+                self.logger.info(f"Cache hit for {input_path} ({conversion_type})")
+                self.update_progress(100, "Loaded converted file from cache!")
+                return key, True
+            return key, False
+        except OSError as e:
+            self.logger.warning(f"Conversion cache lookup failed: {str(e)}")
+            return None, False
+            
+    def _store_in_cache(self, key, output_path):
+        if self.cache is None or key is None:
+            return
+        self.metrics.stage('cache_store')
+        try:
+            self.cache.store(key, output_path)
+        except OSError as e:
+            self.logger.warning(f"Could not store conversion in cache: {str(e)}")
+            
+    @_timed_conversion
+    def pdf_to_word(self, input_path, output_dir, workers=1, pages_per_shard=None, cancel_token=None):
+        """Convert PDF to Word document with enhanced error handling
+        
+        With workers > 1, longer PDFs are split into page ranges that are
+        parsed in parallel processes and assembled into one document.
+        cancel_token is checked between pages (between shards when sharded).
+        """
         try:
             input_path = Path(input_path)
             output_path = Path(output_dir) / f"{input_path.stem}_converted.docx"
             
             self.logger.info(f"Converting PDF to Word: {input_path}")
-            self.update_progress(10, "Initializing PDF conversion...")
-            
-            # Check if PDF is encrypted
-            reader = PdfReader(str(input_path))
-            if reader.is_encrypted:
-                raise Exception("PDF is password protected. Please unlock it first.")
             
-            self.update_progress(30, "Analyzing PDF structure...")
-            
-            # Use pdf2docx for conversion
-            cv = Converter(str(input_path))
-            self.update_progress(50, "Converting pages...")
+            cache_key, cached = self._check_cache('pdf_to_word', input_path, output_path)
+            if cached:
+                return str(output_path)
+                
+            self.update_progress(10, "Initializing PDF conversion...")
+            self.metrics.stage('open')
             
-            cv.convert(str(output_path), start=0, end=None)
-            cv.close()
+            # One parse serves both checks and layout: the encryption check reads
+            # the trailer of the PyMuPDF document pdf2docx converts from
+            cv = backends.get('pdf2docx').Converter(str(input_path))
+            try:
+                if cv.fitz_doc.needs_pass:
+                    raise Exception("PDF is password protected. Please unlock it first.")
+                
+                self.update_progress(30, "Analyzing PDF structure...")
+                page_count = len(cv.fitz_doc)
+                shard_size = pages_per_shard or max(
+                    MIN_PAGES_PER_SHARD, min(MAX_PAGES_PER_SHARD, -(-page_count // max(workers, 1)))
+                )
+                
+                if workers > 1 and page_count > shard_size:
+                    self._pdf_to_word_sharded(
+                        cv, input_path, output_path, page_count, workers, shard_size, cancel_token
+                    )
+                else:
+                    self.update_progress(50, "Converting pages...")
+                    self._pdf_to_word_pages(cv, output_path, cancel_token)
+            finally:
+                cv.close()
             
             self.update_progress(90, "Finalizing document...")
+            self.metrics.stage('verify')
             
             # Verify output file exists and has content
-            if not output_path.exists() or output_path.stat().st_size < 1000:
+            try:
+                output_size = output_path.stat().st_size
+            except OSError:
+                output_size = 0
+            if output_size < 1000:
                 raise Exception("Conversion failed - output file is empty or corrupted")
             
+            self._store_in_cache(cache_key, output_path)
             self.update_progress(100, "PDF to Word conversion completed!")
             self.logger.info(f"Conversion completed: {output_path}")
             return str(output_path)
             
+        except ConversionCancelled as e:
+            self.logger.warning(f"PDF to Word conversion stopped: {str(e)}")
+            raise
         except Exception as e:
             self.logger.error(f"Error converting PDF to Word: {str(e)}")
             raise Exception(f"PDF to Word conversion failed: {str(e)}")
             
-    def word_to_pdf(self, input_path, output_dir):
+    def _pdf_to_word_pages(self, cv, output_path, cancel_token=None):
+        """Parse a whole PDF page by page, then write the docx
+        
+        Same steps as pdf2docx's Converter.convert, but the page loop is ours
+        so cancellation is checked and progress reported after every page.
+        The whole-document analysis (parse_document) is one pdf2docx call, so
+        a cancel arriving during it takes effect once it returns.
+        """
+        settings = cv.default_settings
+        self.metrics.stage('parse')
+        cv.load_pages(0, None)
+        raise_if_cancelled(cancel_token)
+        cv.parse_document(**settings)
+        
+        pages = [page for page in cv.pages if not page.skip_parsing]
+        for i, page in enumerate(pages):
+            raise_if_cancelled(cancel_token)
+            self.update_progress(50 + 35 * i / len(pages), f"Converting page {i+1}/{len(pages)}...")
+            try:
+                page.parse(**settings)
+            except Exception as e:
+                if not settings['ignore_page_error']:
+                    raise
+                # pdf2docx also skips pages it cannot parse by default
+                self.logger.warning(f"Skipping page {page.id + 1}: {str(e)}")
+        
+        raise_if_cancelled(cancel_token)
+        self.metrics.stage('write')
+        cv.make_docx(str(output_path), **settings)
+        
+    def _pdf_to_word_sharded(self, cv, input_path, output_path, page_count, workers, shard_size, cancel_token=None):
+        """Parse page ranges in worker processes, then build the docx once
+        
+        Only layout parsing is sharded. The parsed pages are restored into
+        a single converter and written by one make_docx call, so sections and
+        styles come out exactly as in a whole-file conversion.
+        """
+        from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+        
+        shards = [(start, min(start + shard_size, page_count)) for start in range(0, page_count, shard_size)]
+        self.logger.info(
+            f"Parsing {page_count} pages in {len(shards)} shards with {workers} workers"
+        )
+        self.update_progress(35, f"Converting {page_count} pages in {len(shards)} shards...")
+        self.metrics.stage('parse', shards=len(shards))
+        
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(shards)))
+        try:
+            futures = {
+                pool.submit(_parse_pdf_shard, str(input_path), start, end): (start, end)
+                for start, end in shards
+            }
+            
+            # Wake up regularly so a cancelled job stops waiting on its shards
+            remaining = set(futures)
+            done = 0
+            while remaining:
+                raise_if_cancelled(cancel_token)
+                finished, remaining = wait(remaining, timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    start, end = futures[future]
+                    cv.restore(future.result())
+                    done += 1
+                    self.update_progress(
+                        35 + 45 * done / len(shards),
+                        f"Converted pages {start + 1}-{end} ({done}/{len(shards)} shards)"
+                    )
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        
+        raise_if_cancelled(cancel_token)
+        self.update_progress(82, "Assembling Word document...")
+        self.metrics.stage('write')
+        cv.make_docx(str(output_path), **cv.default_settings)
+        
+    @_timed_conversion
+    def word_to_pdf(self, input_path, output_dir, cancel_token=None):
         """Convert Word document to PDF with multiple fallback methods"""
         try:
             input_path = Path(input_path)
             output_path = Path(output_dir) / f"{input_path.stem}_converted.pdf"
             
             self.logger.info(f"Converting Word to PDF: {input_path}")
-            self.update_progress(10, "Loading Word document...")
-            
-            # Try different methods based on platform and available libraries
-            success = False
             
-            # Method 1: Windows with Office (best quality)
-            if os.name == 'nt':
-                success = self._word_to_pdf_win32(input_path, output_path)
+            cache_key, cached = self._check_cache('word_to_pdf', input_path, output_path)
+            if cached:
+                return str(output_path)
                 
-            # Method 2: LibreOffice (cross-platform)
-            if not success:
-                success = self._word_to_pdf_libreoffice(input_path, output_path)
+            self.update_progress(10, "Loading Word document...")
+            
+            # Methods that exist here, best quality first, minus known-bad ones for this type
+            converters = {
+                'win32': lambda: self._word_to_pdf_win32(input_path, output_path),
+                'libreoffice': lambda: self._word_to_pdf_libreoffice(input_path, output_path, cancel_token),
+                'reportlab': lambda: self._word_to_pdf_fallback(input_path, output_path, cancel_token),
+            }
+            methods = word_pdf_methods.methods_for(input_path.suffix)
+            if not methods:
+                raise Exception(f"No working conversion method for {input_path.suffix or 'these'} files")
                 
-            # Method 3: python-docx + reportlab (fallback)
-            if not success:
-                success = self._word_to_pdf_fallback(input_path, output_path)
+            success = False
+            failed = []
+            for method in methods:
+                raise_if_cancelled(cancel_token)
+                success = converters[method]()
+                if success:
+                    break
+                failed.append(method)
                 
             if not success:
+                # Nothing could convert it, so blame the document, not the methods
                 raise Exception("All conversion methods failed")
+            for failed_method in failed:
+                word_pdf_methods.record(failed_method, input_path.suffix, False)
+            word_pdf_methods.record(method, input_path.suffix, True)
                 
+            # The reportlab layout is a stopgap: a later run with Word or
+            # LibreOffice available should not be served it from the cache
+            if method != 'reportlab':
+                self._store_in_cache(cache_key, output_path)
             self.update_progress(100, "Word to PDF conversion completed!")
             self.logger.info(f"Conversion completed: {output_path}")
             return str(output_path)
             
+        except ConversionCancelled as e:
+            self.logger.warning(f"Word to PDF conversion stopped: {str(e)}")
+            raise
         except Exception as e:
             self.logger.error(f"Error converting Word to PDF: {str(e)}")
             raise Exception(f"Word to PDF conversion failed: {str(e)}")
@@ -127,6 +530,7 @@ class FileConverter:
             import win32com.client
             
             self.update_progress(30, "Initializing Word application...")
+            self.metrics.stage('word_com')
             
             word = win32com.client.Dispatch("Word.Application")
             word.Visible = False
@@ -149,94 +553,112 @@ class FileConverter:
             self.logger.error(f"Win32 conversion failed: {str(e)}")
             return False
             
-    def _word_to_pdf_libreoffice(self, input_path, output_path):
+    def start_libreoffice_pool(self, size=2, job_timeout=120):
+        """Keep headless LibreOffice instances running for Word to PDF jobs
+        
+        Returns False when LibreOffice or its Python bridge is missing, in
+        which case conversions keep launching soffice per document.
+        """
+        from libreoffice_pool import LibreOfficePool
+        
+        if self.libreoffice_pool is not None:
+            return True
+        if not LibreOfficePool.is_supported():
+            self.logger.info("LibreOffice pool not available - using per-document soffice")
+            return False
+            
+        pool = LibreOfficePool(size=size, job_timeout=job_timeout, logger=self.logger)
+        try:
+            pool.start()
+        except Exception as e:
+            self.logger.error(f"Could not start LibreOffice pool: {str(e)}")
+            pool.shutdown()
+            return False
+            
+        self.libreoffice_pool = pool
+        atexit.register(self.stop_libreoffice_pool)
+        return True
+        
+    def stop_libreoffice_pool(self):
+        """Shut down the LibreOffice instances started by start_libreoffice_pool"""
+        if self.libreoffice_pool is not None:
+            self.libreoffice_pool.shutdown()
+            self.libreoffice_pool = None
+            
+    def _word_to_pdf_libreoffice(self, input_path, output_path, cancel_token=None):
         """Convert using LibreOffice (cross-platform)"""
+        if self.libreoffice_pool is not None:
+            try:
+                self.update_progress(40, "Using LibreOffice worker pool...")
+                self.metrics.stage('libreoffice_pool')
+                if self.libreoffice_pool.convert(input_path, output_path, cancel_token=cancel_token):
+                    return True
+            except ConversionCancelled:
+                raise
+            except Exception as e:
+                self.logger.warning(f"LibreOffice pool conversion failed, retrying standalone: {str(e)}")
+                
+        soffice = word_pdf_methods.soffice
+        if soffice is None:
+            return False
+            
         try:
             import subprocess
             
             self.update_progress(40, "Using LibreOffice for conversion...")
+            self.metrics.stage('libreoffice')
             
-            # Try different LibreOffice commands
-            libreoffice_commands = [
-                'libreoffice',
-                'soffice',
-                '/Applications/LibreOffice.app/Contents/MacOS/soffice'  # macOS
-            ]
-            
-            for cmd in libreoffice_commands:
-                try:
-                    result = subprocess.run([
-                        cmd, '--headless', '--convert-to', 'pdf',
-                        '--outdir', str(output_path.parent), str(input_path)
-                    ], capture_output=True, timeout=60)
-                    
-                    if result.returncode == 0:
-                        return output_path.exists()
-                        
-                except (FileNotFoundError, subprocess.TimeoutExpired):
-                    continue
+            # LibreOffice names its output after the input, so convert into a
+            # scratch directory and move the result to the expected name
+            temp_dir = Path(tempfile.mkdtemp())
+            try:
+                returncode = _run_cancellable([
+                    soffice, '--headless', '--convert-to', 'pdf',
+                    '--outdir', str(temp_dir), str(input_path)
+                ], timeout=LIBREOFFICE_TIMEOUT, cancel_token=cancel_token)
+                
+                produced = temp_dir / f"{input_path.stem}.pdf"
+                if returncode == 0 and produced.exists():
+                    shutil.move(str(produced), str(output_path))
+                    return output_path.exists()
+            except subprocess.TimeoutExpired:
+                self.logger.warning(f"LibreOffice timed out converting {input_path.name}")
+            finally:
+                shutil.rmtree(temp_dir, ignore_errors=True)
                     
             return False
             
+        except ConversionCancelled:
+            raise
         except Exception as e:
             self.logger.error(f"LibreOffice conversion failed: {str(e)}")
             return False
             
-    def _word_to_pdf_fallback(self, input_path, output_path):
-        """Fallback conversion using python-docx + reportlab"""
+    def _word_to_pdf_fallback(self, input_path, output_path, cancel_token=None):
+        """Fallback conversion using a streaming docx reader + reportlab"""
         try:
-            from reportlab.lib.pagesizes import letter, A4
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib.units import inch
+            # The renderer pulls in reportlab, so it is loaded (and timed) by the registry
+            render_docx = backends.get('docx_pdf_renderer').render_docx
             
             self.update_progress(40, "Using fallback conversion method...")
+            self.metrics.stage('load')
             
-            # Read Word document
-            doc = Document(str(input_path))
-            
-            self.update_progress(60, "Processing document content...")
-            
-            # Create PDF
-            pdf_doc = SimpleDocTemplate(str(output_path), pagesize=A4)
-            styles = getSampleStyleSheet()
-            story = []
-            
-            # Add title if available
-            if doc.core_properties.title:
-                title_style = ParagraphStyle(
-                    'CustomTitle',
-                    parent=styles['Title'],
-                    fontSize=18,
-                    spaceAfter=30
-                )
-                story.append(Paragraph(doc.core_properties.title, title_style))
-                story.append(Spacer(1, 12))
-            
-            # Process paragraphs
-            for para in doc.paragraphs:
-                if para.text.strip():
-                    # Determine style based on paragraph format
-                    if para.style.name.startswith('Heading'):
-                        style = styles['Heading1']
-                    elif para.style.name == 'Title':
-                        style = styles['Title']
-                    else:
-                        style = styles['Normal']
+            # Stream the Word document instead of building python-docx's object model
+            with DocxReader(input_path) as reader:
+                self.update_progress(60, "Processing document content...")
+                self.metrics.stage('render')
+                
+                # Pages are laid out as the document is read, so progress follows the reader
+                def page_done(page):
+                    self.update_progress(60 + int(35 * reader.progress), f"Rendered page {page}...")
                     
-                    try:
-                        p = Paragraph(para.text, style)
-                        story.append(p)
-                        story.append(Spacer(1, 12))
-                    except:
-                        # Skip problematic paragraphs
-                        continue
-            
-            self.update_progress(90, "Building PDF...")
-            pdf_doc.build(story)
-            
+                pages = render_docx(reader, output_path, on_page=page_done, cancel_token=cancel_token)
+                
+            self.logger.info(f"Fallback conversion wrote {pages} pages")
             return output_path.exists()
             
+        except ConversionCancelled:
+            raise
         except ImportError:
             self.logger.error("Reportlab not available for fallback conversion")
             return False
@@ -244,52 +666,66 @@ class FileConverter:
             self.logger.error(f"Fallback conversion failed: {str(e)}")
             return False
             
-    def word_to_ppt(self, input_path, output_dir):
+    @_timed_conversion
+    def word_to_ppt(self, input_path, output_dir, cancel_token=None):
         """Convert Word document to PowerPoint with smart content detection"""
         try:
             input_path = Path(input_path)
             output_path = Path(output_dir) / f"{input_path.stem}_converted.pptx"
             
             self.logger.info(f"Converting Word to PowerPoint: {input_path}")
-            self.update_progress(10, "Loading Word document...")
-            
-            # Read Word document
-            doc = Document(str(input_path))
-            
-            self.update_progress(30, "Analyzing document structure...")
             
-            # Create PowerPoint presentation
-            prs = Presentation()
+            cache_key, cached = self._check_cache('word_to_ppt', input_path, output_path)
+            if cached:
+                return str(output_path)
+                
+            self.update_progress(10, "Loading Word document...")
+            self.metrics.stage('load')
             
-            # Process document with intelligent slide creation
-            slides_created = self._create_slides_from_word(doc, prs)
+            # Stream the Word document; only paragraph text and style names are needed
+            with DocxReader(input_path) as reader:
+                self.update_progress(30, "Analyzing document structure...")
+                self.metrics.stage('build_slides')
+                
+                # Create PowerPoint presentation
+                prs = backends.get('pptx').Presentation()
+                
+                # Process document with intelligent slide creation
+                slides_created = self._create_slides_from_word(reader, prs, cancel_token)
             
+            raise_if_cancelled(cancel_token)
             self.update_progress(90, "Saving presentation...")
+            self.metrics.stage('save')
             prs.save(str(output_path))
+            self._store_in_cache(cache_key, output_path)
             
             self.update_progress(100, f"Created {slides_created} slides successfully!")
             self.logger.info(f"Conversion completed: {output_path}")
             return str(output_path)
             
+        except ConversionCancelled as e:
+            self.logger.warning(f"Word to PowerPoint conversion stopped: {str(e)}")
+            raise
         except Exception as e:
             self.logger.error(f"Error converting Word to PowerPoint: {str(e)}")
             raise Exception(f"Word to PowerPoint conversion failed: {str(e)}")
             
-    def _create_slides_from_word(self, doc, prs):
-        """Intelligently create slides from Word document"""
+    def _create_slides_from_word(self, reader, prs, cancel_token=None):
+        """Intelligently create slides from a DocxReader's paragraphs"""
         slide_content = []
         current_title = None
         slides_created = 0
         
-        for para in doc.paragraphs:
-            text = para.text.strip()
+        for para in reader.paragraphs():
+            raise_if_cancelled(cancel_token)
+            text = self._sanitize_text_content(para.text)
             if not text:
                 continue
                 
             # Detect titles/headings for new slides
             is_heading = (
-                para.style.name.startswith('Heading') or
-                para.style.name == 'Title' or
+                para.style.startswith('Heading') or
+                para.style == 'Title' or
                 (len(text) < 100 and (text.isupper() or text.istitle()))
             )
             
@@ -311,10 +747,10 @@ class FileConverter:
             self._create_slide(prs, title, content)
             slides_created += 1
         
-        # If no slides created, create a summary slide
+        # If no slides created, the document has no text: create a summary slide
         if slides_created == 0:
-            all_content = [p.text for p in doc.paragraphs if p.text.strip()]
-            self._create_slide(prs, Path(enet_path).stem, all_content[:10])  # Limit content
+            title = self._sanitize_text_content(reader.core_properties()['title']) or "Document Summary"
+            self._create_slide(prs, title, [])
             slides_created = 1
             
         return slides_created
@@ -342,406 +778,1137 @@ class FileConverter:
                         p = text_frame.add_paragraph()
                         p.text = content[:200]
                         
-    def ppt_to_word(self, input_path, output_dir):
+    @_timed_conversion
+    def ppt_to_word(self, input_path, output_dir, cancel_token=None):
         """Convert PowerPoint to Word document with enhanced formatting"""
         try:
             input_path = Path(input_path)
             output_path = Path(output_dir) / f"{input_path.stem}_converted.docx"
             
             self.logger.info(f"Converting PowerPoint to Word: {input_path}")
+            
+            # Not cached: the document records when it was converted, which a hit would get wrong
             self.update_progress(10, "Loading PowerPoint presentation...")
+            self.metrics.stage('load')
             
             # Read PowerPoint presentation
-            prs = Presentation(str(input_path))
+            prs = backends.get('pptx').Presentation(str(input_path))
             
             self.update_progress(30, "Creating Word document...")
             
             # Create Word document
-            doc = Document()
+            doc = backends.get('docx').Document()
+            slide_count = len(prs.slides)
             
             # Add title page
             doc.add_heading(f"Converted from {input_path.name}", 0)
             doc.add_paragraph(f"Conversion date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            doc.add_paragraph(f"Total slides: {len(prs.slides)}")
+            doc.add_paragraph(f"Total slides: {slide_count}")
             doc.add_page_break()
             
             self.update_progress(50, "Processing slides...")
+            self.metrics.stage('extract_text')
+            
+            heading_style = doc.part.get_style_id('Heading 1', backends.get('docx.enum.style').WD_STYLE_TYPE.PARAGRAPH)
+            progress_every = max(1, slide_count // 100)
             
             for i, slide in enumerate(prs.slides):
-                self.update_progress(50 + (30 * i / len(prs.slides)), f"Processing slide {i+1}...")
+                raise_if_cancelled(cancel_token)
+                if i % progress_every == 0:
+                    self.update_progress(50 + (30 * i / slide_count), f"Processing slide {i+1}...")
                 
-                # Add slide header
-                doc.add_heading(f"Slide {i + 1}", level=1)
+                # Slide header, content and separator are added as one batch
+                paragraphs = [_new_paragraph(f"Slide {i + 1}", heading_style)]
                 
-                # Extract text from all shapes
+                # Extract text from all shapes, one pass over each paragraph's runs
                 slide_content = []
-                
                 for shape in slide.shapes:
-                    if hasattr(shape, "text") and shape.text.strip():
-                        try:
-                            # Clean and sanitize text content
-                            text_content = shape.text.strip()
-                            # Remove or replace problematic characters
-                            text_content = self._sanitize_text_content(text_content)
-                            
-                            if hasattr(shape, "text_frame") and shape.text_frame:
-                                # Handle text frames with multiple paragraphs
-                                for paragraph in shape.text_frame.paragraphs:
-                                    if paragraph.text.strip():
-                                        para_text = self._sanitize_text_content(paragraph.text.strip())
-                                        if para_text:
-                                            slide_content.append(para_text)
-                            else:
-                                if text_content:
-                                    slide_content.append(text_content)
-                        except Exception as e:
-                            self.logger.warning(f"Error processing shape text: {str(e)}")
-                            continue
+                    try:
+                        for text in _shape_paragraph_texts(shape):
+                            text = self._sanitize_text_content(text.strip())
+                            if text:
+                                slide_content.append(text)
+                    except Exception as e:
+                        self.logger.warning(f"Error processing shape text: {str(e)}")
+                        continue
                 
                 # Add content to document
                 if slide_content:
                     for content in slide_content:
                         try:
-                            # Add paragraph with error handling
-                            doc.add_paragraph(content)
+                            paragraphs.append(_new_paragraph(content))
                         except Exception as e:
                             self.logger.warning(f"Error adding paragraph: {str(e)}")
                             # Add a safe fallback
-                            doc.add_paragraph("[Content could not be processed]")
+                            paragraphs.append(_new_paragraph("[Content could not be processed]"))
                 else:
-                    doc.add_paragraph("[No text content found in this slide]")
+                    paragraphs.append(_new_paragraph("[No text content found in this slide]"))
                 
                 # Add separator except for last slide
-                if i < len(prs.slides) - 1:
-                    doc.add_paragraph("─" * 50)
+                if i < slide_count - 1:
+                    paragraphs.append(_new_paragraph("─" * 50))
+                
+                _append_paragraphs(doc, paragraphs)
             
+            raise_if_cancelled(cancel_token)
             self.update_progress(90, "Saving Word document...")
+            self.metrics.stage('save')
             doc.save(str(output_path))
             
             self.update_progress(100, "PowerPoint to Word conversion completed!")
             self.logger.info(f"Conversion completed: {output_path}")
             return str(output_path)
             
+        except ConversionCancelled as e:
+            self.logger.warning(f"PowerPoint to Word conversion stopped: {str(e)}")
+            raise
         except Exception as e:
             self.logger.error(f"Error converting PowerPoint to Word: {str(e)}")
             raise Exception(f"PowerPoint to Word conversion failed: {str(e)}")
             
     def _sanitize_text_content(self, text):
         """Sanitize text content to remove problematic characters"""
-        if not text:
-            return ""
-            
-        try:
-            # Remove null bytes and control characters
-            text = text.replace('\x00', '')
-            
-            # Replace problematic Unicode characters
-            text = text.encode('utf-8', errors='ignore').decode('utf-8')
-            
-            # Remove or replace other problematic characters
-            problematic_chars = {
-                '\x01': '',
-                '\x02': '',
-                '\x03': '',
-                '\x04': '',
-                '\x05': '',
-                '\x06': '',
-                '\x07': '',
-                '\x08': '',
-                '\x0b': '',
-                '\x0c': '',
-                '\x0e': '',
-                '\x0f': '',
-                '\x10': '',
-                '\x11': '',
-                '\x12': '',
-                '\x13': '',
-                '\x14': '',
-                '\x15': '',
-                '\x16': '',
-                '\x17': '',
-                '\x18': '',
-                '\x19': '',
-                '\x1a': '',
-                '\x1b': '',
-                '\x1c': '',
-                '\x1d': '',
-                '\x1e': '',
-                '\x1f': ''
-            }
-            
-            for char, replacement in problematic_chars.items():
-                text = text.replace(char, replacement)
-            
-            # Ensure text is properly formatted
-            text = ' '.join(text.split())  # Normalize whitespace
-            
-            return text
-            
-        except Exception as e:
-            self.logger.warning(f"Error sanitizing text: {str(e)}")
-            return "[Text processing error]"
-            
-    def image_to_pdf(self, input_path, output_dir):
-        """Convert image to PDF with quality enhancement"""
+        return sanitize_text(text)
+        
+    @_timed_conversion
+    def image_to_pdf(self, input_path, output_dir, passthrough=True, cancel_token=None):
+        """Convert image to PDF with quality enhancement
+        
+        With passthrough, images PDF can already hold (and that need no
+        downscaling) are embedded losslessly instead of being re-encoded.
+        """
         try:
             input_path = Path(input_path)
             output_path = Path(output_dir) / f"{input_path.stem}_converted.pdf"
             
             self.logger.info(f"Converting Image to PDF: {input_path}")
-            self.update_progress(10, "Loading image...")
             
-            # Open and process image
-            with Image.open(str(input_path)) as img:
-                self.update_progress(30, "Processing image...")
-                
-                # Get original format and size
-                original_format = img.format
-                original_size = img.size
-                
-                # Convert to RGB if necessary
-                if img.mode in ('RGBA', 'LA'):
-                    # Handle transparency by adding white background
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'RGBA':
-                        background.paste(img, mask=img.split()[-1])
-                    else:
-                        background.paste(img)
-                    img = background
-                elif img.mode not in ('RGB', 'L'):
-                    img = img.convert('RGB')
-                
-                self.update_progress(50, "Enhancing image quality...")
-                
-                # Apply quality enhancements
-                img = self._enhance_image_quality(img)
-                
-                self.update_progress(70, "Creating PDF...")
-                
-                # Optimize image size for PDF
-                max_size = (2000, 2000)  # Maximum dimensions
-                if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
-                    img.thumbnail(max_size, Image.Resampling.LANCZOS)
-                
-                # Save as temporary high-quality image
-                temp_dir = Path(tempfile.mkdtemp())
-                temp_image_path = temp_dir / f"optimized_{input_path.stem}.jpg"
-                
-                img.save(str(temp_image_path), 'JPEG', quality=95, optimize=True)
-                
-                self.update_progress(90, "Converting to PDF...")
-                
-                # Convert to PDF using img2pdf with optimized settings
-                with open(str(output_path), "wb") as f:
-                    # Create PDF with proper page size
-                    pdf_bytes = img2pdf.convert(
-                        str(temp_image_path),
-                        layout_fun=img2pdf.get_layout_fun((img2pdf.mm_to_pt(210), img2pdf.mm_to_pt(297)))  # A4
-                    )
-                    f.write(pdf_bytes)
+            cache_key, cached = self._check_cache(
+                'image_to_pdf', input_path, output_path, dict(IMAGE_PDF_OPTIONS, passthrough=passthrough)
+            )
+            if cached:
+                return str(output_path)
                 
-                # Clean up temporary file
-                temp_image_path.unlink()
-                temp_dir.rmdir()
+            self.update_progress(10, "Loading image...")
             
+            page = self._prepare_image_page(input_path, passthrough)
+            
+            raise_if_cancelled(cancel_token)
+            self.update_progress(90, "Converting to PDF...")
+            self.metrics.stage('write')
+            
+            self._write_image_pdf(output_path, [page])
+            
+            self._store_in_cache(cache_key, output_path)
             self.update_progress(100, "Image to PDF conversion completed!")
             self.logger.info(f"Conversion completed: {output_path}")
             return str(output_path)
             
+        except ConversionCancelled as e:
+            self.logger.warning(f"Image to PDF conversion stopped: {str(e)}")
+            raise
         except Exception as e:
             self.logger.error(f"Error converting Image to PDF: {str(e)}")
             raise Exception(f"Image to PDF conversion failed: {str(e)}")
             
-    def multi_image_to_pdf(self, image_paths, output_dir):
-        """Convert multiple images to a single PDF with enhanced processing"""
+    @_timed_conversion
+    def multi_image_to_pdf(self, image_paths, output_dir, window=4, passthrough=True, cancel_token=None):
+        """Convert multiple images to a single PDF with enhanced processing
+        
+        Images are processed in memory, at most `window` at a time, and each
+        finished page is streamed straight into the output file. Passthrough
+        works as in image_to_pdf. A cancelled job leaves no partial PDF behind.
+        """
         try:
             if not image_paths:
                 raise Exception("No images provided for conversion")
                 
-            # Create output filename based on first image
-            first_image = Path(image_paths[0])
             output_path = Path(output_dir) / f"multi_image_converted_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+            total = len(image_paths)
             
-            self.logger.info(f"Converting {len(image_paths)} images to PDF")
-            self.update_progress(5, f"Processing {len(image_paths)} images...")
-            
-            processed_images = []
-            temp_dir = Path(tempfile.mkdtemp())
+            self.logger.info(f"Converting {total} images to PDF")
+            self.update_progress(5, f"Processing {total} images...")
+            # Decoding, enhancing and writing overlap, so they share one stage
+            self.metrics.stage('process_and_write', images=total)
             
-            try:
-                for i, image_path in enumerate(image_paths):
-                    progress = 10 + (70 * i / len(image_paths))
-                    self.update_progress(progress, f"Processing image {i+1}/{len(image_paths)}...")
-                    
-                    # Process each image
-                    with Image.open(str(image_path)) as img:
-                        # Convert to RGB if necessary
-                        if img.mode in ('RGBA', 'LA'):
-                            background = Image.new('RGB', img.size, (255, 255, 255))
-                            if img.mode == 'RGBA':
-                                background.paste(img, mask=img.split()[-1])
-                            else:
-                                background.paste(img)
-                            img = background
-                        elif img.mode not in ('RGB', 'L'):
-                            img = img.convert('RGB')
-                        
-                        # Apply quality enhancements
-                        img = self._enhance_image_quality(img)
-                        
-                        # Optimize size
-                        max_size = (2000, 2000)
-                        if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
-                            img.thumbnail(max_size, Image.Resampling.LANCZOS)
-                        
-                        # Save processed image
-                        temp_image_path = temp_dir / f"processed_{i:03d}.jpg"
-                        img.save(str(temp_image_path), 'JPEG', quality=95, optimize=True)
-                        processed_images.append(str(temp_image_path))
+            def report(i):
+                self.update_progress(10 + (80 * i / total), f"Processing image {i+1}/{total}...")
                 
-                self.update_progress(85, "Creating PDF from processed images...")
-                
-                # Convert all processed images to PDF
-                with open(str(output_path), "wb") as f:
-                    pdf_bytes = img2pdf.convert(
-                        processed_images,
-                        layout_fun=img2pdf.get_layout_fun((img2pdf.mm_to_pt(210), img2pdf.mm_to_pt(297)))
-                    )
-                    f.write(pdf_bytes)
-                
-                self.update_progress(100, f"Multi-image PDF created with {len(image_paths)} images!")
-                
-            finally:
-                # Clean up temporary files
-                for temp_file in processed_images:
-                    try:
-                        Path(temp_file).unlink()
-                    except:
-                        pass
-                try:
-                    temp_dir.rmdir()
-                except:
-                    pass
+            self._write_image_pdf(
+                output_path, self._iter_image_pages(image_paths, window, passthrough, report, cancel_token)
+            )
             
+            self.update_progress(100, f"Multi-image PDF created with {total} images!")
             self.logger.info(f"Multi-image conversion completed: {output_path}")
             return str(output_path)
             
+        except ConversionCancelled as e:
+            self.logger.warning(f"Multi-image to PDF conversion stopped: {str(e)}")
+            raise
         except Exception as e:
             self.logger.error(f"Error converting multiple images to PDF: {str(e)}")
             raise Exception(f"Multi-image to PDF conversion failed: {str(e)}")
             
-    def _enhance_image_quality(self, img):
-        """Enhance image quality for better PDF output"""
-        try:
-            # Sharpen the image slightly
-            enhancer = ImageEnhance.Sharpness(img)
-            img = enhancer.enhance(1.1)
+    def _iter_image_pages(self, image_paths, window, passthrough=True, report=None, cancel_token=None):
+        """Yield processed pages in order while keeping at most `window` in flight"""
+        from concurrent.futures import ThreadPoolExecutor
+        from collections import deque
+        
+        window = max(1, window)
+        pending = deque()
+        
+        # Pillow releases the GIL while decoding, filtering and encoding, so a
+        # few threads overlap the work of neighbouring images
+        with ThreadPoolExecutor(max_workers=min(window, os.cpu_count() or 1)) as pool:
+            try:
+                for i, image_path in enumerate(image_paths):
+                    raise_if_cancelled(cancel_token)
+                    if len(pending) >= window:
+                        yield pending.popleft().result()
+                    pending.append(pool.submit(self._prepare_image_page, image_path, passthrough))
+                    if report:
+                        report(i)
+                        
+                while pending:
+                    raise_if_cancelled(cancel_token)
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+            
+    def _prepare_image_page(self, image_path, passthrough=True):
+        """Produce one PDF page image in memory
+        
+        Returns (data, width, height, image_params) for ImagePdfWriter. The
+        original bytes are used when passthrough allows it; otherwise the
+        image is decoded, cleaned up and JPEG-encoded.
+        """
+        from image_pdf_writer import jpeg_params
+        
+        Image = backends.get('PIL.Image')
+        
+        # Stages only register on the converting thread, not in multi-image workers
+        self.metrics.stage('decode')
+        with Image.open(str(image_path)) as img:
+            if passthrough:
+                page = self._passthrough_page(img, image_path)
+                if page is not None:
+                    return page
+                    
+            # Shrink oversized images while decoding, before any other work
+            max_size = IMAGE_PDF_OPTIONS['max_size']
+            img = self._reduce_on_decode(img, max_size)
+            
+            # Convert to RGB if necessary
+            if img.mode in ('RGBA', 'LA'):
+                # Handle transparency by adding white background
+                background = Image.new('RGB', img.size, (255, 255, 255))
+                if img.mode == 'RGBA':
+                    background.paste(img, mask=img.split()[-1])
+                else:
+                    background.paste(img)
+                img = background
+            elif img.mode not in ('RGB', 'L'):
+                img = img.convert('RGB')
+            
+            # Apply quality enhancements
+            self.metrics.stage('enhance')
+            img = self._enhance_image_quality(img)
+            
+            # Final resize to the page image size
+            self.metrics.stage('encode')
+            if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
+                img.thumbnail(max_size, Image.Resampling.LANCZOS)
+            
+            buffer = io.BytesIO()
+            img.save(buffer, 'JPEG', quality=IMAGE_PDF_OPTIONS['jpeg_quality'], optimize=True)
+            return buffer.getvalue(), img.size[0], img.size[1], jpeg_params(img.mode)
+            
+    def _reduce_on_decode(self, img, max_size):
+        """Decode an oversized image at a fraction of its resolution
+        
+        JPEGs are decoded with DCT scaling (1/2, 1/4 or 1/8) straight to at
+        least the final size. Other formats are reduced by power-of-two box
+        sampling while staying at least twice the final size, leaving the
+        last LANCZOS step enough detail.
+        """
+        width, height = img.size
+        if width <= max_size[0] and height <= max_size[1]:
+            return img
             
-            # Enhance contrast slightly
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(1.05)
+        scale = min(max_size[0] / width, max_size[1] / height)
+        target = (max(1, int(width * scale)), max(1, int(height * scale)))
+        
+        if img.format == 'JPEG' and img.mode in ('L', 'RGB', 'CMYK'):
+            img.draft(img.mode, target)
             
-            # Enhance brightness if too dark
-            enhancer = ImageEnhance.Brightness(img)
-            img = enhancer.enhance(1.02)
+        factor = 1
+        while (img.size[0] // (factor * 2) >= target[0] * 2 and
+               img.size[1] // (factor * 2) >= target[1] * 2):
+            factor *= 2
+        if factor > 1:
+            img = img.reduce(factor)
             
-            return img
+        return img
+        
+    def _passthrough_page(self, img, image_path):
+        """Embed an opened image without re-encoding, or None if it needs processing"""
+        from image_pdf_writer import jpeg_params, png_embedding
+        
+        # Oversized images still go through the resizing path
+        max_size = IMAGE_PDF_OPTIONS['max_size']
+        if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
+            return None
+            
+        width, height = img.size
+        colorspaces = {'L': '/DeviceGray', 'RGB': '/DeviceRGB'}
+        
+        if img.format == 'JPEG' and img.mode in ('L', 'RGB', 'CMYK'):
+            inverted = img.mode == 'CMYK' and 'adobe' in img.info
+            return Path(image_path).read_bytes(), width, height, jpeg_params(img.mode, inverted)
+            
+        if img.format == 'JPEG2000' and img.mode in colorspaces:
+            params = {'colorspace': colorspaces[img.mode], 'filter_name': '/JPXDecode'}
+            return Path(image_path).read_bytes(), width, height, params
+            
+        if img.format == 'PNG':
+            return png_embedding(Path(image_path).read_bytes())
+            
+        if img.format == 'TIFF' and img.mode in colorspaces and getattr(img, 'n_frames', 1) == 1:
+            # TIFF codecs have no PDF filter equivalent; keep the pixels lossless with Flate
+            params = {'colorspace': colorspaces[img.mode], 'filter_name': '/FlateDecode'}
+            return zlib.compress(img.tobytes(), 6), width, height, params
+            
+        return None
+            
+    def _write_image_pdf(self, output_path, pages):
+        """Stream pages into output_path, removing the file if anything fails"""
+        from image_pdf_writer import ImagePdfWriter, mm_to_pt
+        
+        width_mm, height_mm = IMAGE_PDF_OPTIONS['page_size_mm']
+        try:
+            with open(str(output_path), "wb") as f:
+                writer = ImagePdfWriter(f, (mm_to_pt(width_mm), mm_to_pt(height_mm)))
+                for data, width, height, params in pages:
+                    writer.add_image(data, width, height, **params)
+                writer.close()
+        except BaseException:
+            Path(output_path).unlink(missing_ok=True)
+            raise
+            
+    def _enhance_image_quality(self, img):
+        """Enhance image quality for better PDF output
+        
+        Equivalent to ImageEnhance Sharpness(1.1), Contrast(1.05) and
+        Brightness(1.02) applied in turn, fused into one 3x3 convolution and
+        one lookup table so only two full-size images are allocated.
+        """
+        try:
+            ImageFilter = backends.get('PIL.ImageFilter')
+            
+            # Sharpness blends the image with its SMOOTH-filtered copy; both
+            # are linear, so the blend is a single kernel
+            smooth = (1, 1, 1, 1, 5, 1, 1, 1, 1)
+            weights = [
+                ENHANCE_SHARPNESS * (1 if i == 4 else 0) + (1 - ENHANCE_SHARPNESS) * w / 13
+                for i, w in enumerate(smooth)
+            ]
+            # (the -0.5 offset matches the truncation ImageEnhance's blend does)
+            img = img.filter(ImageFilter.Kernel((3, 3), weights, scale=1, offset=-0.5))
+            
+            # Contrast pivots around the mean grey level; sharpening keeps the
+            # mean, so it can be taken from the histogram of the result
+            return img.point(_contrast_brightness_lut(img) * len(img.getbands()))
             
         except Exception:
             # Return original if enhancement fails
             return img
             
     def get_file_info(self, file_path):
-        """Get comprehensive file information"""
+        """Get comprehensive file information
+        
+        Results are cached until the file's size or modification time changes.
+        """
+        return dict(self.metadata_cache.get(file_path, self._read_file_info))
+        
+    def _read_file_info(self, file_path, stat):
         file_path = Path(file_path)
         
         info = {
             'name': file_path.name,
-            'size': file_path.stat().st_size,
+            'size': stat.st_size,
             'extension': file_path.suffix,
-            'modified': datetime.fromtimestamp(file_path.stat().st_mtime),
+            'modified': datetime.fromtimestamp(stat.st_mtime),
             'type': 'Unknown'
         }
         
-        # Determine file type and get specific information
+        # Determine file type and get specific information. The fast probes read
+        # only headers and metadata parts, so this stays quick for huge files.
         try:
-            if file_path.suffix.lower() == '.pdf':
-                from pypdf import PdfReader
-                reader = PdfReader(str(file_path))
-                info.update({
-                    'type': 'PDF Document',
-                    'pages': len(reader.pages),
-                    'encrypted': reader.is_encrypted,
-                    'metadata': reader.metadata if reader.metadata else {}
-                })
-                
-            elif file_path.suffix.lower() in ['.docx', '.doc']:
-                doc = Document(str(file_path))
-                info.update({
-                    'type': 'Word Document',
-                    'paragraphs': len([p for p in doc.paragraphs if p.text.strip()]),
-                    'core_properties': {
-                        'title': doc.core_properties.title,
-                        'author': doc.core_properties.author,
-                        'subject': doc.core_properties.subject
-                    }
-                })
-                
-            elif file_path.suffix.lower() in ['.pptx', '.ppt']:
-                prs = Presentation(str(file_path))
-                info.update({
-                    'type': 'PowerPoint Presentation',
-                    'slides': len(prs.slides)
-                })
-                
-            elif file_path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp']:
-                with Image.open(str(file_path)) as img:
+            if file_path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp']:
+                # Image.open only reads the header until pixel data is needed
+                with backends.get('PIL.Image').open(str(file_path)) as img:
                     info.update({
                         'type': 'Image File',
                         'dimensions': f"{img.width} x {img.height}",
                         'mode': img.mode,
                         'format': img.format
                     })
+            else:
+                info.update(self._probe_file_info(file_path))
                     
         except Exception as e:
             self.logger.warning(f"Could not get detailed info for {file_path}: {str(e)}")
         
         return info
         
-    def batch_convert(self, file_list, conversion_type, output_dir, progress_callback=None):
-        """Convert multiple files with progress tracking"""
+    def _probe_file_info(self, file_path):
+        """Type-specific info from document_probe, falling back to pypdf for PDFs"""
+        from document_probe import probe_file
+        
+        try:
+            return probe_file(file_path)
+        except Exception as e:
+            if file_path.suffix.lower() != '.pdf':
+                raise
+            # PyMuPDF missing, or a file only pypdf's parser gets through
+            self.logger.debug(f"PyMuPDF probe failed for {file_path}, trying pypdf: {str(e)}")
+        
+        reader = backends.get('pypdf').PdfReader(str(file_path))
+        return {
+            'type': 'PDF Document',
+            'pages': len(reader.pages),
+            'encrypted': reader.is_encrypted,
+            'metadata': reader.metadata if reader.metadata else {}
+        }
+        
+    def convert_file(self, file_path, conversion_type, output_dir, cancel_token=None, **options):
+        """Run a single conversion and describe its outcome as a result dict
+        
+        For multi_image_to_pdf, file_path is the list of images. options are
+        passed on to the conversion method, e.g. workers and pages_per_shard
+        for pdf_to_word.
+        """
+        result = _new_result(file_path, conversion_type)
+        hits_before = self.cache.hits if self.cache is not None else 0
+        span_before = self.metrics.last_finished()
+        peak_mark = begin_peak_rss()
+        start = time.perf_counter()
+        
+        try:
+            if conversion_type not in CONVERSION_TYPES:
+                raise Exception(f"Unsupported conversion type: {conversion_type}")
+            if (conversion_type == 'multi_image_to_pdf') != isinstance(file_path, (list, tuple)):
+                raise Exception(
+                    "multi_image_to_pdf takes a list of image paths"
+                    if conversion_type == 'multi_image_to_pdf'
+                    else f"{conversion_type} takes a single file path"
+                )
+            raise_if_cancelled(cancel_token)
+            result['output'] = getattr(self, conversion_type)(
+                file_path, output_dir, cancel_token=cancel_token, **options
+            )
+        except ConversionTimeout as e:
+            result['error'] = str(e)
+            result['timed_out'] = True
+        except ConversionCancelled as e:
+            result['error'] = str(e)
+            result['cancelled'] = True
+        except Exception as e:
+            result['error'] = str(e)
+            self.logger.error(f"Failed to convert {file_path}: {str(e)}")
+        
+        result['wall_time'] = time.perf_counter() - start
+        # Peak of this process while the file converted; None where that cannot be measured
+        result['peak_rss'] = end_peak_rss(peak_mark) if peak_mark is not None else None
+        result['cache_hit'] = self.cache is not None and self.cache.hits > hits_before
+        span = self.metrics.last_finished()
+        if span is not None and span is not span_before:
+            result['stages'] = {name: round(seconds, 6) for name, seconds in span.stages.items()}
+            if span.memory is not None:
+                result['memory'] = dict(span.memory, stages=span.stage_memory)
+        return result
+        
+    def convert_isolated(self, file_path, conversion_type, output_dir, timeout=None,
+                         cancel_token=None, progress_callback=None, **options):
+        """Run convert_file in a separate process that is killed when it overruns
+        
+        Unlike cancel_token checks, this also stops conversions stuck inside a
+        native library (e.g. a malformed PDF hanging PyMuPDF). A killed job
+        may leave a partial output file behind. Returns the same result dict
+        as convert_file; options are passed on as in convert_file.
+        """
+        import multiprocessing
+        import queue
+        
+        report = progress_callback or self.update_progress
+        ctx = multiprocessing.get_context()
+        events = ctx.Queue()
+        process = ctx.Process(
+            target=_run_isolated_job,
+            args=(events, file_path, conversion_type, str(output_dir), self._cache_config(), self._memory_top(),
+                  options),
+            # Not a daemon, so a sharded pdf_to_word can start its own workers; it is always reaped below
+            daemon=False
+        )
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        start = time.perf_counter()
+        result = None
+        stop_reason = None
+        
+        process.start()
+        try:
+            while result is None:
+                # Checked on every event, so a worker flooding progress is still stopped
+                if cancel_token is not None and cancel_token.cancel_requested:
+                    stop_reason = 'cancelled'
+                    break
+                if (deadline is not None and time.monotonic() >= deadline) or (
+                    cancel_token is not None and cancel_token.timed_out
+                ):
+                    stop_reason = 'timed_out'
+                    break
+                    
+                try:
+                    event = events.get(timeout=0.2)
+                except queue.Empty:
+                    if process.is_alive():
+                        continue
+                    # It may have posted its result just before exiting
+                    try:
+                        event = events.get(timeout=0.5)
+                    except queue.Empty:
+                        break
+                        
+                if event[0] == 'progress':
+                    report(event[1], event[2])
+                else:
+                    result = event[1]
+        finally:
+            if process.is_alive():
+                process.terminate()
+                process.join(2)
+                if process.is_alive():
+                    process.kill()
+            process.join()
+            events.close()
+            
+        if result is None:
+            result = _new_result(file_path, conversion_type)
+            result['wall_time'] = time.perf_counter() - start
+            if stop_reason == 'cancelled':
+                result['error'] = "Conversion cancelled"
+                result['cancelled'] = True
+            elif stop_reason == 'timed_out':
+                limit = timeout if timeout is not None else cancel_token.timeout
+                result['error'] = f"Conversion timed out after {limit:g}s (worker killed)"
+                result['timed_out'] = True
+            else:
+                result['error'] = f"Worker process exited with code {process.exitcode}"
+            self.logger.error(f"Failed to convert {file_path}: {result['error']}")
+            
+        if self.cache is not None:
+            if result['cache_hit']:
+                self.cache.hits += 1
+            else:
+                self.cache.misses += 1
+        if result['stages']:
+            self.metrics.record_stages(conversion_type, result['stages'], total=result['wall_time'])
+        return result
+        
+    def _cache_config(self):
+        """Arguments for re-opening this converter's cache in another process"""
+        if self.cache is None:
+            return None
+        return (str(self.cache.cache_dir), self.cache.max_bytes, self.cache.use_hardlinks)
+        
+    def batch_convert(self, file_list, conversion_type, output_dir, progress_callback=None, workers=1,
+                      timeout=None, cancel_token=None, options=None):
+        """Convert multiple files, optionally in parallel worker processes
+        
+        Returns one result dict per input file, in input order, holding the
+        output path, error message, wall time and the peak RSS of the process
+        while it converted (None where that cannot be told apart per file). With a timeout (seconds per file) every file runs in its
+        own process via convert_isolated so a hung conversion can be killed.
+        Without one, word_to_pdf batches go to the LibreOffice pool when it
+        is running, min(workers, pool size) files at a time; otherwise files
+        LibreOffice handles are converted a few dozen per soffice run,
+        whatever `workers`.
+        Once cancel_token trips, files not yet started are reported cancelled
+        and running ones stop at their next page, slide or image. options
+        are keyword arguments for the conversion method of every file (see
+        convert_file).
+        """
+        file_list = [str(f) for f in file_list]
+        total_files = len(file_list)
+        options = options or {}
+        
+        if conversion_type not in BATCH_CONVERSIONS:
+            # Rejected per file, as each conversion would be
+            results = []
+            for file_path in file_list:
+                result = _new_result(file_path, conversion_type)
+                result['error'] = f"Unsupported conversion type: {conversion_type}"
+                results.append(result)
+        elif timeout is not None:
+            results = self._batch_convert_isolated(
+                file_list, conversion_type, output_dir, progress_callback, workers, timeout, cancel_token, options
+            )
+        elif (conversion_type == 'word_to_pdf' and total_files > 1 and self.libreoffice_pool is None
+              and word_pdf_methods.soffice is not None):
+            results = self._batch_word_to_pdf_libreoffice(file_list, output_dir, progress_callback, cancel_token)
+        elif conversion_type == 'word_to_pdf' and self.libreoffice_pool is not None and total_files > 1:
+            # Worker processes cannot reach this process's LibreOffice pool, so threads feed it
+            results = self._batch_word_to_pdf_pool(file_list, output_dir, progress_callback, workers, cancel_token)
+        elif workers and workers > 1 and total_files > 1:
+            results = self._batch_convert_parallel(
+                file_list, conversion_type, output_dir, progress_callback, workers, cancel_token, options
+            )
+        else:
+            results = self._batch_convert_serial(
+                file_list, conversion_type, output_dir, progress_callback, cancel_token, options
+            )
+        
+        failed = sum(1 for r in results if r['error'])
+        self.logger.info(
+            f"Batch {conversion_type} finished: {total_files - failed} successful, {failed} failed"
+        )
+        if progress_callback:
+            progress_callback(100, f"Batch conversion completed! {total_files - failed} successful, {failed} failed")
+            
+        return results
+        
+    def _batch_convert_serial(self, file_list, conversion_type, output_dir, progress_callback, cancel_token=None,
+                              options=None):
+        """Convert files one after another in this process"""
         results = []
-        failed_files = []
         total_files = len(file_list)
         
         for i, file_path in enumerate(file_list):
-            try:
-                if progress_callback:
-                    progress_callback(
-                        (i / total_files) * 100, 
-                        f"Converting {Path(file_path).name}... ({i+1}/{total_files})"
+            name = Path(file_path).name
+            file_callback = None
+            if progress_callback:
+                progress_callback(
+                    (i / total_files) * 100, 
+                    f"Converting {name}... ({i+1}/{total_files})"
+                )
+                # Scale this file's progress into its share of the batch
+                file_callback = (
+                    lambda pct, msg="", i=i, name=name: progress_callback(
+                        (i + pct / 100) / total_files * 100,
+                        f"{name}: {msg} ({i+1}/{total_files})"
                     )
+                )
                 
-                if conversion_type == "pdf_to_word":
-                    result = self.pdf_to_word(file_path, output_dir)
-                elif conversion_type == "word_to_pdf":
-                    result = self.word_to_pdf(file_path, output_dir)
-                elif conversion_type == "word_to_ppt":
-                    result = self.word_to_ppt(file_path, output_dir)
-                elif conversion_type == "ppt_to_word":
-                    result = self.ppt_to_word(file_path, output_dir)
-                elif conversion_type == "image_to_pdf":
-                    result = self.image_to_pdf(file_path, output_dir)
+            with self.progress_scope(file_callback or (lambda pct, msg="": None)):
+                results.append(
+                    self.convert_file(file_path, conversion_type, output_dir, cancel_token, **(options or {}))
+                )
+            
+        return results
+        
+    def _batch_word_to_pdf_libreoffice(self, file_list, output_dir, progress_callback, cancel_token=None):
+        """Convert Word files with a few multi-document soffice runs instead of one per file
+        
+        Each run converts into a scratch directory and its PDFs are mapped
+        back to their inputs by name, so inputs sharing a stem go to
+        different runs. Files LibreOffice is not the first choice for, and
+        files a run did not produce a PDF for, then go through convert_file
+        one at a time, which tries the remaining methods and reports a
+        per-file error. After a run times out, its unproduced files are
+        retried that way too, so only a document that also hangs or fails on
+        its own falls back to the reportlab layout.
+        """
+        import subprocess
+        
+        total_files = len(file_list)
+        output_dir = Path(output_dir)
+        results = [None] * total_files
+        pending = []
+        
+        # Cache hits report 100% for their file; keep that out of the batch progress
+        with self.progress_scope(lambda pct, msg="": None):
+            for i, file_path in enumerate(file_list):
+                input_path = Path(file_path)
+                methods = word_pdf_methods.methods_for(input_path.suffix)
+                if not methods or methods[0] != 'libreoffice' or not input_path.is_file():
+                    continue
+                output_path = output_dir / f"{input_path.stem}_converted.pdf"
+                start = time.perf_counter()
+                cache_key, cached = self._check_cache('word_to_pdf', input_path, output_path)
+                if cached:
+                    results[i] = _new_result(file_path, 'word_to_pdf')
+                    results[i].update(
+                        output=str(output_path), cache_hit=True, wall_time=time.perf_counter() - start
+                    )
                 else:
-                    raise Exception(f"Unsupported conversion type: {conversion_type}")
-                
-                results.append(result)
+                    pending.append((i, input_path, cache_key))
+                    
+        try:
+            for batch in _libreoffice_batches(pending, LIBREOFFICE_BATCH_SIZE):
+                raise_if_cancelled(cancel_token)
+                if progress_callback:
+                    done = sum(1 for r in results if r is not None)
+                    progress_callback(
+                        done / total_files * 100,
+                        f"Converting {len(batch)} documents with LibreOffice... ({done}/{total_files})"
+                    )
+                    
+                with self.metrics.span('word_to_pdf_batch', input=f"{len(batch)} files") as span:
+                    self.metrics.stage('libreoffice')
+                    temp_dir = Path(tempfile.mkdtemp())
+                    try:
+                        try:
+                            _run_cancellable(
+                                [word_pdf_methods.soffice, '--headless', '--convert-to', 'pdf',
+                                 '--outdir', str(temp_dir)] + [str(input_path) for _, input_path, _ in batch],
+                                timeout=min(LIBREOFFICE_TIMEOUT * len(batch), LIBREOFFICE_BATCH_TIMEOUT),
+                                cancel_token=cancel_token
+                            )
+                        except subprocess.TimeoutExpired:
+                            self.logger.warning(f"LibreOffice batch of {len(batch)} documents timed out")
+                            
+                        self.metrics.stage('collect')
+                        for i, input_path, cache_key in batch:
+                            produced = temp_dir / f"{input_path.stem}.pdf"
+                            if not produced.exists():
+                                continue
+                            output_path = output_dir / f"{input_path.stem}_converted.pdf"
+                            shutil.move(str(produced), str(output_path))
+                            self._store_in_cache(cache_key, output_path)
+                            word_pdf_methods.record('libreoffice', input_path.suffix, True)
+                            results[i] = _new_result(file_list[i], 'word_to_pdf')
+                            results[i]['output'] = str(output_path)
+                    finally:
+                        shutil.rmtree(temp_dir, ignore_errors=True)
+                        
+                # The run's time is shared evenly by the documents it produced; its
+                # memory is soffice's, so peak_rss stays None
+                share = span.duration / len(batch)
+                stages = {name: round(seconds / len(batch), 6) for name, seconds in span.stages.items()}
+                for i, _, _ in batch:
+                    if results[i] is not None:
+                        results[i].update(wall_time=share, stages=dict(stages))
+                        
+        except ConversionCancelled as e:
+            hit_deadline = isinstance(e, ConversionTimeout)
+            for i in range(total_files):
+                if results[i] is None:
+                    results[i] = _new_result(file_list[i], 'word_to_pdf')
+                    results[i].update(error=str(e), cancelled=not hit_deadline, timed_out=hit_deadline)
+            return results
+            
+        leftover = [i for i in range(total_files) if results[i] is None]
+        if leftover:
+            self.logger.info(f"Converting {len(leftover)} of {total_files} documents one at a time")
+            scaled_callback = None
+            if progress_callback:
+                base = (total_files - len(leftover)) / total_files * 100
+                scaled_callback = (lambda pct, msg="":
+                                   progress_callback(base + pct * len(leftover) / total_files, msg))
+            single_results = self._batch_convert_serial(
+                [file_list[i] for i in leftover], 'word_to_pdf', output_dir, scaled_callback, cancel_token
+            )
+            for i, result in zip(leftover, single_results):
+                results[i] = result
                 
-            except Exception as e:
-                failed_files.append((file_path, str(e)))
-                self.logger.error(f"Failed to convert {file_path}: {str(e)}")
+        return results
         
-        if progress_callback:
-            progress_callback(100, f"Batch conversion completed! {len(results)} successful, {len(failed_files)} failed")
+    def _batch_convert_isolated(self, file_list, conversion_type, output_dir, progress_callback, workers,
+                                timeout, cancel_token=None, options=None):
+        """Convert each file in its own killable process, `workers` at a time"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        total_files = len(file_list)
+        file_progress = [0.0] * total_files
+        lock = threading.Lock()
+        
+        def report(i, percentage, message):
+            with lock:
+                file_progress[i] = min(percentage, 100) / 100
+                if progress_callback:
+                    progress_callback(
+                        sum(file_progress) / total_files * 100,
+                        f"{Path(file_list[i]).name}: {message}"
+                    )
+        
+        def run(i):
+            if cancel_token is not None and cancel_token.cancelled:
+                result = _new_result(file_list[i], conversion_type)
+                result['error'] = "Conversion cancelled"
+                result['cancelled'] = True
+            else:
+                result = self.convert_isolated(
+                    file_list[i], conversion_type, output_dir, timeout=timeout, cancel_token=cancel_token,
+                    progress_callback=lambda pct, msg="": report(i, pct, msg), **(options or {})
+                )
+            report(i, 100, "Cancelled" if result['cancelled'] else "Done")
+            return result
+        
+        self.logger.info(
+            f"Starting batch {conversion_type} of {total_files} files, {timeout:g}s limit per file"
+        )
+        with ThreadPoolExecutor(max_workers=max(1, min(workers or 1, total_files))) as pool:
+            return list(pool.map(run, range(total_files)))
+        
+    def _batch_word_to_pdf_pool(self, file_list, output_dir, progress_callback, workers, cancel_token=None):
+        """Convert Word files on the LibreOffice pool, up to min(workers, pool size) at a time"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        total_files = len(file_list)
+        file_progress = [0.0] * total_files
+        lock = threading.Lock()
+        
+        def report(i, percentage, message):
+            with lock:
+                file_progress[i] = min(percentage, 100) / 100
+                if progress_callback:
+                    progress_callback(
+                        sum(file_progress) / total_files * 100,
+                        f"{Path(file_list[i]).name}: {message}"
+                    )
+        
+        def run(i):
+            with self.progress_scope(lambda pct, msg="": report(i, pct, msg)):
+                result = self.convert_file(file_list[i], 'word_to_pdf', output_dir, cancel_token)
+            report(i, 100, "Cancelled" if result['cancelled'] else "Done")
+            return result
+        
+        threads = max(1, min(workers or 1, self.libreoffice_pool.size, total_files))
+        self.logger.info(f"Starting batch word_to_pdf of {total_files} files on {threads} LibreOffice instances")
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            return list(pool.map(run, range(total_files)))
+        
+    def _batch_convert_parallel(self, file_list, conversion_type, output_dir, progress_callback, workers,
+                                cancel_token=None, options=None):
+        """Convert files in a pool of worker processes with aggregated progress"""
+        from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+        import multiprocessing
+        
+        total_files = len(file_list)
+        workers = min(workers, total_files)
+        results = [None] * total_files
+        file_progress = [0.0] * total_files
+        completed = 0
+        
+        ctx = multiprocessing.get_context()
+        progress_queue = ctx.Queue()
+        # Set on cancel so running jobs stop at their next page, slide or image
+        cancel_event = ctx.Event()
+        
+        # Workers open the same on-disk cache as this converter
+        cache_config = self._cache_config()
+        
+        def report(message):
+            if progress_callback:
+                progress_callback(sum(file_progress) / total_files * 100, message)
+        
+        def drain_progress():
+            # Fold per-file updates from every worker into one batch percentage
+            while True:
+                event = progress_queue.get()
+                if event is None:
+                    break
+                index, percentage, message = event
+                if results[index] is None:
+                    file_progress[index] = min(percentage, 100) / 100
+                    report(f"{Path(file_list[index]).name}: {message} ({completed}/{total_files} done)")
+        
+        drain_thread = threading.Thread(target=drain_progress, daemon=True)
+        drain_thread.start()
+        
+        self.logger.info(f"Starting batch {conversion_type} of {total_files} files with {workers} workers")
+        
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=ctx,
+                initializer=_init_batch_worker,
+                initargs=(progress_queue, cache_config, self._memory_top(), cancel_event)
+            ) as pool:
+                futures = {
+                    pool.submit(_run_batch_job, i, file_path, conversion_type, str(output_dir), options): i
+                    for i, file_path in enumerate(file_list)
+                }
+                
+                remaining = set(futures)
+                while remaining:
+                    if cancel_token is not None and cancel_token.cancelled:
+                        # Queued jobs are dropped; running ones see the event and stop early
+                        cancel_event.set()
+                        for future in remaining:
+                            future.cancel()
+                    finished, remaining = wait(remaining, timeout=0.5, return_when=FIRST_COMPLETED)
+                    
+                    for future in finished:
+                        i = futures[future]
+                        if future.cancelled():
+                            results[i] = _new_result(file_list[i], conversion_type)
+                            results[i]['error'] = "Conversion cancelled"
+                            results[i]['cancelled'] = True
+                        else:
+                            try:
+                                results[i] = future.result()
+                            except Exception as e:
+                                # The worker itself died (e.g. a native library crashed)
+                                results[i] = _new_result(file_list[i], conversion_type)
+                                results[i]['error'] = f"Worker process failed: {str(e)}"
+                                self.logger.error(f"Failed to convert {file_list[i]}: {str(e)}")
+                        
+                        completed += 1
+                        file_progress[i] = 1.0
+                        report(f"Converted {Path(file_list[i]).name} ({completed}/{total_files} done)")
+        finally:
+            progress_queue.put(None)
+            drain_thread.join(timeout=5)
+            
+        # Stage timings were measured in the workers
+        for result in results:
+            if result['stages']:
+                self.metrics.record_stages(conversion_type, result['stages'], total=result['wall_time'])
+            
+        if self.cache is not None:
+            # Fold the workers' lookups into this converter's counters
+            for result in results:
+                if result['cache_hit']:
+                    self.cache.hits += 1
+                else:
+                    self.cache.misses += 1
             
-        return results, failed_files
\ No newline at end of file
+        return results
+
+
+# Enhancement factors applied to images converted to PDF
+ENHANCE_SHARPNESS = 1.1
+ENHANCE_CONTRAST = 1.05
+ENHANCE_BRIGHTNESS = 1.02
+
+
+def _contrast_brightness_lut(img):
+    """Point table applying contrast then brightness to each 8-bit band"""
+    band_means = []
+    histogram = img.histogram()
+    for band in range(len(img.getbands())):
+        counts = histogram[band * 256:(band + 1) * 256]
+        total = sum(counts) or 1
+        band_means.append(sum(value * count for value, count in enumerate(counts)) / total)
+    
+    # Same luma weights as convert("L"), which ImageEnhance.Contrast uses
+    if len(band_means) >= 3:
+        grey = band_means[0] * 0.299 + band_means[1] * 0.587 + band_means[2] * 0.114
+    else:
+        grey = band_means[0]
+    mean = int(grey + 0.5)
+    
+    lut = []
+    for value in range(256):
+        contrasted = min(255, max(0, int(mean + ENHANCE_CONTRAST * (value - mean))))
+        lut.append(min(255, max(0, int(ENHANCE_BRIGHTNESS * contrasted))))
+    return lut
+
+
+# Page range sizes used by sharded pdf_to_word
+MIN_PAGES_PER_SHARD = 8
+MAX_PAGES_PER_SHARD = 40
+
+
+def _parse_pdf_shard(pdf_path, start, end):
+    """Parse pages [start, end) of a PDF in a worker process
+    
+    Returns the parsed layout in pdf2docx's store() format, which the
+    parent restores before writing the document.
+    """
+    cv = backends.get('pdf2docx').Converter(pdf_path)
+    try:
+        settings = cv.default_settings
+        cv.load_pages(start, end)
+        cv.parse_document(**settings).parse_pages(**settings)
+        return cv.store()
+    finally:
+        cv.close()
+
+
+def _shape_paragraph_texts(shape):
+    """Text of every paragraph in a shape, descending into groups and tables"""
+    if getattr(shape, 'shape_type', None) == backends.get('pptx.enum.shapes').MSO_SHAPE_TYPE.GROUP:
+        for child in shape.shapes:
+            yield from _shape_paragraph_texts(child)
+    elif getattr(shape, 'has_table', False):
+        for row in shape.table.rows:
+            for cell in row.cells:
+                if not cell.is_spanned:
+                    for paragraph in cell.text_frame.paragraphs:
+                        yield paragraph.text
+    elif getattr(shape, 'has_text_frame', False):
+        for paragraph in shape.text_frame.paragraphs:
+            yield paragraph.text
+
+
+def _new_paragraph(text, style_id=None):
+    """Build the same <w:p> python-docx's add_paragraph(text, style) would"""
+    p = backends.get('docx.oxml').OxmlElement('w:p')
+    if style_id is not None:
+        p.style = style_id
+    if text:
+        p.add_r().text = text
+    return p
+
+
+def _append_paragraphs(doc, paragraphs):
+    """Append paragraph elements to the end of a document body
+    
+    add_paragraph locates the closing sectPr by scanning the body on every
+    call, which makes long documents quadratic; here it is found once.
+    """
+    body = doc.element.body
+    sect_pr = body.sectPr
+    for p in paragraphs:
+        if sect_pr is not None:
+            sect_pr.addprevious(p)
+        else:
+            body.append(p)
+
+
+# Seconds a standalone soffice --convert-to run may take
+LIBREOFFICE_TIMEOUT = 60
+
+# Documents converted by one soffice run in batch_convert
+LIBREOFFICE_BATCH_SIZE = 50
+
+# Upper bound for one batch run; documents it did not reach are retried one per run
+LIBREOFFICE_BATCH_TIMEOUT = 300
+
+
+def _run_cancellable(command, timeout, cancel_token=None):
+    """Run a command, killing it on timeout or once cancel_token trips
+    
+    Returns the exit code; raises subprocess.TimeoutExpired like
+    subprocess.run does.
+    """
+    import subprocess
+    
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            try:
+                return process.wait(timeout=0.25)
+            except subprocess.TimeoutExpired:
+                pass
+            raise_if_cancelled(cancel_token)
+            if time.monotonic() >= deadline:
+                raise subprocess.TimeoutExpired(command, timeout)
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+
+def _libreoffice_batches(items, batch_size):
+    """Split (index, input path, ...) items into batches with distinct output names
+    
+    soffice --convert-to names each PDF after its input's stem, so two
+    inputs with the same stem in one run would overwrite each other.
+    """
+    batches = []
+    for item in items:
+        stem = item[1].stem.casefold()
+        for batch, stems in batches:
+            if stem not in stems and len(batch) < batch_size:
+                break
+        else:
+            batch, stems = [], set()
+            batches.append((batch, stems))
+        batch.append(item)
+        stems.add(stem)
+    return [batch for batch, _ in batches]
+
+
+# Conversion types batch_convert can dispatch to (one input file each)
+BATCH_CONVERSIONS = ('pdf_to_word', 'word_to_pdf', 'word_to_ppt', 'ppt_to_word', 'image_to_pdf')
+
+# Conversion types convert_file accepts; multi_image_to_pdf takes a list of images
+CONVERSION_TYPES = BATCH_CONVERSIONS + ('multi_image_to_pdf',)
+
+
+def _new_result(file_path, conversion_type):
+    """Result dict for a conversion that has not produced anything yet"""
+    return {
+        'input': [str(f) for f in file_path] if isinstance(file_path, (list, tuple)) else str(file_path),
+        'conversion_type': conversion_type,
+        'output': None,
+        'error': None,
+        'wall_time': 0.0,
+        'peak_rss': None,
+        'cache_hit': False,
+        'cancelled': False,
+        'timed_out': False,
+        'stages': {},
+        'memory': None
+    }
+
+
+def _peak_rss_bytes():
+    """Peak resident set size of this process, or None where unsupported"""
+    # getrusage's maxrss survives fork/exec on Linux, so a freshly spawned
+    # worker would report its parent's peak; VmHWM belongs to this process only
+    peak = _proc_status_bytes('VmHWM')
+    if peak is not None:
+        return peak
+        
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+# Per-process state for batch_convert worker processes
+_worker_converter = None
+_worker_progress_queue = None
+_worker_cancel_event = None
+
+
+def _init_batch_worker(progress_queue, cache_config=None, memory_top=None, cancel_event=None):
+    """Create the converter each pool worker reuses for all of its jobs"""
+    global _worker_converter, _worker_progress_queue, _worker_cancel_event
+    _worker_converter = FileConverter()
+    if cache_config is not None:
+        cache_dir, max_bytes, use_hardlinks = cache_config
+        _worker_converter.enable_cache(cache_dir, max_bytes=max_bytes, use_hardlinks=use_hardlinks)
+    if memory_top is not None:
+        _worker_converter.enable_memory_tracking(top=memory_top)
+    _worker_progress_queue = progress_queue
+    _worker_cancel_event = cancel_event
+
+
+def _run_batch_job(index, file_path, conversion_type, output_dir, options=None):
+    """Convert one batch file inside a worker process"""
+    _worker_converter.set_progress_callback(
+        lambda percentage, message="": _worker_progress_queue.put((index, percentage, message))
+    )
+    cancel_token = CancellationToken(event=_worker_cancel_event) if _worker_cancel_event is not None else None
+    return _worker_converter.convert_file(
+        file_path, conversion_type, output_dir, cancel_token=cancel_token, **(options or {})
+    )
+
+
+def _run_isolated_job(events, file_path, conversion_type, output_dir, cache_config=None, memory_top=None,
+                      options=None):
+    """Process entry point for FileConverter.convert_isolated"""
+    converter = FileConverter()
+    if cache_config is not None:
+        cache_dir, max_bytes, use_hardlinks = cache_config
+        converter.enable_cache(cache_dir, max_bytes=max_bytes, use_hardlinks=use_hardlinks)
+    if memory_top is not None:
+        converter.enable_memory_tracking(top=memory_top)
+    converter.set_progress_callback(
+        lambda percentage, message="": events.put(('progress', percentage, message))
+    )
+    result = converter.convert_file(file_path, conversion_type, output_dir, **(options or {}))
+    if result['peak_rss'] is None:
+        # This process ran nothing else, so its lifetime peak is the file's
+        result['peak_rss'] = _peak_rss_bytes()
+    events.put(('result', result))
@@ -226,6 +226,95 @@ class StatusIndicator(ctk.CTkFrame):
         self.animation_running = False
         self.progress_dots = ""
 
+class JobQueuePanel(ctk.CTkFrame):
+    """List of queued, running and finished conversion jobs"""
+
+    STATUS_ICONS = {
+        "queued": "⏳",
+        "running": "⚙️",
+        "done": "✅",
+        "failed": "❌",
+        "cancelled": "🚫"
+    }
+
+    def __init__(self, parent, on_cancel=None, on_move=None, max_rows=8, **kwargs):
+        super().__init__(parent, **kwargs)
+
+        self.on_cancel = on_cancel
+        self.on_move = on_move
+        self.max_rows = max_rows
+
+        self.title_label = ctk.CTkLabel(
+            self,
+            text="🗂️ Job Queue",
+            font=ctk.CTkFont(size=13, weight="bold")
+        )
+        self.title_label.pack(pady=(10, 5))
+
+        self.rows_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.rows_frame.pack(fill="x", padx=10, pady=(0, 10))
+
+        self.empty_label = ctk.CTkLabel(
+            self.rows_frame,
+            text="No jobs yet",
+            font=ctk.CTkFont(size=11),
+            text_color="#b3b3b3"
+        )
+        self.empty_label.pack()
+
+    def update_jobs(self, jobs):
+        """Rebuild the rows from a JobScheduler.jobs() snapshot"""
+        for child in self.rows_frame.winfo_children():
+            child.destroy()
+
+        if not jobs:
+            self.empty_label = ctk.CTkLabel(
+                self.rows_frame,
+                text="No jobs yet",
+                font=ctk.CTkFont(size=11),
+                text_color="#b3b3b3"
+            )
+            self.empty_label.pack()
+            return
+
+        for job in jobs[:self.max_rows]:
+            row = ctk.CTkFrame(self.rows_frame, fg_color="transparent")
+            row.pack(fill="x", pady=1)
+
+            icon = self.STATUS_ICONS.get(job.status, "🔵")
+            ctk.CTkLabel(
+                row,
+                text=f"{icon} {job.description}",
+                font=ctk.CTkFont(size=11),
+                anchor="w"
+            ).pack(side="left", fill="x", expand=True)
+
+            # Waiting jobs can be reordered or cancelled, running ones only cancelled
+            if job.status == "queued":
+                buttons = (
+                    ("✖", lambda job_id=job.job_id: self.on_cancel and self.on_cancel(job_id)),
+                    ("▼", lambda job_id=job.job_id: self.on_move and self.on_move(job_id, 1)),
+                    ("▲", lambda job_id=job.job_id: self.on_move and self.on_move(job_id, -1))
+                )
+            elif job.status == "running" and job.cancel_token is not None:
+                buttons = (
+                    ("✖", lambda job_id=job.job_id: self.on_cancel and self.on_cancel(job_id)),
+                )
+            else:
+                continue
+
+            for text, command in buttons:
+                ctk.CTkButton(
+                    row,
+                    text=text,
+                    command=command,
+                    width=24,
+                    height=22,
+                    corner_radius=6,
+                    fg_color="#2a2a4e",
+                    hover_color="#e91e63"
+                ).pack(side="right", padx=1)
+
 class ToolTip:
     """Modern tooltip for widgets"""
     
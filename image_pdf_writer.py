@@ -0,0 +1,206 @@
+import struct
+
+# A4 in PDF points
+A4_PAGE_SIZE = (595.276, 841.890)
+
+
+def mm_to_pt(mm):
+    return mm * 72 / 25.4
+
+
+def _num(value):
+    """Format a number compactly for PDF output"""
+    text = f"{value:.4f}".rstrip('0').rstrip('.')
+    return text if text not in ('', '-0') else '0'
+
+
+class ImagePdfWriter:
+    """Stream image pages straight into a PDF file
+
+    Each page is written (and can be dropped by the caller) as soon as it is
+    added; only object offsets are kept until close(), so memory use does not
+    grow with the number of pages. Images are scaled to fit the page while
+    keeping their aspect ratio, and centred.
+    """
+
+    def __init__(self, stream, page_size=A4_PAGE_SIZE):
+        self.stream = stream
+        self.page_size = page_size
+        self._offsets = {}
+        self._page_ids = []
+        self._position = 0
+        # Objects 1 and 2 are the catalog and page tree, written at close()
+        self._next_id = 3
+        self._closed = False
+
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def _write(self, data):
+        self.stream.write(data)
+        self._position += len(data)
+
+    def _begin_object(self, object_id):
+        self._offsets[object_id] = self._position
+        self._write(f"{object_id} 0 obj\n".encode('ascii'))
+
+    def _write_object(self, object_id, body):
+        self._begin_object(object_id)
+        self._write(body.encode('ascii') + b"\nendobj\n")
+
+    def _write_stream_object(self, object_id, dictionary, data):
+        self._begin_object(object_id)
+        self._write(f"<< {dictionary} /Length {len(data)} >>\nstream\n".encode('ascii'))
+        self._write(data)
+        self._write(b"\nendstream\nendobj\n")
+
+    def _allocate(self, count):
+        first = self._next_id
+        self._next_id += count
+        return range(first, first + count)
+
+    def add_image(self, data, width, height, colorspace='/DeviceRGB', bits_per_component=8,
+                  filter_name='/DCTDecode', decode_parms=None, extra=''):
+        """Add a page holding one already-encoded image stream
+
+        data is the image stream exactly as it should be embedded, e.g. a
+        complete JPEG file for /DCTDecode.
+        """
+        if self._closed:
+            raise ValueError("PDF writer is closed")
+
+        image_id, contents_id, page_id = self._allocate(3)
+        page_width, page_height = self.page_size
+
+        # Fit the image into the page keeping its aspect ratio, then centre it
+        scale = min(page_width / width, page_height / height)
+        draw_width = width * scale
+        draw_height = height * scale
+        x = (page_width - draw_width) / 2
+        y = (page_height - draw_height) / 2
+
+        dictionary = (
+            f"/Type /XObject /Subtype /Image /Width {width} /Height {height} "
+            f"/ColorSpace {colorspace} /BitsPerComponent {bits_per_component}"
+        )
+        if filter_name:
+            dictionary += f" /Filter {filter_name}"
+        if decode_parms:
+            dictionary += f" /DecodeParms {decode_parms}"
+        if extra:
+            dictionary += f" {extra}"
+        self._write_stream_object(image_id, dictionary, data)
+
+        contents = (
+            f"q {_num(draw_width)} 0 0 {_num(draw_height)} {_num(x)} {_num(y)} cm /Im0 Do Q"
+        ).encode('ascii')
+        self._write_stream_object(contents_id, "", contents)
+
+        self._write_object(page_id, (
+            f"<< /Type /Page /Parent 2 0 R "
+            f"/MediaBox [0 0 {_num(page_width)} {_num(page_height)}] "
+            f"/Resources << /XObject << /Im0 {image_id} 0 R >> >> "
+            f"/Contents {contents_id} 0 R >>"
+        ))
+        self._page_ids.append(page_id)
+
+    @property
+    def page_count(self):
+        return len(self._page_ids)
+
+    def close(self):
+        """Write the page tree, catalog, cross-reference table and trailer"""
+        if self._closed:
+            return
+        if not self._page_ids:
+            raise ValueError("Cannot write a PDF without pages")
+
+        kids = ' '.join(f"{page_id} 0 R" for page_id in self._page_ids)
+        self._write_object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(self._page_ids)} >>")
+        self._write_object(1, "<< /Type /Catalog /Pages 2 0 R >>")
+
+        xref_offset = self._position
+        size = self._next_id
+        lines = [f"xref\n0 {size}\n", "0000000000 65535 f \n"]
+        for object_id in range(1, size):
+            lines.append(f"{self._offsets[object_id]:010d} 00000 n \n")
+        self._write(''.join(lines).encode('ascii'))
+        self._write(
+            f"trailer\n<< /Size {size} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode('ascii')
+        )
+        self._closed = True
+
+
+def jpeg_params(mode, inverted=False):
+    """Image parameters for embedding JPEG bytes unchanged"""
+    params = {
+        'colorspace': {'L': '/DeviceGray', 'RGB': '/DeviceRGB', 'CMYK': '/DeviceCMYK'}[mode],
+        'filter_name': '/DCTDecode',
+    }
+    if inverted:
+        # Adobe CMYK JPEGs store inverted channel values
+        params['extra'] = '/Decode [1 0 1 0 1 0 1 0]'
+    return params
+
+
+def png_embedding(data):
+    """Return (idat, width, height, image_params) for a PNG PDF can embed as-is, else None
+
+    idat is the concatenated compressed IDAT data, width and height are the
+    pixel size from IHDR, and image_params are the keyword arguments for
+    ImagePdfWriter.add_image (colorspace, bit depth, filter, predictor).
+
+    Non-interlaced grey, RGB and palette PNGs without alpha or transparency
+    keep their zlib-compressed IDAT data: PDF's Flate filter with PNG
+    predictors decodes it directly, so no pixels are re-encoded.
+    """
+    if data[:8] != b'\x89PNG\r\n\x1a\n':
+        return None
+
+    position = 8
+    header = None
+    palette = None
+    idat = []
+    while position + 8 <= len(data):
+        length = struct.unpack('>I', data[position:position + 4])[0]
+        chunk_type = data[position + 4:position + 8]
+        chunk = data[position + 8:position + 8 + length]
+        position += 12 + length
+
+        if chunk_type == b'IHDR':
+            header = struct.unpack('>IIBBBBB', chunk)
+        elif chunk_type == b'PLTE':
+            palette = chunk
+        elif chunk_type == b'tRNS':
+            return None
+        elif chunk_type == b'IDAT':
+            idat.append(chunk)
+        elif chunk_type == b'IEND':
+            break
+
+    if header is None or not idat:
+        return None
+
+    width, height, bit_depth, color_type, _, _, interlace = header
+    if interlace or bit_depth > 8:
+        return None
+
+    if color_type == 0:
+        colorspace, colors = '/DeviceGray', 1
+    elif color_type == 2:
+        colorspace, colors = '/DeviceRGB', 3
+    elif color_type == 3 and palette:
+        colorspace = f"[/Indexed /DeviceRGB {len(palette) // 3 - 1} <{palette.hex()}>]"
+        colors = 1
+    else:
+        # Alpha channels need compositing onto a background first
+        return None
+
+    params = {
+        'colorspace': colorspace,
+        'bits_per_component': bit_depth,
+        'filter_name': '/FlateDecode',
+        'decode_parms': (
+            f"<< /Predictor 15 /Colors {colors} /BitsPerComponent {bit_depth} /Columns {width} >>"
+        ),
+    }
+    return b''.join(idat), width, height, params
@@ -74,7 +74,6 @@ def install_core_dependencies():
         "PyPDF2==3.0.1",
         "pdf2docx==0.5.6",
         "Pillow==10.0.0",
-        "img2pdf==0.4.4",
         "reportlab==4.0.4"
     ]
     
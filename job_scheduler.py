@@ -0,0 +1,238 @@
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+
+# Lower numbers run first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 10
+
+# Job states
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+
+class ConversionJob:
+    """A unit of work queued on the JobScheduler"""
+
+    def __init__(self, job_id, func, args, kwargs, description, priority):
+        self.job_id = job_id
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.description = description
+        self.priority = priority
+        # A CancellationToken passed as cancel_token lets cancel() stop the job while it runs
+        self.cancel_token = kwargs.get('cancel_token')
+        self.status = QUEUED
+        self.result = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def is_finished(self):
+        return self.status in (DONE, FAILED, CANCELLED)
+
+    def __repr__(self):
+        return f"<ConversionJob {self.job_id} {self.status} p={self.priority} {self.description!r}>"
+
+
+class JobScheduler:
+    """Bounded pool of worker threads running queued jobs by priority
+
+    Jobs with a lower priority number run first; jobs of equal priority run
+    in submission order. Queued jobs can be listed, moved and cancelled;
+    running jobs can be cancelled if they were given a cancel_token.
+    Listeners are called from worker threads whenever a job changes state,
+    so GUI code should only record the change and refresh from its own loop
+    (see `version`).
+    """
+
+    def __init__(self, max_workers=2, history_size=20, logger=None):
+        self.max_workers = max(1, max_workers)
+        self.logger = logger or logging.getLogger(__name__)
+        self._pending = []
+        self._running = {}
+        self._finished = deque(maxlen=history_size)
+        self._listeners = []
+        self._ids = itertools.count(1)
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self.version = 0
+
+        self._threads = []
+        for i in range(self.max_workers):
+            thread = threading.Thread(target=self._worker, name=f"conversion-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def add_listener(self, callback):
+        """Call callback(job) whenever a job is queued, started, moved or finished"""
+        self._listeners.append(callback)
+
+    def submit(self, func, *args, description="", priority=PRIORITY_INTERACTIVE, **kwargs):
+        """Queue func(*args, **kwargs) and return its ConversionJob"""
+        with self._condition:
+            if self._shutdown:
+                raise Exception("Job scheduler has been shut down")
+            job = ConversionJob(next(self._ids), func, args, kwargs, description, priority)
+            self._insert(job)
+            self._condition.notify()
+        self.logger.info(f"Queued job {job.job_id} (priority {priority}): {description}")
+        self._changed(job)
+        return job
+
+    def _insert(self, job):
+        # Keep the queue ordered by priority, first come first served within one
+        index = len(self._pending)
+        while index > 0 and self._pending[index - 1].priority > job.priority:
+            index -= 1
+        self._pending.insert(index, job)
+
+    def cancel(self, job_id):
+        """Remove a queued job or ask a running one to stop
+        
+        Returns False if the job cannot be cancelled (already finished, or
+        running without a cancel_token).
+        """
+        with self._condition:
+            job = self._find_pending(job_id)
+            if job is None:
+                running = self._running.get(job_id)
+                if running is None or running.cancel_token is None:
+                    return False
+                running.cancel_token.cancel()
+                self.logger.info(f"Requested cancellation of running job {job_id}")
+                return True
+            self._pending.remove(job)
+            job.status = CANCELLED
+            job.finished_at = time.time()
+            self._finished.append(job)
+        self.logger.info(f"Cancelled queued job {job_id}")
+        self._changed(job)
+        return True
+
+    def move(self, job_id, offset):
+        """Move a queued job up (negative offset) or down the queue
+
+        The job takes on the priority of the neighbour it passes so the queue
+        stays ordered for later submissions.
+        """
+        with self._condition:
+            job = self._find_pending(job_id)
+            if job is None:
+                return False
+            index = self._pending.index(job)
+            new_index = min(max(index + offset, 0), len(self._pending) - 1)
+            if new_index == index:
+                return False
+            neighbour = self._pending[new_index]
+            self._pending.remove(job)
+            self._pending.insert(new_index, job)
+            if new_index < index:
+                job.priority = min(job.priority, neighbour.priority)
+            else:
+                job.priority = max(job.priority, neighbour.priority)
+        self._changed(job)
+        return True
+
+    def set_priority(self, job_id, priority):
+        """Change the priority of a queued job and requeue it accordingly"""
+        with self._condition:
+            job = self._find_pending(job_id)
+            if job is None:
+                return False
+            self._pending.remove(job)
+            job.priority = priority
+            self._insert(job)
+        self._changed(job)
+        return True
+
+    def _find_pending(self, job_id):
+        for job in self._pending:
+            if job.job_id == job_id:
+                return job
+        return None
+
+    def jobs(self):
+        """Snapshot of running, queued and recently finished jobs, in that order"""
+        with self._condition:
+            return list(self._running.values()) + list(self._pending) + list(reversed(self._finished))
+
+    def pending(self):
+        with self._condition:
+            return list(self._pending)
+
+    def running(self):
+        with self._condition:
+            return list(self._running.values())
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._shutdown:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                job = self._pending.pop(0)
+                job.status = RUNNING
+                job.started_at = time.time()
+                self._running[job.job_id] = job
+            self._changed(job)
+
+            try:
+                job.result = job.func(*job.args, **job.kwargs)
+                job.status = DONE
+            except Exception as e:
+                job.error = str(e)
+                if job.cancel_token is not None and job.cancel_token.cancel_requested:
+                    job.status = CANCELLED
+                    self.logger.info(f"Job {job.job_id} cancelled")
+                else:
+                    job.status = FAILED
+                    self.logger.error(f"Job {job.job_id} failed: {str(e)}")
+
+            with self._condition:
+                job.finished_at = time.time()
+                self._running.pop(job.job_id, None)
+                self._finished.append(job)
+            self._changed(job)
+
+    def _changed(self, job):
+        with self._condition:
+            self.version += 1
+        for listener in list(self._listeners):
+            try:
+                listener(job)
+            except Exception as e:
+                self.logger.warning(f"Job listener failed: {str(e)}")
+
+    def shutdown(self, cancel_pending=True):
+        """Stop the workers
+        
+        With cancel_pending, running jobs are cancelled through their tokens
+        and queued jobs are marked cancelled. Otherwise the workers finish
+        everything already queued before they exit.
+        """
+        dropped = []
+        with self._condition:
+            if cancel_pending:
+                for job in self._running.values():
+                    if job.cancel_token is not None:
+                        job.cancel_token.cancel()
+                for job in self._pending:
+                    job.status = CANCELLED
+                    job.finished_at = time.time()
+                    self._finished.append(job)
+                dropped = list(self._pending)
+                self._pending.clear()
+            self._shutdown = True
+            self._condition.notify_all()
+        for job in dropped:
+            self._changed(job)
@@ -0,0 +1,296 @@
+import os
+from pathlib import Path
+import logging
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+
+from cancellation import raise_if_cancelled
+
+# Binaries tried when looking for LibreOffice
+LIBREOFFICE_COMMANDS = [
+    'libreoffice',
+    'soffice',
+    '/Applications/LibreOffice.app/Contents/MacOS/soffice'  # macOS
+]
+
+
+def find_soffice():
+    """Return the first LibreOffice binary available on this machine"""
+    for cmd in LIBREOFFICE_COMMANDS:
+        path = shutil.which(cmd)
+        if path:
+            return path
+        if os.path.isfile(cmd) and os.access(cmd, os.X_OK):
+            return cmd
+    return None
+
+
+def uno_available():
+    """Check whether the LibreOffice Python bridge (python3-uno) is importable"""
+    try:
+        import uno  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class LibreOfficeWorker:
+    """One long-lived headless LibreOffice instance driven over UNO"""
+
+    def __init__(self, soffice, index, startup_timeout=30):
+        self.soffice = soffice
+        self.index = index
+        self.startup_timeout = startup_timeout
+        self.pipe_name = f"converter_space_{os.getpid()}_{index}"
+        self.profile_dir = None
+        self.process = None
+        self.desktop = None
+        self.jobs_done = 0
+
+    def start(self):
+        """Launch the office process with its own user profile and connect to it"""
+        import uno
+
+        # A private profile keeps instances from locking each other out
+        self.profile_dir = Path(tempfile.mkdtemp(prefix=f"converter_lo_{self.index}_"))
+        self.process = subprocess.Popen([
+            self.soffice, '--headless', '--invisible', '--nologo', '--nodefault',
+            '--norestore', '--nolockcheck',
+            f'-env:UserInstallation={self.profile_dir.as_uri()}',
+            f'--accept=pipe,name={self.pipe_name};urp;StarOffice.ComponentContext'
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            if self.process.poll() is not None:
+                raise Exception(f"LibreOffice exited during startup (code {self.process.returncode})")
+            try:
+                context = resolver.resolve(
+                    f"uno:pipe,name={self.pipe_name};urp;StarOffice.ComponentContext"
+                )
+                break
+            except Exception:
+                if time.monotonic() > deadline:
+                    self.stop()
+                    raise Exception("Timed out waiting for LibreOffice to start")
+                time.sleep(0.25)
+
+        self.desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+        self.jobs_done = 0
+
+    def is_healthy(self):
+        """The process is alive and still answers UNO calls"""
+        if self.process is None or self.process.poll() is not None or self.desktop is None:
+            return False
+        try:
+            self.desktop.getFrames()
+            return True
+        except Exception:
+            return False
+
+    def convert(self, input_path, output_path):
+        """Export one document to PDF through the running instance"""
+        import uno
+
+        def prop(name, value):
+            p = uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+            p.Name = name
+            p.Value = value
+            return p
+
+        document = self.desktop.loadComponentFromURL(
+            Path(input_path).resolve().as_uri(), "_blank", 0, (prop("Hidden", True),)
+        )
+        if document is None:
+            raise Exception("LibreOffice could not open the document")
+        try:
+            document.storeToURL(
+                Path(output_path).resolve().as_uri(), (prop("FilterName", "writer_pdf_Export"),)
+            )
+        finally:
+            document.close(True)
+        self.jobs_done += 1
+
+    def stop(self):
+        """Shut the instance down and remove its profile"""
+        if self.desktop is not None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                pass
+            self.desktop = None
+
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+
+        if self.profile_dir is not None:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+            self.profile_dir = None
+
+    def kill(self):
+        """Forcefully stop a hung instance"""
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+        self.desktop = None
+        self.stop()
+
+
+class LibreOfficePool:
+    """Pool of headless LibreOffice instances that Word documents are dispatched to
+
+    Starting soffice dominates the cost of converting short documents, so the
+    pool keeps a few instances running and reuses them. Each instance has its
+    own user profile, is health-checked before every job, restarted if it
+    crashed, and killed if a job runs past its timeout.
+    """
+
+    def __init__(self, size=2, soffice=None, job_timeout=120, logger=None):
+        self.size = max(1, size)
+        self.soffice = soffice or find_soffice()
+        self.job_timeout = job_timeout
+        self.logger = logger or logging.getLogger(__name__)
+        self.workers = []
+        self._workers_lock = threading.Lock()
+        self._idle = queue.Queue()
+        self._started = False
+
+    @staticmethod
+    def is_supported():
+        """A pool needs both a LibreOffice binary and the UNO bridge"""
+        return find_soffice() is not None and uno_available()
+
+    def start(self):
+        """Launch every instance in the pool"""
+        if self._started:
+            return
+        if not self.soffice:
+            raise Exception("LibreOffice is not installed")
+        if not uno_available():
+            raise Exception("LibreOffice Python bridge (uno) is not available")
+
+        for index in range(self.size):
+            worker = LibreOfficeWorker(self.soffice, index)
+            worker.start()
+            self.workers.append(worker)
+            self._idle.put(worker)
+
+        self._started = True
+        self.logger.info(f"LibreOffice pool started with {self.size} instances")
+
+    def convert(self, input_path, output_path, timeout=None, cancel_token=None):
+        """Convert a document to PDF on the next free instance
+        
+        A job that runs past its timeout, or whose cancel_token is cancelled,
+        has its instance killed and replaced. Instances that cannot be
+        restarted are dropped from the pool.
+        """
+        if not self._started:
+            raise Exception("LibreOffice pool is not running")
+
+        timeout = timeout or self.job_timeout
+        worker = self._take_worker(cancel_token)
+        try:
+            error = []
+            job = threading.Thread(
+                target=self._run_job, args=(worker, input_path, output_path, error), daemon=True
+            )
+            job.start()
+
+            deadline = time.monotonic() + timeout
+            while job.is_alive() and time.monotonic() < deadline:
+                if cancel_token is not None and cancel_token.cancelled:
+                    break
+                job.join(min(0.25, max(0, deadline - time.monotonic())))
+
+            if job.is_alive():
+                # The job thread keeps the old worker object; it only ever sees a dead instance
+                cancelled = cancel_token is not None and cancel_token.cancelled
+                if cancelled:
+                    self.logger.info(f"LibreOffice job cancelled on instance {worker.index}: {input_path}")
+                else:
+                    self.logger.error(
+                        f"LibreOffice job timed out after {timeout}s on instance {worker.index}: {input_path}"
+                    )
+                worker = self._restart(worker)
+                if cancelled:
+                    cancel_token.raise_if_cancelled()
+                raise Exception(f"LibreOffice conversion timed out after {timeout} seconds")
+
+            if error:
+                # A dead process means the job crashed the instance
+                if not worker.is_healthy():
+                    self.logger.warning(f"LibreOffice instance {worker.index} crashed, restarting")
+                    worker = self._restart(worker)
+                raise error[0]
+
+            return Path(output_path).exists()
+
+        finally:
+            if worker is not None:
+                self._idle.put(worker)
+
+    def _take_worker(self, cancel_token):
+        """Wait for a healthy idle instance, restarting crashed ones on the way"""
+        while True:
+            if not self.workers:
+                raise Exception("No LibreOffice instances left in the pool")
+            raise_if_cancelled(cancel_token)
+            try:
+                worker = self._idle.get(timeout=0.25)
+            except queue.Empty:
+                continue
+            if worker.is_healthy():
+                return worker
+            self.logger.warning(f"LibreOffice instance {worker.index} is unhealthy, restarting")
+            worker = self._restart(worker)
+            if worker is not None:
+                return worker
+
+    def _run_job(self, worker, input_path, output_path, error):
+        try:
+            worker.convert(input_path, output_path)
+        except Exception as e:
+            error.append(e)
+
+    def _restart(self, worker):
+        """Replace a worker with a fresh instance; returns None if it cannot start"""
+        worker.kill()
+        replacement = LibreOfficeWorker(self.soffice, worker.index)
+        try:
+            replacement.start()
+        except Exception as e:
+            self.logger.error(f"LibreOffice instance {worker.index} could not be restarted, dropping it: {str(e)}")
+            replacement.kill()
+            with self._workers_lock:
+                self.workers = [w for w in self.workers if w is not worker]
+            return None
+        with self._workers_lock:
+            self.workers = [replacement if w is worker else w for w in self.workers]
+        return replacement
+
+    def shutdown(self):
+        """Stop every instance in the pool"""
+        for worker in self.workers:
+            try:
+                worker.stop()
+            except Exception as e:
+                self.logger.warning(f"Error stopping LibreOffice instance {worker.index}: {str(e)}")
+        self.workers = []
+        self._idle = queue.Queue()
+        self._started = False
@@ -1,13 +1,15 @@
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog, messagebox
-import threading
 import os
+import threading
 from pathlib import Path
 import webbrowser
 from file_converter import FileConverter
+from cancellation import CancellationToken
+from job_scheduler import JobScheduler, PRIORITY_INTERACTIVE, PRIORITY_BATCH
+from progress_bus import ProgressBus
 from gui_components import *
-from pdf_editor_window import PDFEditorWindow
 
 class ConverterApp:
     def __init__(self):
@@ -45,7 +47,22 @@ class ConverterApp:
         self.current_file = None
         self.selected_images = []  # For multi-image PDF conversion
         self.save_location = None
+        
+        # Conversions run on a bounded pool; interactive jobs jump ahead of batch jobs
+        self.scheduler = JobScheduler(max_workers=max(1, min(2, (os.cpu_count() or 2) // 2)))
+        self.interactive_jobs = set()
+        self.handled_jobs = set()
+        self.jobs_version = -1
+        
+        # Workers report progress into per-job streams; the Tk loop drains them
+        self.progress_bus = ProgressBus(max_rate=15)
+        self.shown_job = None
+        # Jobs cancelled while queued never run, so nothing else would close their streams
+        self.scheduler.add_listener(self.on_job_changed)
+        
         self.setup_ui()
+        self.poll_jobs()
+        self.progress_bus.attach_tk(self.root, self.on_progress_event)
         
     def setup_ui(self):
         # Configure root
@@ -297,6 +314,16 @@ class ConverterApp:
         # Progress section
         self.create_progress_section(preview_section)
         
+        # Job queue section
+        self.job_queue_panel = JobQueuePanel(
+            preview_section,
+            on_cancel=self.cancel_job,
+            on_move=self.move_job,
+            fg_color=self.colors['bg_tertiary'],
+            corner_radius=15
+        )
+        self.job_queue_panel.pack(fill="x", pady=10)
+        
     def create_file_info_section(self, parent):
         # File information section
         info_section = ctk.CTkFrame(parent, fg_color="transparent")
@@ -370,6 +397,17 @@ class ConverterApp:
         )
         self.batch_btn.pack(side="right")
         
+        # Long-lived LibreOffice instances make repeated Word → PDF conversions much faster
+        self.libreoffice_pool_switch = ctk.CTkSwitch(
+            actions_frame,
+            text="Keep LibreOffice running (faster Word → PDF)",
+            command=self.toggle_libreoffice_pool,
+            font=ctk.CTkFont(size=11),
+            text_color=self.colors['text_secondary'],
+            progress_color=self.colors['accent_purple']
+        )
+        self.libreoffice_pool_switch.pack(pady=(15, 0))
+        
     def create_progress_section(self, parent):
         # Progress section
         progress_frame = ctk.CTkFrame(parent, fg_color=self.colors['bg_tertiary'], corner_radius=15)
@@ -511,7 +549,8 @@ class ConverterApp:
     def update_multi_image_info(self):
         """Update file info for multiple images"""
         if self.selected_images:
-            total_size = sum(os.path.getsize(img) for img in self.selected_images)
+            # Through the metadata cache, so reselecting the same images costs one stat() each
+            total_size = sum(self.converter.get_file_info(img)['size'] for img in self.selected_images)
             info_text = f"""Multi-Image PDF Conversion
 Images Selected: {len(self.selected_images)}
 Total Size: {self.format_file_size(total_size)}
@@ -594,14 +633,15 @@ Additional Info:"""
         """Update preview area with file-specific information"""
         conversion_type = self.conversion_type.get()
         file_path = Path(filepath)
+        file_info = self.converter.get_file_info(filepath)
         
         preview_text = f"""
 🔍 SELECTED FILE
 {'='*50}
 📁 File: {file_path.name}
 📂 Location: {file_path.parent}
-📏 Size: {self.format_file_size(os.path.getsize(filepath))}
-📅 Modified: {self.get_file_modified_time(filepath)}
+📏 Size: {self.format_file_size(file_info['size'])}
+📅 Modified: {file_info['modified'].strftime("%Y-%m-%d %H:%M:%S")}
 
 ⚙️ CONVERSION SETTINGS
 {'='*50}
@@ -651,12 +691,6 @@ Select a conversion type and file to get started!
             size_bytes /= 1024
         return f"{size_bytes:.1f} PB"
         
-    def get_file_modified_time(self, filepath):
-        """Get formatted file modification time"""
-        import datetime
-        timestamp = os.path.getmtime(filepath)
-        return datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
-        
     def get_conversion_display_name(self):
         """Get display name for conversion type"""
         conversion_names = {
@@ -757,10 +791,19 @@ Select a conversion type and file to get started!
             if not self.save_location:
                 self.save_location = Path(self.current_file).parent
             
-        # Start conversion in separate thread
-        self.conversion_thread = threading.Thread(target=self.perform_conversion)
-        self.conversion_thread.daemon = True
-        self.conversion_thread.start()
+        # Capture the parameters now so later UI changes cannot affect the queued job
+        images = list(self.selected_images) if conversion_type == "image_to_pdf" else []
+        input_file = None if images else self.current_file
+        label = f"{len(images)} images" if images else Path(input_file).name
+        job = self.scheduler.submit(
+            self.perform_conversion, conversion_type, input_file, images, str(self.save_location),
+            description=f"{self.get_conversion_display_name()}: {label}",
+            priority=PRIORITY_INTERACTIVE,
+            cancel_token=CancellationToken(),
+            progress=self.progress_bus.stream()
+        )
+        self.interactive_jobs.add(job.job_id)
+        self.status_indicator.set_status("Conversion queued", "processing")
         
     def validate_conversion(self, file_ext, conversion_type):
         """Validate if file extension is compatible with conversion type"""
@@ -781,12 +824,16 @@ Select a conversion type and file to get started!
             return
             
         try:
+            # Imported here so pypdf is only loaded once the editor is needed
+            from pdf_editor_window import PDFEditorWindow
+            
             # Create and open PDF editor window
             editor_window = PDFEditorWindow(
                 parent=self.root,
                 pdf_file=self.current_file,
                 save_callback=self.on_pdf_saved,
-                colors=self.colors
+                colors=self.colors,
+                file_info=self.converter.get_file_info
             )
             self.status_indicator.set_status("PDF Editor opened", "info")
             
@@ -798,54 +845,146 @@ Select a conversion type and file to get started!
         self.status_indicator.set_status(f"PDF saved: {Path(saved_path).name}", "success")
         messagebox.showinfo("Success", f"PDF successfully saved to:\n{saved_path}")
         
-    def perform_conversion(self):
-        """Perform the actual conversion"""
+    def perform_conversion(self, conversion_type, input_file, images, save_location, cancel_token=None, progress=None):
+        """Perform the actual conversion (runs on a scheduler worker thread)
+        
+        Never touches widgets: progress goes to the job's progress stream and
+        the result is picked up by poll_jobs on the Tk thread.
+        """
         try:
-            self.status_indicator.set_status("Processing... Please wait", "processing")
-            self.progress.animate_to(0.1)
-            self.progress_label.configure(text="10%")
-            
-            conversion_type = self.conversion_type.get()
-            
-            # Update progress
-            self.progress.animate_to(0.3)
-            self.progress_label.configure(text="30%")
-            
-            # Perform conversion based on type
-            if conversion_type == "image_to_pdf" and self.selected_images:
-                # Multi-image conversion
-                output_file = self.converter.multi_image_to_pdf(self.selected_images, self.save_location)
-            else:
-                # Single file conversion
-                input_file = self.current_file
-                if conversion_type == "pdf_to_word":
-                    output_file = self.converter.pdf_to_word(input_file, self.save_location)
-                elif conversion_type == "word_to_pdf":
-                    output_file = self.converter.word_to_pdf(input_file, self.save_location)
-                elif conversion_type == "word_to_ppt":
-                    output_file = self.converter.word_to_ppt(input_file, self.save_location)
-                elif conversion_type == "ppt_to_word":
-                    output_file = self.converter.ppt_to_word(input_file, self.save_location)
-                elif conversion_type == "image_to_pdf":
-                    output_file = self.converter.image_to_pdf(input_file, self.save_location)
+            with self.converter.progress_scope(progress):
+                return self.run_conversion(conversion_type, input_file, images, save_location, cancel_token)
+        finally:
+            if progress is not None:
+                progress.close()
                 
-            self.progress.animate_to(0.9)
-            self.progress_label.configure(text="90%")
+    def run_conversion(self, conversion_type, input_file, images, save_location, cancel_token=None):
+        """Dispatch to the FileConverter method for a conversion type"""
+        if conversion_type == "image_to_pdf" and images:
+            # Multi-image conversion
+            return self.converter.multi_image_to_pdf(images, save_location, cancel_token=cancel_token)
+            
+        # Single file conversion
+        if conversion_type == "pdf_to_word":
+            # Long PDFs are parsed as page ranges on half the cores
+            return self.converter.pdf_to_word(
+                input_file, save_location, workers=max(1, (os.cpu_count() or 2) // 2), cancel_token=cancel_token
+            )
+        elif conversion_type == "word_to_pdf":
+            return self.converter.word_to_pdf(input_file, save_location, cancel_token=cancel_token)
+        elif conversion_type == "word_to_ppt":
+            return self.converter.word_to_ppt(input_file, save_location, cancel_token=cancel_token)
+        elif conversion_type == "ppt_to_word":
+            return self.converter.ppt_to_word(input_file, save_location, cancel_token=cancel_token)
+        elif conversion_type == "image_to_pdf":
+            return self.converter.image_to_pdf(input_file, save_location, cancel_token=cancel_token)
+        raise Exception(f"Unsupported conversion type: {conversion_type}")
+        
+    def poll_jobs(self):
+        """Refresh job widgets from the scheduler on the Tk thread"""
+        if self.scheduler.version != self.jobs_version:
+            self.jobs_version = self.scheduler.version
+            jobs = self.scheduler.jobs()
+            self.job_queue_panel.update_jobs(jobs)
             
-            # Complete
+            # The progress bar follows the oldest running job
+            running = [job for job in jobs if job.status == "running"]
+            if running and running[0] is not self.shown_job:
+                self.shown_job = running[0]
+                self.status_indicator.set_status(f"Processing {running[0].description}... Please wait", "processing")
+                self.progress.animate_to(0)
+                self.progress_label.configure(text="0%")
+                
+            for job in jobs:
+                if job.is_finished and job.job_id not in self.handled_jobs:
+                    self.handled_jobs.add(job.job_id)
+                    self.on_job_finished(job)
+                    
+        self.root.after(200, self.poll_jobs)
+        
+    def on_progress_event(self, event):
+        """Show coalesced progress of the job the progress bar follows"""
+        stream = self.shown_job.kwargs.get('progress') if self.shown_job else None
+        if stream is None or event.stream_id != stream.stream_id:
+            return
+        self.progress.animate_to(event.percentage / 100)
+        self.progress_label.configure(text=f"{event.percentage:.0f}% - {event.message}" if event.message else f"{event.percentage:.0f}%")
+        
+    def on_job_finished(self, job):
+        """Report a finished job; only interactive jobs open dialogs"""
+        interactive = job.job_id in self.interactive_jobs
+        self.interactive_jobs.discard(job.job_id)
+        self.close_progress(job)
+        
+        if job.status == "done":
             self.progress.animate_to(1.0)
             self.progress_label.configure(text="100%")
-            self.status_indicator.set_status(f"Conversion completed successfully!", "success")
-            
-            # Show completion dialog with enhanced options
-            self.show_completion_dialog(output_file)
-            
-        except Exception as e:
+            self.status_indicator.set_status(f"Completed: {job.description}", "success")
+            if interactive:
+                # Show completion dialog with enhanced options
+                self.show_completion_dialog(job.result)
+        elif job.status == "failed":
+            self.progress.animate_to(0)
+            self.progress_label.configure(text="0%")
+            self.status_indicator.set_status(f"Conversion failed: {job.error}", "error")
+            if interactive:
+                messagebox.showerror("Conversion Error", f"An error occurred during conversion:\n\n{job.error}")
+        elif job.status == "cancelled":
             self.progress.animate_to(0)
             self.progress_label.configure(text="0%")
-            self.status_indicator.set_status(f"Conversion failed: {str(e)}", "error")
-            messagebox.showerror("Conversion Error", f"An error occurred during conversion:\n\n{str(e)}")
+            self.status_indicator.set_status(f"Cancelled: {job.description}", "warning")
+            
+    def cancel_job(self, job_id):
+        """Cancel a queued job, or stop a running one at its next page/slide/image"""
+        if self.scheduler.cancel(job_id):
+            self.status_indicator.set_status("Cancelling job...", "warning")
+        else:
+            self.status_indicator.set_status("Job has already finished", "warning")
+            
+    def on_job_changed(self, job):
+        """Scheduler listener (worker threads): release a finished job's progress stream"""
+        if job.is_finished:
+            self.close_progress(job)
+            
+    def close_progress(self, job):
+        """Close a job's progress stream so the bus stops tracking it"""
+        progress = job.kwargs.get('progress')
+        if progress is not None:
+            progress.close()
+            
+    def toggle_libreoffice_pool(self):
+        """Start or stop the LibreOffice pool without blocking the Tk loop"""
+        if not self.libreoffice_pool_switch.get():
+            self.converter.stop_libreoffice_pool()
+            self.status_indicator.set_status("LibreOffice pool stopped", "info")
+            return
+            
+        # Starting the instances takes a few seconds; the switch stays locked meanwhile
+        self.libreoffice_pool_switch.configure(state="disabled")
+        self.status_indicator.set_status("Starting LibreOffice pool...", "processing")
+        started = []
+        thread = threading.Thread(
+            target=lambda: started.append(self.converter.start_libreoffice_pool()), daemon=True
+        )
+        thread.start()
+        self.root.after(200, self.check_libreoffice_pool, thread, started)
+        
+    def check_libreoffice_pool(self, thread, started):
+        """Report the outcome of toggle_libreoffice_pool on the Tk thread"""
+        if thread.is_alive():
+            self.root.after(200, self.check_libreoffice_pool, thread, started)
+            return
+        self.libreoffice_pool_switch.configure(state="normal")
+        if started and started[0]:
+            self.status_indicator.set_status("LibreOffice pool running", "success")
+        else:
+            self.libreoffice_pool_switch.deselect()
+            self.status_indicator.set_status("LibreOffice pool unavailable (needs LibreOffice and python3-uno)", "warning")
             
+    def move_job(self, job_id, offset):
+        """Move a queued job up or down the queue"""
+        self.scheduler.move(job_id, offset)
+        
     def show_completion_dialog(self, output_file):
         """Show enhanced completion dialog"""
         file_name = Path(output_file).name
@@ -881,13 +1020,41 @@ Select a conversion type and file to get started!
             messagebox.showwarning("Warning", f"Could not open file location:\n{str(e)}")
             
     def open_batch_converter(self):
-        """Open batch conversion window (placeholder for future implementation)"""
-        messagebox.showinfo(
-            "Coming Soon", 
-            "Batch conversion feature will be available in the next update!\n\n"
-            "Stay tuned for more awesome features."
+        """Queue several files as background batch jobs"""
+        conversion_type = self.conversion_type.get()
+        if conversion_type == "edit_pdf":
+            messagebox.showerror("Batch Mode", "PDF editing cannot run in batch mode!")
+            return
+            
+        filenames = filedialog.askopenfilenames(
+            title=f"Select files for {self.get_conversion_display_name()} - Converter | Space by Dammytech"
         )
-        
+        if not filenames:
+            return
+            
+        queued = 0
+        skipped = []
+        for filename in filenames:
+            if not self.validate_conversion(Path(filename).suffix.lower(), conversion_type):
+                skipped.append(Path(filename).name)
+                continue
+            save_location = str(self.save_location or Path(filename).parent)
+            self.scheduler.submit(
+                self.perform_conversion, conversion_type, filename, [], save_location,
+                description=f"{self.get_conversion_display_name()}: {Path(filename).name}",
+                priority=PRIORITY_BATCH,
+                cancel_token=CancellationToken(),
+                progress=self.progress_bus.stream()
+            )
+            queued += 1
+            
+        self.status_indicator.set_status(f"Queued {queued} batch job(s)", "info")
+        if skipped:
+            messagebox.showwarning(
+                "Batch Mode",
+                f"Skipped {len(skipped)} incompatible file(s):\n\n" + "\n".join(skipped[:10])
+            )
+            
     def run(self):
         """Run the application"""
         # Center window on screen
@@ -0,0 +1,155 @@
+import threading
+import tracemalloc
+
+
+def _proc_status_bytes(field):
+    """Read a memory field such as VmRSS or VmHWM from /proc/self/status"""
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def current_rss_bytes():
+    """Resident set size of this process right now, or None where unsupported"""
+    return _proc_status_bytes('VmRSS')
+
+
+# Running peaks of the measurements in progress; see begin_peak_rss
+_open_peaks = []
+_peaks_lock = threading.Lock()
+
+
+def _reset_peak_rss():
+    """Reset the kernel's VmHWM counter to the current RSS (Linux 4.0+)"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as clear_refs:
+            clear_refs.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _fold_peak_rss():
+    # Called with _peaks_lock held, before every reset and at every end
+    peak = _proc_status_bytes('VmHWM')
+    if peak is not None:
+        for mark in _open_peaks:
+            mark[0] = max(mark[0], peak)
+
+
+def begin_peak_rss():
+    """Start measuring this process's peak RSS from now on
+
+    Returns a mark for end_peak_rss(), or None where the peak cannot be
+    reset (no /proc/self/clear_refs), in which case only the process's
+    lifetime peak is known. Measurements nest: the counter is folded into
+    every open mark before it is reset. Conversions running at the same
+    time in other threads share the process, so their peaks count too.
+    """
+    with _peaks_lock:
+        _fold_peak_rss()
+        if not _reset_peak_rss():
+            return None
+        mark = [_proc_status_bytes('VmHWM') or 0]
+        _open_peaks.append(mark)
+        return mark
+
+
+def end_peak_rss(mark):
+    """Peak RSS in bytes since begin_peak_rss() returned mark"""
+    with _peaks_lock:
+        _fold_peak_rss()
+        # By identity: another open mark may hold the same value
+        _open_peaks[:] = [open_mark for open_mark in _open_peaks if open_mark is not mark]
+        return mark[0]
+
+
+class MemoryAccounting:
+    """Per-span memory high-water marks for ConversionMetrics
+
+    For every conversion and stage it records resident memory before and
+    after, the peak RSS while the span ran (rss_peak; where the kernel
+    counter cannot be reset only the process lifetime peak is known, which
+    is reported as rss_process_peak instead) and the peak of Python
+    allocations (tracemalloc). The allocation sites that
+    grew the most are listed per conversion, and per stage with
+    stage_top=True; each listing costs two heap snapshots, which dominate
+    run time on documents with millions of objects. tracemalloc itself slows
+    Python code down and its peak counter is process-wide, so this is opt-in
+    and meant for one conversion at a time (CLI runs, batch worker processes,
+    benchmarks).
+    """
+
+    def __init__(self, top=10, stage_top=False, frames=1):
+        self.top = top
+        self.stage_top = stage_top
+        self.frames = frames
+        self._started_tracing = False
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+
+    def stop(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def begin(self, span):
+        span.memory = {
+            'rss_start': current_rss_bytes(),
+            'child_python_peak': 0,
+            'snapshot': self._snapshot() if self.top and (span.parent is None or self.stage_top) else None,
+        }
+        span.memory['rss_mark'] = begin_peak_rss()
+        tracemalloc.reset_peak()
+
+    def end(self, span):
+        state = span.memory
+        _, peak = tracemalloc.get_traced_memory()
+        python_peak = max(peak, state['child_python_peak'])
+
+        top = []
+        if state['snapshot'] is not None:
+            stats = self._snapshot().compare_to(state['snapshot'], 'lineno')
+            for stat in stats[:self.top]:
+                if stat.size_diff <= 0:
+                    break
+                frame = stat.traceback[0]
+                top.append({
+                    'where': f"{frame.filename}:{frame.lineno}",
+                    'size_diff': stat.size_diff,
+                    'count_diff': stat.count_diff,
+                })
+
+        span.memory = {
+            'rss_start': state['rss_start'],
+            'rss_end': current_rss_bytes(),
+            'python_peak': python_peak,
+        }
+        if state['rss_mark'] is not None:
+            span.memory['rss_peak'] = end_peak_rss(state['rss_mark'])
+        else:
+            span.memory['rss_process_peak'] = _proc_status_bytes('VmHWM')
+        if state['snapshot'] is not None:
+            span.memory['top_allocations'] = top
+
+        # The parent's own peak counter was reset when this span began
+        parent = span.parent
+        if parent is not None and isinstance(getattr(parent, 'memory', None), dict) and 'child_python_peak' in parent.memory:
+            parent.memory['child_python_peak'] = max(parent.memory['child_python_peak'], python_peak)
+
+    def _snapshot(self):
+        # Leave out tracemalloc's own bookkeeping and modules imported lazily mid-conversion
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        ))
@@ -0,0 +1,55 @@
+import os
+import threading
+from collections import OrderedDict
+
+
+class MetadataCache:
+    """In-memory LRU cache of per-file metadata, validated against the file's stat
+
+    Entries are keyed by resolved path and remembered together with the
+    file's size and modification time; a lookup costs one stat() and only
+    reruns the loader when either changed. Shared by the main window and the
+    PDF editor through FileConverter.get_file_info.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # path -> (size, mtime_ns, value), oldest first
+        self._lock = threading.Lock()
+
+    def get(self, path, loader):
+        """Return loader(path, stat_result), reusing the cached value while the file is unchanged"""
+        key = os.path.realpath(path)
+        stat = os.stat(key)
+        signature = (stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[:2] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        # Load outside the lock so slow files don't block other lookups
+        value = loader(path, stat)
+
+        with self._lock:
+            self._entries[key] = signature + (value,)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, path):
+        with self._lock:
+            self._entries.pop(os.path.realpath(path), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
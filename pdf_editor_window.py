@@ -9,11 +9,13 @@ import tempfile
 import os
 
 class PDFEditorWindow:
-    def __init__(self, parent, pdf_file, save_callback=None, colors=None):
+    def __init__(self, parent, pdf_file, save_callback=None, colors=None, file_info=None):
         self.parent = parent
         self.pdf_file = pdf_file
         self.save_callback = save_callback
         self.colors = colors or self.get_default_colors()
+        # Cached lookup shared with the main window (FileConverter.get_file_info)
+        self.file_info = file_info
         
         # PDF data
         self.pdf_reader = None
@@ -586,10 +588,23 @@ Operations Available:
             self.page_info_area.delete("1.0", tk.END)
             self.page_info_area.insert("1.0", page_info)
             
+    def get_document_info(self):
+        """Size, encryption and metadata of the file on disk"""
+        if self.file_info is not None:
+            info = self.file_info(self.pdf_file)
+            if info.get('type') == 'PDF Document':
+                return info
+        return {
+            'size': os.path.getsize(self.pdf_file),
+            'encrypted': self.pdf_reader.is_encrypted,
+            'metadata': self.pdf_reader.metadata or {}
+        }
+        
     def update_document_info(self):
         """Update document information"""
         try:
-            info = self.pdf_reader.metadata
+            document = self.get_document_info()
+            info = document['metadata']
             doc_info = f"""DOCUMENT METADATA
 {'='*30}
 
@@ -604,8 +619,8 @@ DOCUMENT STATISTICS
 {'='*30}
 
 Total Pages: {self.total_pages}
-File Size: {self.get_file_size()}
-Encrypted: {'Yes' if self.pdf_reader.is_encrypted else 'No'}
+File Size: {self.format_size(document['size'])}
+Encrypted: {'Yes' if document['encrypted'] else 'No'}
 
 EDITING STATUS
 {'='*30}
@@ -624,15 +639,17 @@ Changes: {'Pending save' if self.modified else 'None'}
     def get_file_size(self):
         """Get formatted file size"""
         try:
-            size = os.path.getsize(self.pdf_file)
-            for unit in ['B', 'KB', 'MB', 'GB']:
-                if size < 1024:
-                    return f"{size:.1f} {unit}"
-                size /= 1024
-            return f"{size:.1f} TB"
+            return self.format_size(self.get_document_info()['size'])
         except:
             return "Unknown"
             
+    def format_size(self, size):
+        for unit in ['B', 'KB', 'MB', 'GB']:
+            if size < 1024:
+                return f"{size:.1f} {unit}"
+            size /= 1024
+        return f"{size:.1f} TB"
+            
     # Navigation methods
     def prev_page(self):
         if self.current_page > 0:
@@ -713,11 +730,23 @@ Changes: {'Pending save' if self.modified else 'None'}
     def save_pdf_to_path(self, save_path):
         """Save PDF to specified path"""
         try:
-            with open(save_path, 'wb') as output_file:
-                self.pdf_writer.write(output_file)
+            # Write a new file and swap it in: the old one may be hard-linked
+            # to a conversion cache entry, which must not change with it
+            temp_path = f"{save_path}.saving"
+            try:
+                with open(temp_path, 'wb') as output_file:
+                    self.pdf_writer.write(output_file)
+                os.replace(temp_path, save_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
                 
+
             self.modified = False
             self.status_label.configure(text=f"✅ PDF saved successfully")
+            if save_path == self.pdf_file:
+                self.update_document_info()
             
             if self.save_callback:
                 self.save_callback(save_path)
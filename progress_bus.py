@@ -0,0 +1,140 @@
+import itertools
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressEvent:
+    """One coalesced progress update of a job"""
+
+    __slots__ = ('stream_id', 'percentage', 'message', 'timestamp', 'final')
+
+    def __init__(self, stream_id, percentage, message, final=False):
+        self.stream_id = stream_id
+        self.percentage = percentage
+        self.message = message
+        self.timestamp = time.monotonic()
+        self.final = final
+
+    def __repr__(self):
+        return f"<ProgressEvent {self.stream_id} {self.percentage:.1f}% {self.message!r}>"
+
+
+class ProgressStream:
+    """Rate-limited progress callback for a single job
+
+    Call it like a FileConverter progress callback: stream(percentage,
+    message). At most max_rate updates per second reach the sink; in between
+    only the latest update is kept, and flush() (or close()) delivers it.
+    Updates of 100% always go through. Safe to call from any thread.
+    """
+
+    def __init__(self, sink, stream_id=None, max_rate=10.0):
+        self.sink = sink
+        self.stream_id = stream_id
+        self.min_interval = 1.0 / max_rate if max_rate else 0.0
+        self._lock = threading.Lock()
+        self._latest = None
+        self._last_sent = 0.0
+        self.closed = False
+
+    def __call__(self, percentage, message=""):
+        now = time.monotonic()
+        with self._lock:
+            if self.closed:
+                return
+            self._latest = (percentage, message)
+            if percentage < 100 and now - self._last_sent < self.min_interval:
+                return
+            self._send(now)
+
+    def _send(self, now, final=False):
+        percentage, message = self._latest
+        self._latest = None
+        self._last_sent = now
+        self.sink(ProgressEvent(self.stream_id, percentage, message, final))
+
+    def flush(self, max_age=0.0):
+        """Deliver the update held back by rate limiting, if any
+
+        With max_age, only deliver it once the rate limit has passed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._latest is not None and now - self._last_sent >= max_age:
+                self._send(now)
+
+    def close(self):
+        """Flush and stop accepting updates"""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            if self._latest is not None:
+                self._send(time.monotonic(), final=True)
+
+
+class ProgressBus:
+    """Per-job progress streams funnelled into one thread-safe queue
+
+    Worker threads report through their own stream; the consumer (normally
+    the Tk main loop, see attach_tk) drains the queue and receives at most
+    one event per stream per drain, so a burst of thousands of updates costs
+    the UI thread a handful of callbacks.
+    """
+
+    def __init__(self, max_rate=10.0):
+        self.max_rate = max_rate
+        self._queue = queue.SimpleQueue()
+        self._streams = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def stream(self, stream_id=None):
+        """Open a stream; ids are assigned automatically when not given"""
+        with self._lock:
+            if stream_id is None:
+                stream_id = next(self._ids)
+            stream = ProgressStream(self._queue.put, stream_id, self.max_rate)
+            self._streams[stream_id] = stream
+        return stream
+
+    def drain(self):
+        """Return pending events, keeping only the latest one of each stream"""
+        with self._lock:
+            streams = list(self._streams.items())
+        for stream_id, stream in streams:
+            # Updates held back by rate limiting go out once their slot passes
+            stream.flush(max_age=stream.min_interval)
+            if stream.closed:
+                with self._lock:
+                    self._streams.pop(stream_id, None)
+
+        latest = {}
+        while True:
+            try:
+                event = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            latest[event.stream_id] = event
+        return list(latest.values())
+
+    def attach_tk(self, widget, handler, interval_ms=50):
+        """Drain on the Tk main loop every interval_ms, calling handler(event)"""
+        def pump():
+            for event in self.drain():
+                try:
+                    handler(event)
+                except Exception as e:
+                    logger.warning(f"Progress handler failed: {str(e)}")
+            widget.after(interval_ms, pump)
+
+        widget.after(interval_ms, pump)
+
+
+def throttle(callback, max_rate=10.0):
+    """Rate-limit a plain progress callback(percentage, message)"""
+    return ProgressStream(lambda event: callback(event.percentage, event.message), max_rate=max_rate)
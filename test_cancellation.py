@@ -0,0 +1,94 @@
+import threading
+import time
+
+import pytest
+from PIL import Image
+
+from cancellation import CancellationToken, ConversionCancelled, ConversionTimeout
+from file_converter import FileConverter
+
+
+@pytest.fixture
+def converter(tmp_path, monkeypatch):
+    # FileConverter logs to converter.log in the working directory
+    monkeypatch.chdir(tmp_path)
+    return FileConverter()
+
+
+@pytest.fixture
+def images(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"image{i}.png"
+        Image.new('RGB', (32, 24), 'blue').save(path)
+        paths.append(str(path))
+    return paths
+
+
+def flood_progress(self, input_path, output_dir, cancel_token=None, **options):
+    """A conversion that never finishes but keeps reporting progress"""
+    while True:
+        self.update_progress(50, "still going")
+
+
+def test_token_cancel_and_timeout():
+    token = CancellationToken()
+    assert not token.cancelled and token.remaining() is None
+    token.cancel()
+    with pytest.raises(ConversionCancelled):
+        token.raise_if_cancelled()
+
+    token = CancellationToken(timeout=0.05)
+    time.sleep(0.1)
+    assert token.timed_out and token.remaining() == 0.0
+    with pytest.raises(ConversionTimeout):
+        token.raise_if_cancelled()
+
+
+def test_convert_file_reports_cancelled_and_timed_out(converter, images, tmp_path):
+    token = CancellationToken()
+    token.cancel()
+    result = converter.convert_file(images[0], 'image_to_pdf', str(tmp_path), cancel_token=token)
+    assert result['cancelled'] and not result['timed_out']
+    assert result['output'] is None
+
+    token = CancellationToken(timeout=0)
+    result = converter.convert_file(images[0], 'image_to_pdf', str(tmp_path), cancel_token=token)
+    assert result['timed_out'] and not result['cancelled']
+
+
+def test_batch_convert_reports_every_file_cancelled(converter, images, tmp_path):
+    token = CancellationToken()
+    token.cancel()
+    results = converter.batch_convert(images, 'image_to_pdf', str(tmp_path), cancel_token=token)
+    assert [result['cancelled'] for result in results] == [True] * 3
+
+
+def test_isolated_conversion_runs_to_completion(converter, images, tmp_path):
+    result = converter.convert_isolated(images[0], 'image_to_pdf', str(tmp_path), timeout=30)
+    assert result['error'] is None
+    assert result['output'].endswith('.pdf')
+
+
+def test_isolated_worker_flooding_progress_is_killed_at_the_deadline(converter, images, tmp_path, monkeypatch):
+    # The worker is forked, so it inherits the patched method
+    monkeypatch.setattr(FileConverter, 'image_to_pdf', flood_progress)
+    start = time.monotonic()
+    result = converter.convert_isolated(
+        images[0], 'image_to_pdf', str(tmp_path), timeout=0.5, progress_callback=lambda *args: None
+    )
+    assert time.monotonic() - start < 5
+    assert result['timed_out']
+    assert "timed out after 0.5s" in result['error']
+
+
+def test_isolated_worker_flooding_progress_is_killed_on_cancel(converter, images, tmp_path, monkeypatch):
+    monkeypatch.setattr(FileConverter, 'image_to_pdf', flood_progress)
+    token = CancellationToken()
+    threading.Timer(0.3, token.cancel).start()
+    start = time.monotonic()
+    result = converter.convert_isolated(
+        images[0], 'image_to_pdf', str(tmp_path), cancel_token=token, progress_callback=lambda *args: None
+    )
+    assert time.monotonic() - start < 5
+    assert result['cancelled']
@@ -0,0 +1,144 @@
+import os
+import stat
+
+import docx
+import pptx
+import pytest
+
+from conversion_cache import ConversionCache
+from file_converter import FileConverter
+
+
+def write(path, data):
+    path.write_bytes(data)
+    return path
+
+
+def test_key_depends_on_content_type_and_options(tmp_path):
+    cache = ConversionCache(tmp_path / "cache")
+    a = write(tmp_path / "a.docx", b"same bytes")
+    renamed = write(tmp_path / "renamed.docx", b"same bytes")
+    other = write(tmp_path / "other.docx", b"other bytes")
+
+    key = cache.make_key(a, 'word_to_pdf')
+    assert cache.make_key(renamed, 'word_to_pdf') == key
+    assert cache.make_key(other, 'word_to_pdf') != key
+    assert cache.make_key(a, 'word_to_ppt') != key
+    assert cache.make_key(a, 'word_to_pdf', {'method': 'x'}) != key
+    assert cache.make_key(a, 'word_to_pdf', {'a': 1, 'b': 2}) == cache.make_key(a, 'word_to_pdf', {'b': 2, 'a': 1})
+
+
+def test_store_and_fetch(tmp_path):
+    cache = ConversionCache(tmp_path / "cache")
+    output = write(tmp_path / "out.pdf", b"%PDF converted")
+    cache.store("ab" * 32, output)
+
+    restored = tmp_path / "restored.pdf"
+    assert cache.fetch("ab" * 32, restored)
+    assert restored.read_bytes() == b"%PDF converted"
+    assert not cache.fetch("cd" * 32, tmp_path / "missing.pdf")
+    assert (cache.hits, cache.misses, cache.stores) == (1, 1, 1)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ConversionCache(tmp_path / "cache", max_bytes=250)
+    keys = [f"{i:02d}" * 32 for i in range(3)]
+    for key in keys[:2]:
+        cache.store(key, write(tmp_path / f"{key[:2]}.pdf", b"x" * 100))
+
+    # Touch the oldest entry so the second one becomes least recently used
+    assert cache.fetch(keys[0], tmp_path / "hit.pdf")
+    cache.store(keys[2], write(tmp_path / "new.pdf", b"y" * 100))
+
+    assert cache.evictions == 1
+    assert cache.fetch(keys[0], tmp_path / "a.pdf")
+    assert not cache.fetch(keys[1], tmp_path / "b.pdf")
+    assert cache.fetch(keys[2], tmp_path / "c.pdf")
+    assert cache.stats()['size_bytes'] == 200
+
+
+def test_index_survives_reopening(tmp_path):
+    cache = ConversionCache(tmp_path / "cache")
+    cache.store("ef" * 32, write(tmp_path / "out.pdf", b"data"))
+
+    reopened = ConversionCache(tmp_path / "cache")
+    assert reopened.stats()['entries'] == 1
+    assert reopened.fetch("ef" * 32, tmp_path / "again.pdf")
+
+
+def test_rewriting_a_fetched_output_leaves_the_cache_intact(tmp_path):
+    cache = ConversionCache(tmp_path / "cache")
+    cache.store("12" * 32, write(tmp_path / "out.pdf", b"original"))
+
+    output = tmp_path / "fetched.pdf"
+    assert cache.fetch("12" * 32, output)
+    assert os.stat(output).st_nlink == 1
+    with open(output, 'r+b') as f:
+        f.write(b"EDITED!!")
+
+    assert cache.fetch("12" * 32, tmp_path / "second.pdf")
+    assert (tmp_path / "second.pdf").read_bytes() == b"original"
+
+
+def test_hardlinked_hits_share_a_read_only_object(tmp_path):
+    cache = ConversionCache(tmp_path / "cache", use_hardlinks=True)
+    cache.store("34" * 32, write(tmp_path / "out.pdf", b"original"))
+
+    output = tmp_path / "fetched.pdf"
+    assert cache.fetch("34" * 32, output)
+    assert os.stat(output).st_nlink == 2
+    assert not os.stat(output).st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+    # Replacing the output (as converters and the PDF editor do) keeps the cache intact
+    write(tmp_path / "replacement.pdf", b"new output")
+    os.replace(tmp_path / "replacement.pdf", output)
+    assert cache.fetch("34" * 32, tmp_path / "second.pdf")
+    assert (tmp_path / "second.pdf").read_bytes() == b"original"
+
+    cache.clear()
+    assert cache.stats()['entries'] == 0
+
+
+@pytest.fixture
+def converter(tmp_path, monkeypatch):
+    # FileConverter logs to converter.log in the working directory
+    monkeypatch.chdir(tmp_path)
+    converter = FileConverter()
+    converter.enable_cache(tmp_path / "cache")
+    for name in ("out", "again"):
+        (tmp_path / name).mkdir()
+    return converter
+
+
+def test_editing_an_output_after_a_cache_hit_does_not_change_the_cache(converter, tmp_path):
+    document = docx.Document()
+    document.add_heading("Title", level=1)
+    document.add_paragraph("Body text")
+    source = tmp_path / "doc.docx"
+    document.save(source)
+
+    first = converter.convert_file(str(source), 'word_to_ppt', str(tmp_path / "out"))
+    original = open(first['output'], 'rb').read()
+
+    second = converter.convert_file(str(source), 'word_to_ppt', str(tmp_path / "out"))
+    assert second['cache_hit']
+    # Rewrite the output in place, as an editor saving over the file would
+    with open(second['output'], 'r+b') as f:
+        f.write(b"corrupted")
+
+    third = converter.convert_file(str(source), 'word_to_ppt', str(tmp_path / "again"))
+    assert third['cache_hit']
+    assert open(third['output'], 'rb').read() == original
+
+
+def test_ppt_to_word_is_not_cached(converter, tmp_path):
+    presentation = pptx.Presentation()
+    presentation.slides.add_slide(presentation.slide_layouts[1]).shapes.title.text = "Slide"
+    source = tmp_path / "deck.pptx"
+    presentation.save(source)
+
+    for output_dir in ("out", "again"):
+        result = converter.convert_file(str(source), 'ppt_to_word', str(tmp_path / output_dir))
+        assert result['error'] is None
+        assert not result['cache_hit']
+    assert converter.cache_stats()['stores'] == 0
@@ -0,0 +1,91 @@
+import json
+import time
+
+import pytest
+from PIL import Image
+
+from conversion_metrics import ConversionMetrics
+from file_converter import FileConverter
+
+
+def test_stages_split_a_span():
+    metrics = ConversionMetrics()
+    with metrics.span('image_to_pdf', file='a.png') as span:
+        metrics.stage('decode')
+        time.sleep(0.02)
+        metrics.stage('encode')
+        time.sleep(0.01)
+
+    assert set(span.stages) == {'decode', 'encode'}
+    assert span.stages['decode'] >= 0.02
+    assert sum(span.stages.values()) <= span.duration
+    assert metrics.last_finished() is span
+    assert metrics.current() is None
+    totals = metrics.totals()
+    assert totals[('image_to_pdf', 'total')][1] == 1
+    assert totals[('image_to_pdf', 'decode')][1] == 1
+
+
+def test_stage_outside_a_span_is_ignored():
+    metrics = ConversionMetrics()
+    metrics.stage('decode')
+    assert metrics.totals() == {}
+
+
+def test_failed_span_records_the_error():
+    metrics = ConversionMetrics()
+    with pytest.raises(ValueError):
+        with metrics.span('pdf_to_word') as span:
+            raise ValueError("bad")
+    assert span.attributes['error'] == 'ValueError'
+    assert metrics.totals()[('pdf_to_word', 'total')][1] == 1
+
+
+def test_record_stages_adds_worker_timings():
+    metrics = ConversionMetrics()
+    metrics.record_stages('word_to_pdf', {'render': 1.5}, total=2.0)
+    metrics.record_stages('word_to_pdf', {'render': 0.5}, total=1.0)
+    assert metrics.totals() == {
+        ('word_to_pdf', 'render'): (2.0, 2),
+        ('word_to_pdf', 'total'): (3.0, 2),
+    }
+
+
+def test_write_prometheus(tmp_path):
+    metrics = ConversionMetrics()
+    metrics.record_stages('word_to_pdf', {'render': 1.25}, total=2.0)
+    path = tmp_path / "converter.prom"
+    metrics.write_prometheus(path)
+
+    text = path.read_text()
+    assert '# TYPE converter_stage_duration_seconds summary' in text
+    assert 'converter_stage_duration_seconds_sum{conversion="word_to_pdf",stage="render"} 1.250000' in text
+    assert 'converter_stage_duration_seconds_count{conversion="word_to_pdf",stage="total"} 1' in text
+    assert not (tmp_path / "converter.prom.tmp").exists()
+
+
+def test_write_trace(tmp_path):
+    metrics = ConversionMetrics()
+    with metrics.span('image_to_pdf', file='a.png'):
+        metrics.stage('decode')
+    path = tmp_path / "trace.json"
+    metrics.write_trace(path)
+
+    events = json.loads(path.read_text())['traceEvents']
+    assert [event['name'] for event in events] == ['decode', 'image_to_pdf']
+    assert all(event['ph'] == 'X' and event['cat'] == 'image_to_pdf' for event in events)
+    assert events[1]['args'] == {'file': 'a.png'}
+
+
+def test_convert_file_reports_its_stages(tmp_path, monkeypatch):
+    # FileConverter logs to converter.log in the working directory
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "image.png"
+    Image.new('RGBA', (40, 30), 'red').save(path)
+
+    converter = FileConverter()
+    result = converter.convert_file(str(path), 'image_to_pdf', str(tmp_path))
+
+    assert result['error'] is None
+    assert {'enhance', 'encode'} <= set(result['stages'])
+    assert converter.metrics.totals()[('image_to_pdf', 'total')][1] == 1
@@ -0,0 +1,89 @@
+import zipfile
+
+import docx
+import pptx
+import pypdf
+from reportlab.pdfgen import canvas
+
+from document_probe import probe_docx, probe_file, probe_pdf, probe_pptx
+
+
+def make_pdf(path, pages, title=None):
+    pdf = canvas.Canvas(str(path))
+    if title:
+        pdf.setTitle(title)
+    for page in range(pages):
+        pdf.drawString(72, 720, f"Page {page + 1}")
+        pdf.showPage()
+    pdf.save()
+
+
+def test_probe_pdf_pages_and_metadata(tmp_path):
+    path = tmp_path / "doc.pdf"
+    make_pdf(path, 3, title="Report")
+    info = probe_pdf(path)
+    assert info['type'] == 'PDF Document'
+    assert info['pages'] == 3
+    assert info['encrypted'] is False
+    assert info['metadata']['/Title'] == "Report"
+
+
+def test_probe_pdf_encrypted(tmp_path):
+    plain = tmp_path / "plain.pdf"
+    make_pdf(plain, 2)
+    writer = pypdf.PdfWriter(clone_from=str(plain))
+    writer.encrypt(user_password="secret", owner_password="owner")
+    encrypted = tmp_path / "encrypted.pdf"
+    with open(encrypted, 'wb') as f:
+        writer.write(f)
+
+    info = probe_pdf(encrypted)
+    assert info['encrypted'] is True
+    assert info['pages'] == 2
+
+
+def test_probe_docx_counts_non_blank_body_paragraphs(tmp_path):
+    document = docx.Document()
+    for text in ("one", "", "two", "three"):
+        document.add_paragraph(text)
+    path = tmp_path / "doc.docx"
+    document.save(path)
+
+    info = probe_docx(path)
+    assert info['type'] == 'Word Document'
+    assert info['paragraphs'] == 3
+
+
+def test_probe_docx_prefers_app_properties(tmp_path):
+    document = docx.Document()
+    document.add_paragraph("only one")
+    source = tmp_path / "source.docx"
+    document.save(source)
+
+    # Rewrite docProps/app.xml with the count an authoring application would save
+    path = tmp_path / "doc.docx"
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(path, 'w') as dst:
+        for item in src.infolist():
+            data = src.read(item)
+            if item.filename == 'docProps/app.xml':
+                data = data.replace(b'<Paragraphs>0</Paragraphs>', b'<Paragraphs>42</Paragraphs>')
+            dst.writestr(item, data)
+
+    assert probe_docx(path)['paragraphs'] == 42
+
+
+def test_probe_pptx_slide_count(tmp_path):
+    presentation = pptx.Presentation()
+    for _ in range(4):
+        presentation.slides.add_slide(presentation.slide_layouts[6])
+    path = tmp_path / "deck.pptx"
+    presentation.save(path)
+
+    assert probe_pptx(path) == {'type': 'PowerPoint Presentation', 'slides': 4}
+
+
+def test_probe_file_dispatches_on_suffix(tmp_path):
+    path = tmp_path / "doc.pdf"
+    make_pdf(path, 1)
+    assert probe_file(path)['pages'] == 1
+    assert probe_file(tmp_path / "image.png") == {}
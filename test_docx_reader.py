@@ -0,0 +1,62 @@
+import io
+
+import docx
+import pytest
+from PIL import Image
+
+from docx_reader import DocxParagraph, DocxReader, DocxTableRow
+
+
+@pytest.fixture
+def sample_docx(tmp_path):
+    document = docx.Document()
+    document.core_properties.title = "Sample"
+    document.core_properties.author = "Tester"
+    document.add_heading("Introduction", level=1)
+    document.add_paragraph("First paragraph")
+    document.add_paragraph("")
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "a"
+    table.cell(0, 1).text = "b"
+    table.cell(1, 0).text = "c"
+    table.cell(1, 1).text = "d"
+    image = io.BytesIO()
+    Image.new('RGB', (40, 20), 'red').save(image, format='PNG')
+    image.seek(0)
+    document.add_picture(image)
+    document.add_paragraph("Last paragraph", style='Quote')
+    path = tmp_path / "sample.docx"
+    document.save(path)
+    return path
+
+
+def test_paragraphs_match_python_docx(sample_docx):
+    expected = [(p.text, p.style.name) for p in docx.Document(sample_docx).paragraphs]
+    with DocxReader(sample_docx) as reader:
+        assert [(p.text, p.style) for p in reader.paragraphs()] == expected
+
+
+def test_core_properties(sample_docx):
+    with DocxReader(sample_docx) as reader:
+        properties = reader.core_properties()
+    assert properties['title'] == "Sample"
+    assert properties['author'] == "Tester"
+    assert properties['subject'] == ""
+
+
+def test_blocks_yield_table_rows_and_images_in_order(sample_docx):
+    with DocxReader(sample_docx) as reader:
+        blocks = list(reader.blocks())
+        rows = [block for block in blocks if isinstance(block, DocxTableRow)]
+        assert [row.cells for row in rows] == [['a', 'b'], ['c', 'd']]
+        assert len({row.table for row in rows}) == 1
+
+        images = [image for block in blocks if isinstance(block, DocxParagraph) for image in block.images]
+        assert len(images) == 1
+        assert images[0].width > 0 and images[0].height > 0
+        assert reader.read_part(images[0].part)[:8] == b'\x89PNG\r\n\x1a\n'
+
+        # The table sits between the paragraphs that surround it in the document
+        texts = [block.text if isinstance(block, DocxParagraph) else 'TABLE' for block in blocks]
+        assert texts.index('First paragraph') < texts.index('TABLE') < texts.index('Last paragraph')
+        assert reader.progress == 1.0
@@ -0,0 +1,48 @@
+import pytest
+from PIL import Image
+
+from file_converter import BATCH_CONVERSIONS, CONVERSION_TYPES, FileConverter
+
+
+@pytest.fixture
+def converter(tmp_path, monkeypatch):
+    # FileConverter logs to converter.log in the working directory
+    monkeypatch.chdir(tmp_path)
+    return FileConverter()
+
+
+@pytest.fixture
+def images(tmp_path):
+    paths = []
+    for i, color in enumerate(('red', 'green')):
+        path = tmp_path / f"image{i}.png"
+        Image.new('RGB', (32, 24), color).save(path)
+        paths.append(str(path))
+    return paths
+
+
+def test_multi_image_to_pdf_is_rejected_by_batch_convert(converter, images, tmp_path):
+    assert 'multi_image_to_pdf' in CONVERSION_TYPES
+    assert 'multi_image_to_pdf' not in BATCH_CONVERSIONS
+
+    results = converter.batch_convert(images, 'multi_image_to_pdf', str(tmp_path))
+    assert [result['input'] for result in results] == images
+    assert all(result['output'] is None for result in results)
+    assert all("Unsupported conversion type" in result['error'] for result in results)
+
+
+def test_convert_file_checks_the_input_shape(converter, images, tmp_path):
+    result = converter.convert_file(images[0], 'multi_image_to_pdf', str(tmp_path))
+    assert result['output'] is None and result['error']
+
+    result = converter.convert_file(images, 'image_to_pdf', str(tmp_path))
+    assert result['output'] is None and result['error']
+
+    result = converter.convert_file(images, 'multi_image_to_pdf', str(tmp_path))
+    assert result['error'] is None
+    assert result['output'].endswith('.pdf')
+
+
+def test_unknown_conversion_type_is_reported_per_file(converter, images, tmp_path):
+    result = converter.convert_file(images[0], 'image_to_mp3', str(tmp_path))
+    assert "Unsupported conversion type" in result['error']
@@ -0,0 +1,56 @@
+import pypdf
+import pytest
+from PIL import Image
+
+from file_converter import IMAGE_PDF_OPTIONS, FileConverter
+
+MAX_SIZE = IMAGE_PDF_OPTIONS['max_size']
+
+
+@pytest.fixture
+def converter(tmp_path, monkeypatch):
+    # FileConverter logs to converter.log in the working directory
+    monkeypatch.chdir(tmp_path)
+    return FileConverter()
+
+
+def save(tmp_path, name, size, **options):
+    path = tmp_path / name
+    Image.new('RGB', size, (90, 140, 30)).save(path, **options)
+    return path
+
+
+def test_small_images_are_left_alone(converter, tmp_path):
+    path = save(tmp_path, "small.jpg", (640, 480))
+    with Image.open(path) as img:
+        assert converter._reduce_on_decode(img, MAX_SIZE) is img
+        assert img.size == (640, 480)
+
+
+def test_jpeg_is_decoded_at_a_reduced_scale(converter, tmp_path):
+    path = save(tmp_path, "big.jpg", (9000, 6000))
+    with Image.open(path) as img:
+        reduced = converter._reduce_on_decode(img, MAX_SIZE)
+        reduced.load()
+
+    # The final size is 2000x1333; a 1/4 DCT scale is the smallest that covers it
+    assert reduced.size == (2250, 1500)
+
+
+def test_png_is_box_reduced_to_at_least_twice_the_final_size(converter, tmp_path):
+    path = save(tmp_path, "big.png", (8400, 4200))
+    with Image.open(path) as img:
+        reduced = converter._reduce_on_decode(img, MAX_SIZE)
+
+    # Final size is 2000x1000, so 4200x2100 (a factor of 2) is as far as it goes
+    assert reduced.size == (4200, 2100)
+
+
+def test_oversized_image_ends_up_within_the_page_image_limit(converter, tmp_path):
+    path = save(tmp_path, "huge.png", (6000, 3000))
+
+    result = converter.convert_file(str(path), 'image_to_pdf', str(tmp_path))
+
+    assert result['error'] is None
+    image = pypdf.PdfReader(result['output']).pages[0]['/Resources']['/XObject']['/Im0']
+    assert (image['/Width'], image['/Height']) == (2000, 1000)
@@ -0,0 +1,43 @@
+import pytest
+from PIL import Image, ImageChops, ImageEnhance, ImageStat
+
+from file_converter import ENHANCE_BRIGHTNESS, ENHANCE_CONTRAST, ENHANCE_SHARPNESS, FileConverter
+
+
+@pytest.fixture
+def converter(tmp_path, monkeypatch):
+    # FileConverter logs to converter.log in the working directory
+    monkeypatch.chdir(tmp_path)
+    return FileConverter()
+
+
+def noise_image(mode):
+    if mode == 'L':
+        return Image.effect_noise((120, 90), 40).convert('L')
+    return Image.merge('RGB', [Image.effect_noise((120, 90), sigma).convert('L') for sigma in (20, 40, 60)])
+
+
+def reference_enhance(img):
+    img = ImageEnhance.Sharpness(img).enhance(ENHANCE_SHARPNESS)
+    img = ImageEnhance.Contrast(img).enhance(ENHANCE_CONTRAST)
+    return ImageEnhance.Brightness(img).enhance(ENHANCE_BRIGHTNESS)
+
+
+@pytest.mark.parametrize('mode', ['L', 'RGB'])
+def test_fused_kernel_matches_the_imageenhance_chain(converter, mode):
+    img = noise_image(mode)
+    fused = converter._enhance_image_quality(img)
+    difference = ImageChops.difference(reference_enhance(img), fused)
+
+    assert fused.mode == mode and fused.size == img.size
+    # Rounding differs by at most a couple of levels, and rarely at all
+    extrema = difference.getextrema()
+    assert max(high for _, high in (extrema if mode == 'RGB' else [extrema])) <= 2
+    assert max(ImageStat.Stat(difference).mean) < 0.5
+
+
+def test_uniform_image_is_within_one_level_of_the_imageenhance_chain(converter):
+    img = Image.new('RGB', (20, 20), (100, 150, 200))
+    fused = converter._enhance_image_quality(img).getpixel((10, 10))
+    reference = reference_enhance(img).getpixel((10, 10))
+    assert all(abs(a - b) <= 1 for a, b in zip(fused, reference))
@@ -0,0 +1,114 @@
+import io
+from pathlib import Path
+
+import pypdf
+import pytest
+from PIL import Image
+
+from file_converter import FileConverter
+from image_pdf_writer import ImagePdfWriter, jpeg_params, png_embedding
+
+
+def encode(image, fmt, **options):
+    data = io.BytesIO()
+    image.save(data, format=fmt, **options)
+    return data.getvalue()
+
+
+def test_jpeg_bytes_are_embedded_unchanged():
+    jpeg = encode(Image.new('RGB', (64, 32), (200, 30, 30)), 'JPEG', quality=80)
+    output = io.BytesIO()
+    writer = ImagePdfWriter(output)
+    writer.add_image(jpeg, 64, 32, **jpeg_params('RGB'))
+    writer.close()
+
+    reader = pypdf.PdfReader(io.BytesIO(output.getvalue()))
+    assert len(reader.pages) == 1
+    image = reader.pages[0]['/Resources']['/XObject']['/Im0'].get_object()
+    assert image['/Filter'] == '/DCTDecode'
+    assert image.get_data() == jpeg
+
+
+@pytest.mark.parametrize('mode', ['L', 'RGB', 'P'])
+def test_png_idat_is_embedded_and_decodes_to_the_same_pixels(mode):
+    source = Image.new('RGB', (37, 23))
+    source.putdata([((x * 7) % 256, (y * 11) % 256, (x * y) % 256) for y in range(23) for x in range(37)])
+    source = source.convert(mode)
+    png = encode(source, 'PNG')
+
+    idat, width, height, params = png_embedding(png)
+    assert (width, height) == source.size
+
+    output = io.BytesIO()
+    writer = ImagePdfWriter(output)
+    writer.add_image(idat, width, height, **params)
+    writer.close()
+
+    reader = pypdf.PdfReader(io.BytesIO(output.getvalue()))
+    decoded = reader.pages[0].images[0].image
+    assert decoded.convert('RGB').tobytes() == source.convert('RGB').tobytes()
+
+
+def test_png_with_alpha_transparency_or_interlacing_is_not_passed_through():
+    assert png_embedding(encode(Image.new('RGBA', (8, 8)), 'PNG')) is None
+    assert png_embedding(encode(Image.new('P', (8, 8)), 'PNG', transparency=0)) is None
+    assert png_embedding(b'not a png') is None
+
+    # PIL cannot write Adam7 PNGs; set the IHDR interlace byte directly (the CRC is not checked)
+    png = bytearray(encode(Image.new('RGB', (8, 8)), 'PNG'))
+    png[28] = 1
+    assert png_embedding(bytes(png)) is None
+
+
+def test_pages_are_written_in_order():
+    output = io.BytesIO()
+    writer = ImagePdfWriter(output)
+    for size in ((10, 20), (30, 10), (5, 5)):
+        writer.add_image(encode(Image.new('L', size), 'JPEG'), *size, colorspace='/DeviceGray')
+    assert writer.page_count == 3
+    writer.close()
+
+    reader = pypdf.PdfReader(io.BytesIO(output.getvalue()))
+    sizes = [page['/Resources']['/XObject']['/Im0']['/Width'] for page in reader.pages]
+    assert sizes == [10, 30, 5]
+
+
+def test_empty_writer_cannot_be_closed():
+    with pytest.raises(ValueError):
+        ImagePdfWriter(io.BytesIO()).close()
+
+
+@pytest.fixture
+def converter(tmp_path, monkeypatch):
+    # FileConverter logs to converter.log in the working directory
+    monkeypatch.chdir(tmp_path)
+    return FileConverter()
+
+
+def test_multi_image_to_pdf_writes_one_page_per_image_without_scratch_files(converter, tmp_path):
+    images = tmp_path / "images"
+    images.mkdir()
+    paths = []
+    for i, size in enumerate(((40, 30), (30, 40), (50, 50))):
+        path = images / f"image{i}.png"
+        Image.new('RGB', size, (i * 80, 0, 0)).save(path)
+        paths.append(str(path))
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+
+    result = converter.convert_file(paths, 'multi_image_to_pdf', str(output_dir))
+
+    assert result['error'] is None
+    assert len(pypdf.PdfReader(result['output']).pages) == 3
+    assert [p.name for p in output_dir.iterdir()] == [Path(result['output']).name]
+    assert sorted(p.name for p in images.iterdir()) == ["image0.png", "image1.png", "image2.png"]
+
+
+def test_image_to_pdf_passes_jpeg_through(converter, tmp_path):
+    path = tmp_path / "photo.jpg"
+    Image.new('RGB', (64, 48), (10, 120, 200)).save(path, quality=90)
+
+    result = converter.convert_file(str(path), 'image_to_pdf', str(tmp_path))
+
+    image = pypdf.PdfReader(result['output']).pages[0]['/Resources']['/XObject']['/Im0'].get_object()
+    assert image.get_data() == path.read_bytes()
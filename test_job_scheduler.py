@@ -0,0 +1,133 @@
+import threading
+import time
+
+import pytest
+
+from cancellation import CancellationToken
+from job_scheduler import CANCELLED, DONE, FAILED, PRIORITY_BATCH, PRIORITY_INTERACTIVE, JobScheduler
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = JobScheduler(max_workers=1)
+    yield scheduler
+    scheduler.shutdown()
+
+
+@pytest.fixture
+def blocked(scheduler):
+    """Occupy the only worker until the returned event is set"""
+    release = threading.Event()
+    job = scheduler.submit(release.wait, description="blocker")
+    wait_until(lambda: scheduler.running())
+    yield release
+    release.set()
+    wait_until(lambda: job.is_finished)
+
+
+def test_interactive_jobs_run_before_batch_jobs(scheduler, blocked):
+    order = []
+    jobs = [
+        scheduler.submit(order.append, 'batch 1', priority=PRIORITY_BATCH),
+        scheduler.submit(order.append, 'batch 2', priority=PRIORITY_BATCH),
+        scheduler.submit(order.append, 'interactive', priority=PRIORITY_INTERACTIVE),
+    ]
+    assert [job.args[0] for job in scheduler.pending()] == ['interactive', 'batch 1', 'batch 2']
+
+    blocked.set()
+    wait_until(lambda: all(job.is_finished for job in jobs))
+    assert order == ['interactive', 'batch 1', 'batch 2']
+    assert all(job.status == DONE for job in jobs)
+
+
+def test_move_reorders_the_queue(scheduler, blocked):
+    first = scheduler.submit(lambda: None, priority=PRIORITY_BATCH)
+    second = scheduler.submit(lambda: None, priority=PRIORITY_BATCH)
+    assert scheduler.move(second.job_id, -1)
+    assert scheduler.pending() == [second, first]
+
+
+def test_cancel_queued_job(scheduler, blocked):
+    ran = []
+    job = scheduler.submit(ran.append, 'x', priority=PRIORITY_BATCH)
+    changes = []
+    scheduler.add_listener(changes.append)
+
+    assert scheduler.cancel(job.job_id)
+    assert job.status == CANCELLED
+    assert changes == [job]
+    assert scheduler.pending() == []
+
+    blocked.set()
+    time.sleep(0.1)
+    assert ran == []
+
+
+def test_cancel_running_job_through_its_token(scheduler):
+    started = threading.Event()
+
+    def work(cancel_token=None):
+        started.set()
+        while True:
+            cancel_token.raise_if_cancelled()
+            time.sleep(0.01)
+
+    job = scheduler.submit(work, cancel_token=CancellationToken())
+    started.wait(5)
+    assert scheduler.cancel(job.job_id)
+    wait_until(lambda: job.is_finished)
+    assert job.status == CANCELLED
+
+
+def test_running_job_without_token_cannot_be_cancelled(scheduler, blocked):
+    assert not scheduler.cancel(scheduler.running()[0].job_id)
+
+
+def test_failed_job_keeps_its_error(scheduler):
+    def fail():
+        raise ValueError("broken")
+
+    job = scheduler.submit(fail)
+    wait_until(lambda: job.is_finished)
+    assert job.status == FAILED
+    assert job.error == "broken"
+
+
+def test_shutdown_cancels_and_reports_queued_jobs():
+    scheduler = JobScheduler(max_workers=1)
+    release = threading.Event()
+    scheduler.submit(release.wait)
+    wait_until(lambda: scheduler.running())
+    queued = scheduler.submit(lambda: None, priority=PRIORITY_BATCH)
+    changes = []
+    scheduler.add_listener(changes.append)
+
+    scheduler.shutdown()
+    release.set()
+    assert queued.status == CANCELLED
+    assert changes == [queued]
+
+
+def test_shutdown_without_cancelling_runs_the_queued_jobs():
+    scheduler = JobScheduler(max_workers=1)
+    release = threading.Event()
+    scheduler.submit(release.wait)
+    wait_until(lambda: scheduler.running())
+    ran = []
+    queued = [scheduler.submit(ran.append, i, priority=PRIORITY_BATCH) for i in range(3)]
+
+    scheduler.shutdown(cancel_pending=False)
+    release.set()
+    wait_until(lambda: all(job.is_finished for job in queued))
+    assert ran == [0, 1, 2]
+    assert all(job.status == DONE for job in queued)
+    with pytest.raises(Exception):
+        scheduler.submit(lambda: None)
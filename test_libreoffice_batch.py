@@ -0,0 +1,88 @@
+import sys
+from pathlib import Path
+
+import docx
+import pytest
+
+import file_converter
+from file_converter import FileConverter, WordPdfMethods, _libreoffice_batches
+
+# Stands in for soffice --headless --convert-to pdf --outdir DIR FILE...; hangs on *hang* files
+FAKE_SOFFICE = """#!{python}
+import sys, time
+from pathlib import Path
+with open({log!r}, 'a') as log:
+    log.write(' '.join(Path(f).name for f in sys.argv[6:]) + '\\n')
+out = Path(sys.argv[5])
+for name in sys.argv[6:]:
+    if 'hang' in name:
+        time.sleep(30)
+    (out / (Path(name).stem + '.pdf')).write_bytes(b'%PDF-1.4 from soffice')
+"""
+
+
+def test_batches_keep_stems_apart_and_respect_the_size():
+    items = [(i, Path(name)) for i, name in enumerate(
+        ["a/report.docx", "b/report.doc", "notes.docx", "B/REPORT.docx", "plan.docx"]
+    )]
+    batches = _libreoffice_batches(items, 3)
+
+    assert [[i for i, _ in batch] for batch in batches] == [[0, 2, 4], [1], [3]]
+    for batch in batches:
+        stems = [path.stem.casefold() for _, path in batch]
+        assert len(stems) == len(set(stems))
+
+
+@pytest.fixture
+def soffice(tmp_path, monkeypatch):
+    log = tmp_path / "calls.log"
+    script = tmp_path / "soffice"
+    script.write_text(FAKE_SOFFICE.format(python=sys.executable, log=str(log)))
+    script.chmod(0o755)
+
+    methods = WordPdfMethods()
+    methods._available = ['libreoffice', 'reportlab']
+    methods._soffice = str(script)
+    monkeypatch.setattr(file_converter, 'word_pdf_methods', methods)
+    monkeypatch.setattr(file_converter, 'LIBREOFFICE_TIMEOUT', 1)
+    return log
+
+
+@pytest.fixture
+def documents(tmp_path):
+    paths = []
+    for name in ("first", "hang", "third"):
+        path = tmp_path / f"{name}.docx"
+        document = docx.Document()
+        document.add_paragraph(name)
+        document.save(path)
+        paths.append(str(path))
+    return paths
+
+
+def convert(tmp_path, monkeypatch, documents):
+    # FileConverter logs to converter.log in the working directory
+    monkeypatch.chdir(tmp_path)
+    out = tmp_path / "out"
+    out.mkdir()
+    return FileConverter().batch_convert(documents, 'word_to_pdf', str(out))
+
+
+def test_one_soffice_run_converts_the_batch(soffice, documents, tmp_path, monkeypatch):
+    documents = [documents[0], documents[2]]
+    results = convert(tmp_path, monkeypatch, documents)
+
+    assert [result['error'] for result in results] == [None, None]
+    assert all(Path(result['output']).read_bytes() == b'%PDF-1.4 from soffice' for result in results)
+    assert soffice.read_text().splitlines() == ["first.docx third.docx"]
+
+
+def test_documents_a_timed_out_run_missed_are_retried_with_libreoffice(soffice, documents, tmp_path, monkeypatch):
+    results = convert(tmp_path, monkeypatch, documents)
+
+    assert [result['error'] for result in results] == [None, None, None]
+    first, hang, third = (Path(result['output']).read_bytes() for result in results)
+    assert first == third == b'%PDF-1.4 from soffice'
+    # Only the document that also hangs on its own gets the reportlab layout
+    assert hang.startswith(b'%PDF') and hang != first
+    assert soffice.read_text().splitlines() == ["first.docx hang.docx third.docx", "hang.docx", "third.docx"]
@@ -0,0 +1,128 @@
+import shutil
+import threading
+import time
+
+import pytest
+
+import libreoffice_pool
+from cancellation import CancellationToken, ConversionCancelled
+from file_converter import FileConverter, word_pdf_methods
+
+
+class FakeWorker:
+    """Stands in for a LibreOffice instance; behaviour is set on the class"""
+
+    fail_start = False
+    job_seconds = 0.0
+
+    def __init__(self, soffice, index, startup_timeout=30):
+        self.index = index
+        self.alive = False
+
+    def start(self):
+        if FakeWorker.fail_start:
+            raise Exception("cannot start")
+        self.alive = True
+
+    def is_healthy(self):
+        return self.alive
+
+    def convert(self, input_path, output_path):
+        time.sleep(FakeWorker.job_seconds)
+        if self.alive:
+            shutil.copyfile(input_path, output_path)
+
+    def kill(self):
+        self.alive = False
+
+    stop = kill
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(FakeWorker, 'fail_start', False)
+    monkeypatch.setattr(FakeWorker, 'job_seconds', 0.0)
+    monkeypatch.setattr(libreoffice_pool, 'LibreOfficeWorker', FakeWorker)
+    monkeypatch.setattr(libreoffice_pool, 'uno_available', lambda: True)
+    pool = libreoffice_pool.LibreOfficePool(size=2, soffice='soffice', job_timeout=0.3)
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def document(tmp_path):
+    path = tmp_path / "doc.docx"
+    path.write_bytes(b"document")
+    return path
+
+
+def test_convert(pool, document, tmp_path):
+    assert pool.convert(document, tmp_path / "doc.pdf")
+    assert (tmp_path / "doc.pdf").read_bytes() == b"document"
+
+
+def test_timed_out_instance_is_replaced(pool, document, tmp_path):
+    FakeWorker.job_seconds = 1.0
+    workers = list(pool.workers)
+    with pytest.raises(Exception, match="timed out"):
+        pool.convert(document, tmp_path / "doc.pdf")
+    assert len(pool.workers) == 2
+    assert sum(worker in workers for worker in pool.workers) == 1
+
+
+def test_cancel_stops_a_running_job(pool, document, tmp_path):
+    FakeWorker.job_seconds = 5.0
+    token = CancellationToken()
+    threading.Timer(0.1, token.cancel).start()
+    start = time.monotonic()
+    with pytest.raises(ConversionCancelled):
+        pool.convert(document, tmp_path / "doc.pdf", timeout=10, cancel_token=token)
+    assert time.monotonic() - start < 2
+
+
+def test_instances_that_cannot_restart_are_dropped(pool, document, tmp_path):
+    FakeWorker.job_seconds = 1.0
+    FakeWorker.fail_start = True
+    for remaining in (1, 0):
+        with pytest.raises(Exception, match="timed out"):
+            pool.convert(document, tmp_path / "doc.pdf")
+        assert len(pool.workers) == remaining
+    with pytest.raises(Exception, match="No LibreOffice instances left"):
+        pool.convert(document, tmp_path / "doc.pdf")
+
+
+class FakePool:
+    size = 2
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def convert(self, input_path, output_path, timeout=None, cancel_token=None):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.2)
+        shutil.copyfile(input_path, output_path)
+        with self.lock:
+            self.active -= 1
+        return True
+
+
+def test_batch_word_to_pdf_uses_several_pool_instances(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(word_pdf_methods, 'methods_for', lambda suffix: ['libreoffice'])
+    files = []
+    for name in "abcd":
+        path = tmp_path / f"{name}.docx"
+        path.write_bytes(name.encode())
+        files.append(str(path))
+
+    converter = FileConverter()
+    converter.libreoffice_pool = FakePool()
+    results = converter.batch_convert(files, 'word_to_pdf', str(tmp_path), workers=4)
+
+    assert [result['error'] for result in results] == [None] * 4
+    assert converter.libreoffice_pool.peak == 2
@@ -0,0 +1,86 @@
+import pytest
+from PIL import Image
+
+import memory_accounting
+from conversion_metrics import ConversionMetrics
+from file_converter import FileConverter, _peak_rss_bytes
+from memory_accounting import MemoryAccounting, begin_peak_rss, current_rss_bytes, end_peak_rss
+
+MB = 1024 * 1024
+
+needs_proc = pytest.mark.skipif(current_rss_bytes() is None, reason="needs /proc/self/status")
+
+
+@pytest.fixture
+def accounting():
+    accounting = MemoryAccounting(top=5)
+    accounting.start()
+    yield accounting
+    accounting.stop()
+
+
+@needs_proc
+def test_peak_rss_covers_memory_released_before_the_end():
+    mark = begin_peak_rss()
+    if mark is None:
+        pytest.skip("peak RSS cannot be reset here")
+    start = current_rss_bytes()
+    block = bytearray(64 * MB)
+    del block
+    assert end_peak_rss(mark) >= start + 60 * MB
+
+
+@needs_proc
+def test_nested_peak_rss_measurements():
+    outer = begin_peak_rss()
+    if outer is None:
+        pytest.skip("peak RSS cannot be reset here")
+    block = bytearray(64 * MB)
+    del block
+    inner = begin_peak_rss()
+    inner_peak = end_peak_rss(inner)
+    outer_peak = end_peak_rss(outer)
+
+    # The inner measurement started after the block was freed
+    assert outer_peak >= inner_peak + 60 * MB
+    assert memory_accounting._open_peaks == []
+
+
+@needs_proc
+def test_lifetime_peak_comes_from_proc_status():
+    assert _peak_rss_bytes() == memory_accounting._proc_status_bytes('VmHWM')
+
+
+def test_spans_carry_memory_high_water_marks(accounting):
+    metrics = ConversionMetrics()
+    metrics.memory = accounting
+    with metrics.span('pdf_to_word') as span:
+        metrics.stage('parse')
+        kept = [bytes(1000) for _ in range(2000)]
+        metrics.stage('write')
+
+    assert span.memory['python_peak'] >= 2000 * 1000
+    assert span.stage_memory['parse']['python_peak'] >= 2000 * 1000
+    assert span.memory['top_allocations'][0]['size_diff'] > 0
+    assert 'top_allocations' not in span.stage_memory['parse']
+    if current_rss_bytes() is not None:
+        assert 'rss_peak' in span.memory or 'rss_process_peak' in span.memory
+    del kept
+
+
+def test_convert_file_reports_memory_when_tracking(tmp_path, monkeypatch):
+    # FileConverter logs to converter.log in the working directory
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "image.png"
+    Image.new('RGB', (400, 300), 'green').save(path)
+
+    converter = FileConverter()
+    converter.enable_memory_tracking(top=3)
+    try:
+        result = converter.convert_file(str(path), 'image_to_pdf', str(tmp_path))
+    finally:
+        converter.disable_memory_tracking()
+
+    assert result['error'] is None
+    assert result['memory']['python_peak'] > 0
+    assert result['memory']['stages']['decode']['python_peak'] >= 0
@@ -0,0 +1,103 @@
+import os
+
+import pytest
+from PIL import Image
+
+from file_converter import FileConverter
+from metadata_cache import MetadataCache
+
+
+class CountingLoader:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path, stat):
+        self.calls += 1
+        return {'size': stat.st_size, 'call': self.calls}
+
+
+@pytest.fixture
+def document(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("first")
+    return path
+
+
+def test_unchanged_file_is_loaded_once(document):
+    cache = MetadataCache()
+    loader = CountingLoader()
+    assert cache.get(str(document), loader) == {'size': 5, 'call': 1}
+    assert cache.get(str(document), loader) == {'size': 5, 'call': 1}
+    assert (cache.hits, cache.misses, loader.calls) == (1, 1, 1)
+
+
+def test_size_change_reloads(document):
+    cache = MetadataCache()
+    loader = CountingLoader()
+    cache.get(str(document), loader)
+    document.write_text("second version")
+    assert cache.get(str(document), loader) == {'size': 14, 'call': 2}
+
+
+def test_mtime_change_reloads(document):
+    cache = MetadataCache()
+    loader = CountingLoader()
+    cache.get(str(document), loader)
+    stat = document.stat()
+    os.utime(document, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.get(str(document), loader)['call'] == 2
+
+
+def test_paths_are_resolved(document, tmp_path):
+    cache = MetadataCache()
+    loader = CountingLoader()
+    link = tmp_path / "link.txt"
+    link.symlink_to(document)
+    cache.get(str(document), loader)
+    cache.get(str(link), loader)
+    assert loader.calls == 1 and len(cache) == 1
+
+
+def test_invalidate_and_lru_eviction(tmp_path):
+    cache = MetadataCache(max_entries=2)
+    loader = CountingLoader()
+    paths = []
+    for name in "abc":
+        path = tmp_path / name
+        path.write_text(name)
+        paths.append(str(path))
+
+    cache.get(paths[0], loader)
+    cache.get(paths[1], loader)
+    cache.get(paths[0], loader)
+    cache.get(paths[2], loader)  # evicts b, the least recently used
+    assert len(cache) == 2
+    cache.get(paths[0], loader)
+    assert loader.calls == 3
+    cache.get(paths[1], loader)
+    assert loader.calls == 4
+
+    cache.invalidate(paths[1])
+    cache.get(paths[1], loader)
+    assert loader.calls == 5
+
+
+def test_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        MetadataCache().get(str(tmp_path / "gone"), CountingLoader())
+
+
+def test_get_file_info_returns_a_copy_of_the_cached_info(tmp_path, monkeypatch):
+    # FileConverter logs to converter.log in the working directory
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "image.png"
+    Image.new('RGB', (64, 48), 'white').save(path)
+
+    converter = FileConverter()
+    info = converter.get_file_info(str(path))
+    info['size'] = -1
+    again = converter.get_file_info(str(path))
+
+    assert again['size'] == path.stat().st_size
+    assert again['dimensions'] == "64 x 48"
+    assert converter.metadata_cache.hits == 1
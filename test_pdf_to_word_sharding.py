@@ -0,0 +1,65 @@
+import json
+import logging
+
+import docx
+import pytest
+from reportlab.pdfgen import canvas
+
+import converter_cli
+from file_converter import FileConverter
+
+PAGES = 12
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    path = tmp_path / "long.pdf"
+    document = canvas.Canvas(str(path))
+    for page in range(PAGES):
+        document.drawString(72, 720, f"Page marker {page + 1}")
+        document.showPage()
+    document.save()
+    return path
+
+
+@pytest.fixture
+def converter(tmp_path, monkeypatch):
+    # FileConverter logs to converter.log in the working directory
+    monkeypatch.chdir(tmp_path)
+    return FileConverter()
+
+
+def page_markers(path):
+    return [p.text for p in docx.Document(path).paragraphs if p.text.startswith("Page marker")]
+
+
+def test_sharded_output_matches_a_whole_file_conversion(converter, pdf, tmp_path, caplog):
+    (tmp_path / "whole").mkdir()
+    (tmp_path / "sharded").mkdir()
+
+    whole = converter.convert_file(str(pdf), 'pdf_to_word', str(tmp_path / "whole"))
+    with caplog.at_level(logging.INFO):
+        sharded = converter.convert_file(
+            str(pdf), 'pdf_to_word', str(tmp_path / "sharded"), workers=2, pages_per_shard=4
+        )
+
+    assert whole['error'] is None and sharded['error'] is None
+    assert f"Parsing {PAGES} pages in 3 shards" in caplog.text
+    expected = [f"Page marker {page + 1}" for page in range(PAGES)]
+    assert page_markers(whole['output']) == expected
+    assert page_markers(sharded['output']) == expected
+
+
+def test_cli_passes_shard_options(pdf, tmp_path, monkeypatch, caplog):
+    monkeypatch.chdir(tmp_path)
+    results = tmp_path / "results.jsonl"
+    with caplog.at_level(logging.INFO):
+        code = converter_cli.main([
+            'pdf_to_word', str(pdf), '-o', str(tmp_path / "out"), '--jsonl', str(results), '-q',
+            '--shard-workers', '2', '--pages-per-shard', '6',
+        ])
+
+    assert code == 0
+    assert f"Parsing {PAGES} pages in 2 shards" in caplog.text
+    result = json.loads(results.read_text())
+    assert page_markers(result['output'])[-1] == f"Page marker {PAGES}"
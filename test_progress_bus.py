@@ -0,0 +1,79 @@
+import time
+
+from progress_bus import ProgressBus, ProgressStream, throttle
+
+
+def test_stream_rate_limits_and_keeps_the_latest_update():
+    events = []
+    stream = ProgressStream(events.append, stream_id=1, max_rate=10)
+    for percentage in range(1, 51):
+        stream(percentage, f"step {percentage}")
+
+    # Only the first update goes out inside one rate-limit interval
+    assert [event.percentage for event in events] == [1]
+
+    stream.flush()
+    assert [event.percentage for event in events] == [1, 50]
+    assert events[-1].message == "step 50"
+
+
+def test_completion_is_never_held_back():
+    events = []
+    stream = ProgressStream(events.append, max_rate=1)
+    stream(10)
+    stream(100, "done")
+    assert [event.percentage for event in events] == [10, 100]
+
+
+def test_close_delivers_the_pending_update_and_ignores_later_ones():
+    events = []
+    stream = ProgressStream(events.append, max_rate=1)
+    stream(10)
+    stream(20)
+    stream.close()
+    stream(30)
+    assert [(event.percentage, event.final) for event in events] == [(10, False), (20, True)]
+    assert stream.closed
+
+
+def test_drain_returns_one_event_per_stream():
+    bus = ProgressBus(max_rate=1000)
+    first = bus.stream()
+    second = bus.stream()
+    for percentage in range(1, 10):
+        first(percentage)
+        time.sleep(0.002)
+    second(42)
+
+    events = {event.stream_id: event.percentage for event in bus.drain()}
+    assert events == {first.stream_id: 9, second.stream_id: 42}
+    assert bus.drain() == []
+
+
+def test_drain_flushes_held_back_updates_once_their_slot_passes():
+    bus = ProgressBus(max_rate=20)
+    stream = bus.stream()
+    stream(1)
+    stream(2)
+    assert [event.percentage for event in bus.drain()] == [1]
+
+    time.sleep(0.06)
+    assert [event.percentage for event in bus.drain()] == [2]
+
+
+def test_closed_streams_are_released():
+    bus = ProgressBus()
+    streams = [bus.stream() for _ in range(5)]
+    for stream in streams:
+        stream.close()
+    bus.drain()
+    assert bus._streams == {}
+
+
+def test_throttle_wraps_a_plain_callback():
+    calls = []
+    progress = throttle(lambda percentage, message: calls.append((percentage, message)), max_rate=1)
+    progress(5, "a")
+    progress(6, "b")
+    progress.close()
+    assert calls == [(5, "a"), (6, "b")]
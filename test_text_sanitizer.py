@@ -0,0 +1,32 @@
+from text_sanitizer import escape_markup, sanitize_text
+
+
+def test_clean_ascii_is_returned_unchanged():
+    text = "Quarterly report, page 3"
+    assert sanitize_text(text) is text
+
+
+def test_empty_and_none_give_empty_string():
+    assert sanitize_text("") == ""
+    assert sanitize_text(None) == ""
+
+
+def test_control_characters_are_dropped():
+    assert sanitize_text("a\x00b\x07c\x1f") == "abc"
+
+
+def test_whitespace_runs_are_collapsed():
+    assert sanitize_text("  one \t two\n\nthree  ") == "one two three"
+
+
+def test_lone_surrogates_are_dropped():
+    assert sanitize_text("café \ud800ok") == "café ok"
+
+
+def test_result_is_utf8_encodable():
+    sanitize_text("x\udfff\x01y ü").encode('utf-8')
+
+
+def test_escape_markup():
+    assert escape_markup("a < b & c > d") == "a &lt; b &amp; c &gt; d"
+    assert escape_markup("plain") == "plain"
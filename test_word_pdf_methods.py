@@ -0,0 +1,78 @@
+import docx
+import pytest
+
+import file_converter
+from file_converter import FileConverter, WordPdfMethods
+
+
+@pytest.fixture
+def methods(monkeypatch):
+    methods = WordPdfMethods()
+    methods._available = ['libreoffice', 'reportlab']
+    monkeypatch.setattr(file_converter, 'word_pdf_methods', methods)
+    return methods
+
+
+@pytest.fixture
+def converter(tmp_path, monkeypatch):
+    # FileConverter logs to converter.log in the working directory
+    monkeypatch.chdir(tmp_path)
+    # LibreOffice fails on everything; reportlab succeeds where the document is readable
+    monkeypatch.setattr(FileConverter, '_word_to_pdf_libreoffice', lambda self, *args: False)
+    return FileConverter()
+
+
+def good_document(tmp_path, name):
+    path = tmp_path / name
+    document = docx.Document()
+    document.add_paragraph("Hello")
+    document.save(path)
+    return str(path)
+
+
+def bad_document(tmp_path, name):
+    path = tmp_path / name
+    path.write_bytes(b"not a zip file")
+    return str(path)
+
+
+def test_method_is_skipped_after_repeated_failures(methods):
+    for _ in range(WordPdfMethods.MAX_FAILURES - 1):
+        methods.record('libreoffice', '.DOC', False)
+    assert methods.methods_for('.doc') == ['libreoffice', 'reportlab']
+    methods.record('libreoffice', '.doc', False)
+    assert methods.methods_for('.doc') == ['reportlab']
+    assert methods.methods_for('.docx') == ['libreoffice', 'reportlab']
+
+    methods.record('libreoffice', '.doc', True)
+    assert methods.methods_for('.doc') == ['libreoffice', 'reportlab']
+
+
+def test_skipped_method_is_retried_after_a_while(methods, monkeypatch):
+    for _ in range(WordPdfMethods.MAX_FAILURES):
+        methods.record('libreoffice', '.doc', False)
+    assert methods.methods_for('.doc') == ['reportlab']
+
+    monkeypatch.setattr(WordPdfMethods, 'RETRY_AFTER', 0)
+    assert methods.methods_for('.doc') == ['libreoffice', 'reportlab']
+
+    # Failing again (while another method works) skips it for another period
+    monkeypatch.setattr(WordPdfMethods, 'RETRY_AFTER', 600)
+    methods.record('libreoffice', '.doc', False)
+    assert methods.methods_for('.doc') == ['reportlab']
+
+
+def test_unconvertible_documents_do_not_count_against_methods(methods, converter, tmp_path):
+    for i in range(WordPdfMethods.MAX_FAILURES + 1):
+        result = converter.convert_file(bad_document(tmp_path, f"bad{i}.docx"), 'word_to_pdf', str(tmp_path))
+        assert "All conversion methods failed" in result['error']
+
+    assert methods.methods_for('.docx') == ['libreoffice', 'reportlab']
+
+
+def test_failure_counts_when_a_later_method_converts_the_document(methods, converter, tmp_path):
+    for i in range(WordPdfMethods.MAX_FAILURES):
+        result = converter.convert_file(good_document(tmp_path, f"good{i}.docx"), 'word_to_pdf', str(tmp_path))
+        assert result['error'] is None
+
+    assert methods.methods_for('.docx') == ['reportlab']
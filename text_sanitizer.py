@@ -0,0 +1,34 @@
+import re
+
+# C0 control characters that are not valid in XML 1.0 (tab, newline and carriage return are kept)
+_CONTROL_CHARS = dict.fromkeys(c for c in range(0x20) if c not in (0x09, 0x0A, 0x0D))
+
+# Lone surrogates cannot be encoded as UTF-8
+_SURROGATES = re.compile('[\ud800-\udfff]')
+
+_MARKUP_ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+
+def sanitize_text(text):
+    """Drop control characters and lone surrogates and collapse whitespace runs
+
+    Used for text copied between documents: the result is safe for
+    python-docx, python-pptx and reportlab. Clean ASCII text, the common
+    case, is returned unchanged after a few C-level checks.
+    """
+    if not text:
+        return ""
+    if text.isascii():
+        # Printable ASCII has no controls and no whitespace but spaces
+        if text.isprintable() and '  ' not in text and text[0] != ' ' and text[-1] != ' ':
+            return text
+    elif _SURROGATES.search(text):
+        text = _SURROGATES.sub('', text)
+    return ' '.join(text.translate(_CONTROL_CHARS).split())
+
+
+def escape_markup(text):
+    """Escape text for reportlab's Paragraph, which parses it as markup"""
+    if '&' not in text and '<' not in text and '>' not in text:
+        return text
+    return text.translate(_MARKUP_ESCAPES)